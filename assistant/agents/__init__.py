@@ -3,39 +3,84 @@ OmniJARVIS Agent Registry — Central import point for all agents.
 
 Provides the :data:`AGENT_REGISTRY` mapping agent names to their
 classes, and convenience imports for every agent shipped with the system.
+
+Agent modules are imported lazily (PEP 562): importing this package only
+loads :class:`BaseAgent` and :class:`AgentResult`, and each agent module
+is loaded the first time its class is accessed.
 """
 
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
 from assistant.agents.base_agent import BaseAgent, AgentResult
-from assistant.agents.focus_agent import FocusAgent
-from assistant.agents.executive_agent import ExecutiveAgent
-from assistant.agents.memory_agent import MemoryAgent
-from assistant.agents.analysis_agent import AnalysisAgent
-from assistant.agents.system_agent import SystemAgent
-from assistant.agents.documentation_agent import DocumentationAgent
-from assistant.agents.code_agent import CodeAgent
-from assistant.agents.communication_agent import CommunicationAgent
-from assistant.agents.cloud_agent import CloudAgent
-from assistant.agents.vision_agent import VisionAgent
-from assistant.agents.mobility_agent import MobilityAgent
-from assistant.agents.productivity_agent import ProductivityAgent
-from assistant.agents.security_agent import SecurityAgent
-
-AGENT_REGISTRY = {
-    "executive": ExecutiveAgent,
-    "memory": MemoryAgent,
-    "analysis": AnalysisAgent,
-    "system": SystemAgent,
-    "documentation": DocumentationAgent,
-    "code": CodeAgent,
-    "communication": CommunicationAgent,
-    "cloud": CloudAgent,
-    "vision": VisionAgent,
-    "mobility": MobilityAgent,
-    "productivity": ProductivityAgent,
-    "security": SecurityAgent,
-    "focus": FocusAgent,
+
+# Agent name → (module path, class name)
+_AGENT_MODULE_MAP: Dict[str, Tuple[str, str]] = {
+    "executive": ("assistant.agents.executive_agent", "ExecutiveAgent"),
+    "memory": ("assistant.agents.memory_agent", "MemoryAgent"),
+    "analysis": ("assistant.agents.analysis_agent", "AnalysisAgent"),
+    "system": ("assistant.agents.system_agent", "SystemAgent"),
+    "documentation": ("assistant.agents.documentation_agent", "DocumentationAgent"),
+    "code": ("assistant.agents.code_agent", "CodeAgent"),
+    "communication": ("assistant.agents.communication_agent", "CommunicationAgent"),
+    "cloud": ("assistant.agents.cloud_agent", "CloudAgent"),
+    "vision": ("assistant.agents.vision_agent", "VisionAgent"),
+    "mobility": ("assistant.agents.mobility_agent", "MobilityAgent"),
+    "productivity": ("assistant.agents.productivity_agent", "ProductivityAgent"),
+    "security": ("assistant.agents.security_agent", "SecurityAgent"),
+    "focus": ("assistant.agents.focus_agent", "FocusAgent"),
+}
+
+# Class name → (module path, class name), for attribute access on the package.
+_CLASS_MODULE_MAP: Dict[str, Tuple[str, str]] = {
+    cls_name: (module, cls_name) for module, cls_name in _AGENT_MODULE_MAP.values()
 }
 
+
+def _load(module: str, cls_name: str) -> Any:
+    return getattr(importlib.import_module(module), cls_name)
+
+
+class _LazyAgentRegistry(Mapping):
+    """Read-only mapping of agent name → class that imports on first access."""
+
+    def __init__(self) -> None:
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        cls = self._loaded.get(name)
+        if cls is None:
+            module, cls_name = _AGENT_MODULE_MAP[name]
+            cls = self._loaded[name] = _load(module, cls_name)
+        return cls
+
+    def __contains__(self, name: object) -> bool:
+        return name in _AGENT_MODULE_MAP
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_AGENT_MODULE_MAP)
+
+    def __len__(self) -> int:
+        return len(_AGENT_MODULE_MAP)
+
+    def __repr__(self) -> str:
+        return f"AGENT_REGISTRY({list(_AGENT_MODULE_MAP)})"
+
+
+AGENT_REGISTRY = _LazyAgentRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CLASS_MODULE_MAP:
+        value = _load(*_CLASS_MODULE_MAP[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseAgent",
     "AgentResult",
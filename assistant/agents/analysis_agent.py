@@ -7,17 +7,35 @@ using AI when available, with deterministic fallbacks for offline use.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from assistant.agents.base_agent import BaseAgent, AgentResult
 
+# Maximum number of characters of a file or text sent in a single prompt.
+_MAX_PROMPT_CHARS = 8000
+
+# Maximum number of analyses of a ``batch`` request run concurrently.
+_BATCH_WORKERS = 4
+
+
+def _read_prefix(path: Path, max_chars: int = _MAX_PROMPT_CHARS) -> str:
+    """Return at most *max_chars* characters from the start of *path*.
+
+    Only ``4 * max_chars`` bytes (the UTF-8 upper bound) are read, so the
+    cost does not depend on the size of the file.
+    """
+    with path.open("rb") as fh:
+        raw = fh.read(max_chars * 4)
+    return raw.decode("utf-8", errors="ignore")[:max_chars]
+
 
 class AnalysisAgent(BaseAgent):
     """Agent that analyses content and produces structured insights.
 
     Actions: ``analyze_text``, ``analyze_file``, ``analyze_code``,
-    ``compare``, ``extract_patterns``.
+    ``compare``, ``extract_patterns``, ``batch``.
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -36,22 +54,33 @@ class AnalysisAgent(BaseAgent):
     # BaseAgent interface
     # ------------------------------------------------------------------
 
+    # Resolved ``ask_ai`` callable: ``None`` until first use, ``False`` if
+    # the AI client could not be imported.
+    _ask_ai: Union[Callable[[str], str], bool, None] = None
+
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["AnalysisAgent", Dict[str, Any]], AgentResult]] = {
+        "analyze_text": lambda self, kw: self._analyze_text(kw.get("message", "")),
+        "analyze_file": lambda self, kw: self._analyze_file(kw.get("file_path", "")),
+        "analyze_code": lambda self, kw: self._analyze_code(
+            kw.get("file_path"), kw.get("code")
+        ),
+        "compare": lambda self, kw: self._compare(
+            kw.get("text_a", ""), kw.get("text_b", "")
+        ),
+        "extract_patterns": lambda self, kw: self._extract_patterns(
+            kw.get("text", kw.get("message", ""))
+        ),
+        "batch": lambda self, kw: self._batch(kw.get("requests", [])),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         action = kwargs.get("action")
         message = kwargs.get("message", "")
 
-        if action == "analyze_text" or (not action and message):
-            return self._analyze_text(message)
-        if action == "analyze_file":
-            return self._analyze_file(kwargs.get("file_path", ""))
-        if action == "analyze_code":
-            return self._analyze_code(
-                kwargs.get("file_path"), kwargs.get("code")
-            )
-        if action == "compare":
-            return self._compare(kwargs.get("text_a", ""), kwargs.get("text_b", ""))
-        if action == "extract_patterns":
-            return self._extract_patterns(kwargs.get("text", message))
+        handler = self._HANDLERS.get(action) if action else None
+        if handler is not None:
+            return handler(self, kwargs)
 
         if message:
             return self._analyze_text(message)
@@ -59,7 +88,7 @@ class AnalysisAgent(BaseAgent):
         return AgentResult(
             agent_name=self.name,
             status="error",
-            message="No action or message. Use: analyze_text, analyze_file, analyze_code, compare, extract_patterns.",
+            message="No action or message. Use: analyze_text, analyze_file, analyze_code, compare, extract_patterns, batch.",
         )
 
     # ------------------------------------------------------------------
@@ -97,10 +126,10 @@ class AnalysisAgent(BaseAgent):
                 agent_name=self.name, status="error",
                 message=f"File not found: {file_path}",
             )
-        content = path.read_text(encoding="utf-8")
+        content = _read_prefix(path)
         analysis = self._ai_analyze(
             f"Analyze this file ({path.name}) and provide a structured "
-            f"summary with key findings:\n\n{content[:8000]}"
+            f"summary with key findings:\n\n{content}"
         )
         return AgentResult(
             agent_name=self.name, status="success",
@@ -108,7 +137,8 @@ class AnalysisAgent(BaseAgent):
             data={
                 "analysis": analysis,
                 "file_path": str(path),
-                "file_size": len(content),
+                "file_size": path.stat().st_size,
+                "analyzed_chars": len(content),
             },
             actions_taken=["read_file", "analyze_content"],
         )
@@ -125,9 +155,9 @@ class AnalysisAgent(BaseAgent):
                     agent_name=self.name, status="error",
                     message=f"File not found: {file_path}",
                 )
-            source = path.read_text(encoding="utf-8")
+            source = _read_prefix(path)
         elif code:
-            source = code
+            source = code[:_MAX_PROMPT_CHARS]
         else:
             return AgentResult(
                 agent_name=self.name, status="error",
@@ -137,7 +167,7 @@ class AnalysisAgent(BaseAgent):
         analysis = self._ai_analyze(
             "Perform a deep code analysis. Cover: architecture, "
             "quality, potential bugs, security, performance, and "
-            f"improvement suggestions:\n\n{source[:8000]}"
+            f"improvement suggestions:\n\n{source}"
         )
         return AgentResult(
             agent_name=self.name, status="success",
@@ -175,7 +205,7 @@ class AnalysisAgent(BaseAgent):
             )
         analysis = self._ai_analyze(
             f"Extract recurring patterns, themes, and key data points "
-            f"from the following text:\n\n{text[:8000]}"
+            f"from the following text:\n\n{text[:_MAX_PROMPT_CHARS]}"
         )
         return AgentResult(
             agent_name=self.name, status="success",
@@ -184,14 +214,54 @@ class AnalysisAgent(BaseAgent):
             actions_taken=["extract_patterns"],
         )
 
+    def _batch(self, requests: List[Dict[str, Any]]) -> AgentResult:
+        """Run several analysis requests concurrently.
+
+        Each item is a kwargs dict for :meth:`execute` (for example
+        ``{"action": "compare", "text_a": ..., "text_b": ...}``).  The AI
+        calls are network-bound, so running them on a thread pool costs
+        roughly one round-trip instead of one per request.
+        """
+        if not requests:
+            return AgentResult(
+                agent_name=self.name, status="error",
+                message="'requests' must be a non-empty list.",
+            )
+        if any(req.get("action") == "batch" for req in requests):
+            return AgentResult(
+                agent_name=self.name, status="error",
+                message="Nested batch requests are not supported.",
+            )
+
+        workers = min(_BATCH_WORKERS, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda req: self.execute(**req), requests))
+
+        failed = sum(1 for r in results if r.status != "success")
+        return AgentResult(
+            agent_name=self.name,
+            status="success" if not failed else "error",
+            message=f"Batch complete: {len(results) - failed}/{len(results)} analyses succeeded.",
+            data={"results": [r.to_dict() for r in results]},
+            actions_taken=["batch"],
+        )
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def _ai_analyze(self, prompt: str) -> str:
         """Call AI with graceful fallback."""
-        try:
-            from assistant.ai.client import ask_ai
-            return ask_ai(prompt)
-        except Exception:
-            return f"[Offline analysis] Input received ({len(prompt)} chars). Connect AI for deeper insights."
+        ask_ai = AnalysisAgent._ask_ai
+        if ask_ai is None:
+            try:
+                from assistant.ai.client import ask_ai
+            except Exception:
+                ask_ai = False
+            AnalysisAgent._ask_ai = ask_ai
+        if ask_ai:
+            try:
+                return ask_ai(prompt)
+            except Exception:
+                pass
+        return f"[Offline analysis] Input received ({len(prompt)} chars). Connect AI for deeper insights."
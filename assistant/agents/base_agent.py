@@ -8,20 +8,102 @@ that the orchestrator can treat all agents identically.
 
 from __future__ import annotations
 
+import os
+import reprlib
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from assistant.learning import LearningEngine
 from assistant.permissions import PermissionManager
 
 
+# ---------------------------------------------------------------------------
+# Timestamps
+# ---------------------------------------------------------------------------
+
+# (epoch milliseconds, formatted ISO string) of the last call to iso_now().
+_LAST_ISO: Tuple[int, str] = (-1, "")
+
+
+def iso_now() -> str:
+    """Return the current UTC time as an ISO-8601 string.
+
+    The formatted value is reused while the clock stays within the same
+    millisecond, so building many results in a burst formats only once.
+    """
+    global _LAST_ISO
+    ns = time.time_ns()
+    ms = ns // 1_000_000
+    last_ms, last_iso = _LAST_ISO
+    if ms == last_ms:
+        return last_iso
+    iso = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+    _LAST_ISO = (ms, iso)
+    return iso
+
+
+# strftime format → (epoch second, formatted string) of its last use.
+_LAST_STAMPS: Dict[str, Tuple[int, str]] = {}
+
+
+def utc_strftime(fmt: str) -> str:
+    """Return the current UTC time formatted with *fmt*.
+
+    Each format is rendered at most once per second, so *fmt* must not
+    contain sub-second fields.
+
+    :param fmt: :func:`time.strftime` format, e.g. ``"%Y-%m-%d"``.
+    """
+    now = int(time.time())
+    last = _LAST_STAMPS.get(fmt)
+    if last is not None and last[0] == now:
+        return last[1]
+    text = time.strftime(fmt, time.gmtime(now))
+    _LAST_STAMPS[fmt] = (now, text)
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Output directories
+# ---------------------------------------------------------------------------
+
+# Absolute paths of directories already created by ensure_dir().
+_ENSURED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create *path* (and its parents) once per process.
+
+    Later calls for the same directory skip the ``mkdir`` syscall.  Call
+    ``_ENSURED_DIRS.clear()`` if directories may be removed at runtime.
+
+    :param path: Directory to create.
+    """
+    key = os.path.abspath(path)
+    if key not in _ENSURED_DIRS:
+        Path(key).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
+# Bounded repr used to log agent kwargs: large payloads (e.g. ``code=``) are
+# abbreviated so the cost does not grow with the argument size.
+_QUERY_REPR = reprlib.Repr()
+_QUERY_REPR.maxlevel = 2
+_QUERY_REPR.maxdict = 8
+_QUERY_REPR.maxlist = 8
+_QUERY_REPR.maxstring = 200
+_QUERY_REPR.maxother = 200
+
+
 # ---------------------------------------------------------------------------
 # Result dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Uniform result returned by every agent invocation.
 
@@ -31,6 +113,7 @@ class AgentResult:
     :param message: Human-readable description of the outcome.
     :param data: Optional payload with structured result data.
     :param actions_taken: Log of discrete actions performed during execution.
+        Constant tuples may be passed; :meth:`to_dict` always returns a list.
     :param timestamp: ISO-8601 UTC timestamp of when the result was created.
     """
 
@@ -38,14 +121,23 @@ class AgentResult:
     status: str
     message: str
     data: Optional[Dict[str, Any]] = None
-    actions_taken: List[str] = field(default_factory=list)
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    actions_taken: Sequence[str] = field(default_factory=list)
+    timestamp: str = field(default_factory=iso_now)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize the result to a plain dictionary."""
-        return asdict(self)
+        """Serialize the result to a plain dictionary.
+
+        This is a shallow copy: ``data`` is returned by reference rather
+        than deep-copied, so large payloads are not walked on every call.
+        """
+        return {
+            "agent_name": self.agent_name,
+            "status": self.status,
+            "message": self.message,
+            "data": self.data,
+            "actions_taken": list(self.actions_taken),
+            "timestamp": self.timestamp,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -77,8 +169,20 @@ class BaseAgent(ABC):
             learning_engine=le,
         )
         result = agent.run(query="hello")
+
+    Declares ``__slots__``; subclasses that add their own ``__slots__``
+    drop the per-instance ``__dict__``, the others keep it.
     """
 
+    __slots__ = (
+        "_name",
+        "_description",
+        "_required_permissions",
+        "_permission_manager",
+        "_learning_engine",
+        "_perm_ok_epoch",
+    )
+
     def __init__(
         self,
         name: str,
@@ -103,6 +207,9 @@ class BaseAgent(ABC):
         self._required_permissions: List[str] = required_permissions or []
         self._permission_manager = permission_manager
         self._learning_engine = learning_engine
+        # Permission-manager epoch at which all required permissions were
+        # last confirmed as granted (-1: never).
+        self._perm_ok_epoch: int = -1
 
     # ------------------------------------------------------------------
     # Properties
@@ -126,7 +233,9 @@ class BaseAgent(ABC):
         """Execute the agent with permission checks and interaction logging.
 
         1. Verify that every required permission is granted (when a
-           :class:`PermissionManager` is available).
+           :class:`PermissionManager` is available).  A successful check
+           is cached until the manager's :attr:`~PermissionManager.epoch`
+           changes.
         2. Delegate to :meth:`execute` for the actual work.
         3. Record the interaction via the :class:`LearningEngine` (when
            available).
@@ -134,13 +243,16 @@ class BaseAgent(ABC):
         :return: An :class:`AgentResult` describing the outcome.
         """
         # -- Step 1: permission check ----------------------------------
-        if self._permission_manager and self._required_permissions:
-            missing = [
-                perm
-                for perm in self._required_permissions
-                if not self._permission_manager.check_permission(perm)
-            ]
-            if missing:
+        pm = self._permission_manager
+        if pm and self._required_permissions and self._perm_ok_epoch != pm.epoch:
+            if all(pm.check_permission(perm) for perm in self._required_permissions):
+                self._perm_ok_epoch = pm.epoch
+            else:
+                missing = [
+                    perm
+                    for perm in self._required_permissions
+                    if not pm.check_permission(perm)
+                ]
                 return AgentResult(
                     agent_name=self._name,
                     status="pending_permission",
@@ -157,7 +269,7 @@ class BaseAgent(ABC):
         # -- Step 3: record interaction --------------------------------
         if self._learning_engine:
             self._learning_engine.record_interaction(
-                query=str(kwargs) if kwargs else f"{self._name} invoked",
+                query=_QUERY_REPR.repr(kwargs) if kwargs else f"{self._name} invoked",
                 response_summary=result.message,
                 agent_used=self._name,
             )
@@ -176,6 +288,13 @@ class BaseAgent(ABC):
             "status": "ready",
         }
 
+    def _error(self, message: str) -> AgentResult:
+        """Return an ``"error"`` result from this agent.
+
+        :param message: Human-readable description of the failure.
+        """
+        return AgentResult(self._name, "error", message)
+
     # ------------------------------------------------------------------
     # Abstract interface
     # ------------------------------------------------------------------
@@ -2,20 +2,79 @@
 
 from __future__ import annotations
 
-import json
-import shutil
-from datetime import datetime, timezone
+import os
+import stat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import load_list
 
 CONFIG_ROOT = Path("config")
 CLOUD_SERVICES_FILE = CONFIG_ROOT / "cloud_services.json"
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "sync_status", "list_services", "backup_files", "upload", "download",
-]
+})
+
+# Worker threads used to copy files during a backup (I/O-bound, releases the GIL).
+_BACKUP_WORKERS = 8
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """Copy *src* to *dst*, letting the kernel move the bytes.
+
+    Uses :func:`os.copy_file_range` where available (a reflink clone on
+    Btrfs/XFS, an in-kernel copy elsewhere) and falls back to
+    :func:`shutil.copy2` when the call is unsupported.  File metadata is
+    copied as with ``copy2``.
+    """
+    import shutil
+
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _copy_tree(src: Path, dest: Path) -> None:
+    """Copy the directory *src* to *dest*, copying files in parallel.
+
+    Behaves like :func:`shutil.copytree`: directory metadata is applied
+    bottom-up once every file has landed, so mtimes and read-only modes
+    of the source directories are preserved.
+    """
+    import shutil
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    dirs: List[Tuple[str, str]] = []
+    futures: List[Future[str]] = []
+    with ThreadPoolExecutor(max_workers=_BACKUP_WORKERS) as pool:
+        for root, _subdirs, files in os.walk(src, followlinks=True):
+            target = os.path.join(dest, os.path.relpath(root, src))
+            os.makedirs(target, exist_ok=root != os.fspath(src))
+            dirs.append((root, target))
+            for name in files:
+                file_src = os.path.join(root, name)
+                if not stat.S_ISREG(os.stat(file_src).st_mode):
+                    # Opening a FIFO would block its worker forever.
+                    raise shutil.SpecialFileError(f"`{file_src}` is not a regular file")
+                futures.append(pool.submit(_fast_copy, file_src, os.path.join(target, name)))
+        for future in futures:
+            future.result()
+    for root, target in reversed(dirs):
+        shutil.copystat(root, target)
 
 
 class CloudAgent(BaseAgent):
@@ -29,31 +88,32 @@ class CloudAgent(BaseAgent):
             **kwargs,
         )
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["CloudAgent", Dict[str, Any]], AgentResult]] = {
+        "sync_status": lambda self, kw: self._sync_status(),
+        "list_services": lambda self, kw: self._list_services(),
+        "backup_files": lambda self, kw: self._backup_files(
+            source_dir=kw.get("source_dir", ""),
+            backup_dir=kw.get("backup_dir", "")),
+        "upload": lambda self, kw: self._upload(
+            file_path=kw.get("file_path", ""),
+            destination=kw.get("destination", "")),
+        "download": lambda self, kw: self._download(
+            url=kw.get("url", ""),
+            destination=kw.get("destination", "")),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested cloud action."""
         action: Optional[str] = kwargs.get("action")
         if action and action not in _ACTIONS:
             return AgentResult(agent_name=self.name, status="error",
-                               message=f"Unknown action '{action}'. Valid: {_ACTIONS}")
-        try:
-            if action == "sync_status":
-                return self._sync_status()
-            if action == "list_services":
-                return self._list_services()
-            if action == "backup_files":
-                return self._backup_files(
-                    source_dir=kwargs.get("source_dir", ""),
-                    backup_dir=kwargs.get("backup_dir", ""))
-            if action == "upload":
-                return self._upload(
-                    file_path=kwargs.get("file_path", ""),
-                    destination=kwargs.get("destination", ""))
-            if action == "download":
-                return self._download(
-                    url=kwargs.get("url", ""),
-                    destination=kwargs.get("destination", ""))
+                               message=f"Unknown action '{action}'. Valid: {sorted(_ACTIONS)}")
+        if not action:
             return AgentResult(agent_name=self.name, status="error",
                                message="No action specified.")
+        try:
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
             return AgentResult(agent_name=self.name, status="error",
                                message=f"Cloud agent error: {exc}")
@@ -64,10 +124,11 @@ class CloudAgent(BaseAgent):
         statuses: List[Dict[str, Any]] = []
         for svc in services:
             sync_dir = Path(svc.get("sync_dir", ""))
+            exists = sync_dir.exists()
             statuses.append({
                 "service": svc.get("name", "unknown"), "sync_dir": str(sync_dir),
-                "exists": sync_dir.exists(),
-                "status": "synced" if sync_dir.exists() else "not_found",
+                "exists": exists,
+                "status": "synced" if exists else "not_found",
             })
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Checked {len(statuses)} services.",
@@ -89,9 +150,11 @@ class CloudAgent(BaseAgent):
         if not src.exists():
             return AgentResult(agent_name=self.name, status="error",
                                message=f"Source directory does not exist: {source_dir}")
+        from datetime import datetime, timezone
+
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         dest = Path(backup_dir) / f"backup_{timestamp}"
-        shutil.copytree(src, dest)
+        _copy_tree(src, dest)
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Backup created at {dest}.",
                            data={"source": str(src), "backup": str(dest)},
@@ -106,7 +169,7 @@ class CloudAgent(BaseAgent):
             agent_name=self.name, status="success",
             message=f"Upload intent recorded: {file_path} -> {destination}.",
             data={"file_path": file_path, "destination": destination,
-                   "timestamp": datetime.now(timezone.utc).isoformat(), "status": "pending"},
+                   "timestamp": iso_now(), "status": "pending"},
             actions_taken=["upload_intent"])
 
     def _download(self, url: str, destination: str) -> AgentResult:
@@ -118,16 +181,9 @@ class CloudAgent(BaseAgent):
             agent_name=self.name, status="success",
             message=f"Download intent recorded: {url} -> {destination}.",
             data={"url": url, "destination": destination,
-                   "timestamp": datetime.now(timezone.utc).isoformat(), "status": "pending"},
+                   "timestamp": iso_now(), "status": "pending"},
             actions_taken=["download_intent"])
 
     def _load_services(self) -> List[Dict[str, Any]]:
         """Load cloud services configuration, creating an empty file if missing."""
-        if not CLOUD_SERVICES_FILE.exists():
-            CLOUD_SERVICES_FILE.parent.mkdir(parents=True, exist_ok=True)
-            CLOUD_SERVICES_FILE.write_text(
-                json.dumps({"services": []}, indent=2), encoding="utf-8")
-        try:
-            return json.loads(CLOUD_SERVICES_FILE.read_text(encoding="utf-8")).get("services", [])
-        except (json.JSONDecodeError, OSError):
-            return []
+        return load_list(CLOUD_SERVICES_FILE, "services")
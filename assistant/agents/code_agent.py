@@ -14,73 +14,247 @@ Security model:
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import shlex
+import stat
 import subprocess
 import sys
-from datetime import datetime, timezone
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import read_jsonl
+from assistant.core.serialization import JSONDecodeError, dumps_bytes, loads
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-_SUPPORTED_LANGUAGES: List[str] = [
+_SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset({
     "python", "javascript", "typescript", "bash", "powershell",
     "html", "css", "sql", "rust", "go", "java",
-]
+})
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "generate_code", "modify_code", "review_code",
     "execute_code", "explain_code", "list_generated",
-]
-
-_HISTORY_PATH = Path("memory/code_agent_history.json")
+})
+
+# Append-only ledger, one JSON record per line.
+_HISTORY_PATH = Path("memory/code_agent_history.jsonl")
+
+# (absolute ledger path, (st_mtime_ns, st_size) or None if absent, parsed
+# entries) — reloaded when another process changes the ledger.
+_HISTORY_CACHE: Optional[Tuple[str, Optional[Tuple[int, int]], List[Dict[str, Any]]]] = None
+# Encoded ledger lines awaiting a group commit, and the timer that writes them.
+_PENDING: List[bytes] = []
+_PENDING_TIMER: Optional[threading.Timer] = None
+_HISTORY_BATCH = 32
+_HISTORY_FLUSH_DELAY = 0.5  # seconds
+_HISTORY_LOCK = threading.RLock()
+
+# AI prompt templates.  Review/explain instructions are sent as the system
+# prompt with the code as the user message, so their prefix stays constant.
+_GENERATE_PROMPT = (
+    "Generate {language} code for the following requirement. "
+    "Return ONLY the code, no explanations:\n\n{description}"
+)
+_MODIFY_PROMPT = (
+    "Modify the following code according to this instruction:\n"
+    "{instruction}\n\n"
+    "Return ONLY the modified code, no explanations:\n\n{code}"
+)
+_REVIEW_PROMPT = (
+    "Review the following code. Provide a JSON object with keys: "
+    '"quality_score" (1-10), "issues" (list of strings), '
+    '"suggestions" (list of strings), "security_concerns" (list of strings).'
+)
+_EXPLAIN_PROMPT = (
+    "Explain the following code line by line. Be thorough but concise."
+)
+
+# Suggested runner per non-Python language (see ``_non_python_hint``).
+_LANG_RUNNERS: Dict[str, str] = {
+    "javascript": "node", "typescript": "npx ts-node",
+    "bash": "bash", "powershell": "pwsh",
+    "rust": "cargo run", "go": "go run",
+    "java": "javac && java",
+}
+
+# Largest file sent to the AI for modify/review/explain; checked via stat
+# before the file is read.
+_MAX_REVIEW_BYTES = 256 * 1024
 
 _EXECUTION_TIMEOUT = 30  # seconds
+_MAX_OUTPUT_BYTES = 1024 * 1024  # per stream; the rest is drained and dropped
+_OUTPUT_TRUNCATED = "\n[…output truncated]"
+
+# (os.getcwd() result, its resolved Path) — see _cwd().
+_CWD: Tuple[str, Path] = ("", Path())
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _safe_resolve(file_path: str) -> Path:
+def _cwd() -> Path:
+    """Return the resolved working directory, re-resolving only when it changes."""
+    global _CWD
+    raw = os.getcwd()
+    if _CWD[0] != raw:
+        _CWD = (raw, Path(raw).resolve())
+    return _CWD[1]
+
+
+def _lstat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    try:
+        return os.lstat(path)
+    except OSError:
+        return None
+
+
+def _safe_resolve(file_path: str) -> Tuple[Path, Optional[os.stat_result]]:
     """Resolve *file_path* and ensure it stays inside the working directory.
 
     :param file_path: User-supplied path (relative or absolute).
-    :returns: Resolved :class:`Path`.
+    :returns: Resolved :class:`Path` and its ``lstat`` result (``None`` if
+        the path does not exist), so callers need no second stat.
     :raises ValueError: If the resolved path escapes the working directory.
     """
-    cwd = Path.cwd().resolve()
+    cwd = _cwd()
+    # Fast path: a plain file name directly inside cwd needs one lstat
+    # rather than a full resolve().  Deeper paths may cross a symlinked
+    # directory, so they always take the resolve() route.
+    if ".." not in Path(file_path).parts:
+        candidate = os.path.normpath(os.path.join(cwd, file_path))
+        if os.path.dirname(candidate) == str(cwd):
+            st = _lstat(candidate)
+            if st is None or not stat.S_ISLNK(st.st_mode):
+                return Path(candidate), st
     resolved = (cwd / file_path).resolve()
-    if not str(resolved).startswith(str(cwd)):
+    if not resolved.is_relative_to(cwd):
         raise ValueError(
             f"Path traversal detected: '{file_path}' resolves outside "
             f"the working directory."
         )
-    return resolved
+    return resolved, _lstat(resolved)
 
 
-def _load_history() -> List[Dict[str, Any]]:
-    """Load the code-agent history ledger from disk."""
-    if _HISTORY_PATH.exists():
-        try:
-            return json.loads(_HISTORY_PATH.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            return []
-    return []
+def _drain(stream: IO[bytes], limit: int, out: bytearray, dropped: threading.Event) -> None:
+    """Read *stream* to EOF, keeping at most *limit* bytes in *out*.
+
+    *dropped* is set if any byte had to be discarded.
+    """
+    with stream:
+        for chunk in iter(lambda: stream.read(65536), b""):
+            room = limit - len(out)
+            if room > 0:
+                out += chunk[:room]
+            if len(chunk) > room:
+                dropped.set()
+
 
+def _decode_output(buf: bytearray, dropped: threading.Event) -> str:
+    text = buf.decode("utf-8", errors="replace")
+    return text + _OUTPUT_TRUNCATED if dropped.is_set() else text
 
-def _save_history(history: List[Dict[str, Any]]) -> None:
-    """Persist the code-agent history ledger to disk."""
-    _HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _HISTORY_PATH.write_text(
-        json.dumps(history, indent=2), encoding="utf-8",
-    )
+
+def _run_bounded(
+    cmd: List[str], timeout: float, limit: int,
+) -> Tuple[int, str, str]:
+    """Run *cmd* and return ``(returncode, stdout, stderr)``.
+
+    Unlike ``subprocess.run(capture_output=True)`` each stream is drained
+    by a thread into a buffer capped at *limit* bytes, so a child that
+    prints without bound cannot exhaust memory.
+
+    :raises subprocess.TimeoutExpired: If the child outlives *timeout*;
+        it is killed first.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = bytearray(), bytearray()
+    out_dropped, err_dropped = threading.Event(), threading.Event()
+    drains = [
+        threading.Thread(target=_drain, args=(proc.stdout, limit, out, out_dropped), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, limit, err, err_dropped), daemon=True),
+    ]
+    for t in drains:
+        t.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for t in drains:
+            t.join()
+    return returncode, _decode_output(out, out_dropped), _decode_output(err, err_dropped)
+
+
+def _ledger_stamp(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    st = _lstat(path)
+    return None if st is None else (st.st_mtime_ns, st.st_size)
+
+
+def _load_history() -> List[Dict[str, Any]]:
+    """Return the code-agent history ledger (the cached list itself).
+
+    The parsed ledger is kept in memory (per absolute path) and re-read
+    when the file's mtime or size shows another process changed it.  A
+    legacy ``code_agent_history.json`` array is migrated into the JSONL
+    ledger on first load.
+    """
+    global _HISTORY_CACHE
+    key = os.path.abspath(_HISTORY_PATH)
+    with _HISTORY_LOCK:
+        if (_HISTORY_CACHE is not None and _HISTORY_CACHE[0] == key
+                and _HISTORY_CACHE[1] == _ledger_stamp(key)):
+            return _HISTORY_CACHE[2]
+
+        _flush_history()
+        history = read_jsonl(_HISTORY_PATH) if _HISTORY_PATH.exists() else []
+        legacy = _HISTORY_PATH.with_suffix(".json")
+        if legacy.exists():
+            try:
+                history = loads(legacy.read_bytes()) + history
+            except (JSONDecodeError, OSError):
+                pass
+            else:
+                # Rewrite via a sibling and rename so an interrupted
+                # migration never leaves a truncated ledger behind.
+                tmp = _HISTORY_PATH.with_suffix(".jsonl.tmp")
+                tmp.write_bytes(b"".join(dumps_bytes(e, newline=True) for e in history))
+                os.replace(tmp, _HISTORY_PATH)
+                legacy.unlink()
+        _HISTORY_CACHE = (key, _ledger_stamp(key), history)
+        return history
+
+
+def _flush_history() -> None:
+    """Append all buffered entries to the JSONL ledger in a single write."""
+    global _HISTORY_CACHE, _PENDING_TIMER
+    with _HISTORY_LOCK:
+        if _PENDING_TIMER is not None:
+            _PENDING_TIMER.cancel()
+            _PENDING_TIMER = None
+        if not _PENDING or _HISTORY_CACHE is None:
+            return
+        key, stamp, history = _HISTORY_CACHE
+        path = Path(key)
+        unchanged = _ledger_stamp(path) == stamp
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as fh:
+            fh.write(b"".join(_PENDING))
+        _PENDING.clear()
+        if unchanged:
+            # Our own append: the cached entries still match the file.
+            _HISTORY_CACHE = (key, _ledger_stamp(path), history)
+
+
+atexit.register(_flush_history)
 
 
 def _record_action(
@@ -88,15 +262,28 @@ def _record_action(
     file_path: Optional[str] = None,
     language: Optional[str] = None,
 ) -> None:
-    """Append an entry to the history ledger."""
-    history = _load_history()
-    history.append({
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    """Append an entry to the history ledger.
+
+    The entry is added to the in-memory ledger and buffered as one JSONL
+    line.  Buffered lines are group-committed in one append once
+    ``_HISTORY_BATCH`` accumulate or ``_HISTORY_FLUSH_DELAY`` seconds pass.
+    """
+    global _PENDING_TIMER
+    entry = {
+        "timestamp": iso_now(),
         "action": action,
         "file_path": file_path,
         "language": language,
-    })
-    _save_history(history)
+    }
+    with _HISTORY_LOCK:
+        _load_history().append(entry)
+        _PENDING.append(dumps_bytes(entry, newline=True))
+        if len(_PENDING) >= _HISTORY_BATCH:
+            _flush_history()
+        elif _PENDING_TIMER is None:
+            _PENDING_TIMER = threading.Timer(_HISTORY_FLUSH_DELAY, _flush_history)
+            _PENDING_TIMER.daemon = True
+            _PENDING_TIMER.start()
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +309,38 @@ class CodeAgent(BaseAgent):
     # Dispatch
     # ------------------------------------------------------------------
 
+    # Resolved ``ask_ai`` callable: ``None`` until first use, ``False`` if
+    # the AI client could not be imported.
+    _ask_ai: Union[Callable[..., str], bool, None] = None
+
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["CodeAgent", Dict[str, Any]], AgentResult]] = {
+        "generate_code": lambda self, kw: self._generate_code(
+            language=kw.get("language", "python"),
+            description=kw.get("description", ""),
+            output_path=kw.get("output_path"),
+        ),
+        "modify_code": lambda self, kw: self._modify_code(
+            file_path=kw.get("file_path", ""),
+            instruction=kw.get("instruction", ""),
+            code=kw.get("code"),
+        ),
+        "review_code": lambda self, kw: self._review_code(
+            file_path=kw.get("file_path"),
+            code=kw.get("code"),
+        ),
+        "execute_code": lambda self, kw: self._execute_code(
+            file_path=kw.get("file_path"),
+            code=kw.get("code"),
+            language=kw.get("language", "python"),
+        ),
+        "explain_code": lambda self, kw: self._explain_code(
+            file_path=kw.get("file_path"),
+            code=kw.get("code"),
+        ),
+        "list_generated": lambda self, kw: self._list_generated(),
+    }
+
     def execute(self, action: Optional[str] = None, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested code action.
 
@@ -131,43 +350,16 @@ class CodeAgent(BaseAgent):
         if action and action not in _ACTIONS:
             return AgentResult(
                 agent_name=self.name, status="error",
-                message=f"Unknown action '{action}'. Valid: {_ACTIONS}",
+                message=f"Unknown action '{action}'. Valid: {sorted(_ACTIONS)}",
             )
-
-        try:
-            if action == "generate_code":
-                return self._generate_code(
-                    language=kwargs.get("language", "python"),
-                    description=kwargs.get("description", ""),
-                    output_path=kwargs.get("output_path"),
-                )
-            if action == "modify_code":
-                return self._modify_code(
-                    file_path=kwargs.get("file_path", ""),
-                    instruction=kwargs.get("instruction", ""),
-                )
-            if action == "review_code":
-                return self._review_code(
-                    file_path=kwargs.get("file_path"),
-                    code=kwargs.get("code"),
-                )
-            if action == "execute_code":
-                return self._execute_code(
-                    file_path=kwargs.get("file_path"),
-                    code=kwargs.get("code"),
-                    language=kwargs.get("language", "python"),
-                )
-            if action == "explain_code":
-                return self._explain_code(
-                    file_path=kwargs.get("file_path"),
-                    code=kwargs.get("code"),
-                )
-            if action == "list_generated":
-                return self._list_generated()
+        if not action:
             return AgentResult(
                 agent_name=self.name, status="error",
-                message="No action specified. Provide one of: " + ", ".join(_ACTIONS),
+                message="No action specified. Provide one of: " + ", ".join(sorted(_ACTIONS)),
             )
+
+        try:
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:  # noqa: BLE001 – catch-all for robustness
             return AgentResult(
                 agent_name=self.name, status="error",
@@ -185,7 +377,7 @@ class CodeAgent(BaseAgent):
         if language not in _SUPPORTED_LANGUAGES:
             return AgentResult(
                 agent_name=self.name, status="error",
-                message=f"Unsupported language '{language}'. Supported: {_SUPPORTED_LANGUAGES}",
+                message=f"Unsupported language '{language}'. Supported: {sorted(_SUPPORTED_LANGUAGES)}",
             )
         if not description:
             return AgentResult(
@@ -193,14 +385,12 @@ class CodeAgent(BaseAgent):
                 message="A description is required for code generation.",
             )
 
-        prompt = (
-            f"Generate {language} code for the following requirement. "
-            f"Return ONLY the code, no explanations:\n\n{description}"
+        code = self._ask_ai_safe(
+            _GENERATE_PROMPT.format(language=language, description=description)
         )
-        code = self._ask_ai_safe(prompt)
 
         if output_path:
-            resolved = _safe_resolve(output_path)
+            resolved, _ = _safe_resolve(output_path)
             resolved.parent.mkdir(parents=True, exist_ok=True)
             resolved.write_text(code, encoding="utf-8")
             _record_action("generate_code", str(resolved), language)
@@ -208,7 +398,7 @@ class CodeAgent(BaseAgent):
                 agent_name=self.name, status="success",
                 message=f"Code generated and written to {resolved}.",
                 data={"code": code, "file_path": str(resolved), "language": language},
-                actions_taken=["generate_code", "write_file"],
+                actions_taken=("generate_code", "write_file"),
             )
 
         _record_action("generate_code", language=language)
@@ -216,37 +406,42 @@ class CodeAgent(BaseAgent):
             agent_name=self.name, status="success",
             message="Code generated successfully.",
             data={"code": code, "language": language},
-            actions_taken=["generate_code"],
+            actions_taken=("generate_code",),
         )
 
-    def _modify_code(self, file_path: str, instruction: str) -> AgentResult:
-        """Read an existing file, apply an AI-driven modification, and return the result."""
+    def _modify_code(
+        self, file_path: str, instruction: str, code: Optional[str] = None,
+    ) -> AgentResult:
+        """Read an existing file, apply an AI-driven modification, and return the result.
+
+        :param code: Current contents of *file_path* when the caller already
+            has them; the file is then not read again.
+        """
         if not file_path:
             return AgentResult(
                 agent_name=self.name, status="error",
                 message="file_path is required for modify_code.",
             )
-        resolved = _safe_resolve(file_path)
-        if not resolved.is_file():
+        resolved, st = _safe_resolve(file_path)
+        if st is None or not stat.S_ISREG(st.st_mode):
             return AgentResult(
                 agent_name=self.name, status="error",
                 message=f"File not found: {resolved}",
             )
 
-        original = resolved.read_text(encoding="utf-8")
-        prompt = (
-            f"Modify the following code according to this instruction:\n"
-            f"{instruction}\n\n"
-            f"Return ONLY the modified code, no explanations:\n\n{original}"
+        if code is None and st.st_size > _MAX_REVIEW_BYTES:
+            return self._too_large(resolved)
+        original = code if code is not None else resolved.read_text(encoding="utf-8")
+        modified = self._ask_ai_safe(
+            _MODIFY_PROMPT.format(instruction=instruction, code=original)
         )
-        modified = self._ask_ai_safe(prompt)
         _record_action("modify_code", str(resolved))
 
         return AgentResult(
             agent_name=self.name, status="success",
             message="Code modified (review before saving). Use generate_code with output_path to persist.",
             data={"original": original, "modified": modified, "file_path": str(resolved)},
-            actions_taken=["modify_code"],
+            actions_taken=("modify_code",),
         )
 
     def _review_code(
@@ -257,18 +452,12 @@ class CodeAgent(BaseAgent):
         if isinstance(source, AgentResult):
             return source
 
-        prompt = (
-            "Review the following code. Provide a JSON object with keys: "
-            '"quality_score" (1-10), "issues" (list of strings), '
-            '"suggestions" (list of strings), "security_concerns" (list of strings).\n\n'
-            f"{source}"
-        )
-        review = self._ask_ai_safe(prompt)
+        review = self._ask_ai_safe(source, system=_REVIEW_PROMPT)
         return AgentResult(
             agent_name=self.name, status="success",
             message="Code review complete.",
             data={"review": review, "file_path": file_path},
-            actions_taken=["review_code"],
+            actions_taken=("review_code",),
         )
 
     def _execute_code(
@@ -291,13 +480,13 @@ class CodeAgent(BaseAgent):
                 agent_name=self.name, status="success",
                 message=f"Execution hint for {language} (not auto-executed).",
                 data={"command": cmd_hint, "language": language},
-                actions_taken=["execution_hint"],
+                actions_taken=("execution_hint",),
             )
 
         # Build command
         if file_path:
-            resolved = _safe_resolve(file_path)
-            if not resolved.is_file():
+            resolved, st = _safe_resolve(file_path)
+            if st is None or not stat.S_ISREG(st.st_mode):
                 return AgentResult(
                     agent_name=self.name, status="error",
                     message=f"File not found: {resolved}",
@@ -311,21 +500,21 @@ class CodeAgent(BaseAgent):
                 message="Provide file_path or code to execute.",
             )
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=_EXECUTION_TIMEOUT,
+        returncode, stdout, stderr = _run_bounded(
+            cmd, _EXECUTION_TIMEOUT, _MAX_OUTPUT_BYTES,
         )
         _record_action("execute_code", file_path, "python")
 
         return AgentResult(
             agent_name=self.name,
-            status="success" if result.returncode == 0 else "error",
-            message=f"Code exited with return code {result.returncode}.",
+            status="success" if returncode == 0 else "error",
+            message=f"Code exited with return code {returncode}.",
             data={
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
+                "stdout": stdout,
+                "stderr": stderr,
+                "returncode": returncode,
             },
-            actions_taken=["execute_code"],
+            actions_taken=("execute_code",),
         )
 
     def _explain_code(
@@ -336,26 +525,23 @@ class CodeAgent(BaseAgent):
         if isinstance(source, AgentResult):
             return source
 
-        prompt = (
-            "Explain the following code line by line. Be thorough but concise:\n\n"
-            f"{source}"
-        )
-        explanation = self._ask_ai_safe(prompt)
+        explanation = self._ask_ai_safe(source, system=_EXPLAIN_PROMPT)
         return AgentResult(
             agent_name=self.name, status="success",
             message="Code explanation generated.",
             data={"explanation": explanation, "file_path": file_path},
-            actions_taken=["explain_code"],
+            actions_taken=("explain_code",),
         )
 
     def _list_generated(self) -> AgentResult:
         """List all files previously generated or modified by this agent."""
         history = _load_history()
+        _flush_history()
         return AgentResult(
             agent_name=self.name, status="success",
             message=f"Found {len(history)} history entries.",
-            data={"history": history},
-            actions_taken=["list_generated"],
+            data={"history": list(history)},
+            actions_taken=("list_generated",),
         )
 
     # ------------------------------------------------------------------
@@ -367,12 +553,14 @@ class CodeAgent(BaseAgent):
     ) -> str | AgentResult:
         """Return code text from *file_path* or *code*, or an error result."""
         if file_path:
-            resolved = _safe_resolve(file_path)
-            if not resolved.is_file():
+            resolved, st = _safe_resolve(file_path)
+            if st is None or not stat.S_ISREG(st.st_mode):
                 return AgentResult(
                     agent_name=self.name, status="error",
                     message=f"File not found: {resolved}",
                 )
+            if st.st_size > _MAX_REVIEW_BYTES:
+                return self._too_large(resolved)
             return resolved.read_text(encoding="utf-8")
         if code:
             return code
@@ -381,23 +569,40 @@ class CodeAgent(BaseAgent):
             message="Provide either file_path or code.",
         )
 
-    def _ask_ai_safe(self, prompt: str) -> str:
-        """Call :func:`ask_ai` with graceful error handling."""
+    def _too_large(self, resolved: Path) -> AgentResult:
+        """Error result for a file above ``_MAX_REVIEW_BYTES``."""
+        return AgentResult(
+            agent_name=self.name, status="error",
+            message=f"File exceeds {_MAX_REVIEW_BYTES} bytes; chunk it first: {resolved}",
+        )
+
+    def _ask_ai_safe(self, prompt: str, system: Optional[str] = None) -> str:
+        """Call :func:`ask_ai` with graceful error handling.
+
+        Responses are stored in the shared response cache
+        (:mod:`assistant.ai.cache`), so a repeated request is answered
+        without a network round-trip; ``--no-cache`` turns this off.
+
+        :param prompt: User message.
+        :param system: Optional fixed instructions sent as the system prompt.
+        """
+        ask_ai = CodeAgent._ask_ai
+        if ask_ai is None:
+            try:
+                from assistant.ai.client import ask_ai
+            except Exception:  # noqa: BLE001
+                ask_ai = False
+            CodeAgent._ask_ai = ask_ai
+        if not ask_ai:
+            return "[AI unavailable] AI client could not be imported."
         try:
-            from assistant.ai.client import ask_ai
-            return ask_ai(prompt)
+            return ask_ai(prompt, system=system, cache=True)
         except Exception as exc:  # noqa: BLE001
             return f"[AI unavailable] {exc}"
 
     @staticmethod
     def _non_python_hint(file_path: Optional[str], language: str) -> str:
         """Return a suggested shell command for non-Python languages."""
-        runners = {
-            "javascript": "node", "typescript": "npx ts-node",
-            "bash": "bash", "powershell": "pwsh",
-            "rust": "cargo run", "go": "go run",
-            "java": "javac && java",
-        }
-        runner = runners.get(language, language)
+        runner = _LANG_RUNNERS.get(language, language)
         target = file_path or "<file>"
         return f"{runner} {shlex.quote(target)}"
@@ -8,23 +8,28 @@ structured records that downstream plugins can deliver.
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import load_list
 
 
 CONFIG_ROOT = Path("config")
 CONTACTS_FILE = CONFIG_ROOT / "contacts.json"
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "send_message",
     "draft_email",
     "schedule_meeting",
     "list_contacts",
-]
+})
+_VALID_ACTIONS = str(sorted(_ACTIONS))
+
+
+def _load_contacts() -> List[Dict[str, Any]]:
+    """Load the contacts list, creating an empty file if missing."""
+    return load_list(CONTACTS_FILE, "contacts")
 
 
 class CommunicationAgent(BaseAgent):
@@ -42,6 +47,27 @@ class CommunicationAgent(BaseAgent):
     # Public interface
     # ------------------------------------------------------------------
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["CommunicationAgent", Dict[str, Any]], AgentResult]] = {
+        "send_message": lambda self, kw: self._send_message(
+            recipient=kw.get("recipient", ""),
+            message=kw.get("message", ""),
+            channel=kw.get("channel", "default"),
+        ),
+        "draft_email": lambda self, kw: self._draft_email(
+            to=kw.get("to", ""),
+            subject=kw.get("subject", ""),
+            body=kw.get("body", ""),
+        ),
+        "schedule_meeting": lambda self, kw: self._schedule_meeting(
+            title=kw.get("title", ""),
+            participants=kw.get("participants", []),
+            datetime_str=kw.get("datetime_str", ""),
+            duration_minutes=kw.get("duration_minutes", 60),
+        ),
+        "list_contacts": lambda self, kw: self._list_contacts(),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested communication action."""
         action: Optional[str] = kwargs.get("action")
@@ -50,36 +76,17 @@ class CommunicationAgent(BaseAgent):
             return AgentResult(
                 agent_name=self.name,
                 status="error",
-                message=f"Unknown action '{action}'. Valid: {_ACTIONS}",
+                message=f"Unknown action '{action}'. Valid: {_VALID_ACTIONS}",
             )
-
-        try:
-            if action == "send_message":
-                return self._send_message(
-                    recipient=kwargs.get("recipient", ""),
-                    message=kwargs.get("message", ""),
-                    channel=kwargs.get("channel", "default"),
-                )
-            if action == "draft_email":
-                return self._draft_email(
-                    to=kwargs.get("to", ""),
-                    subject=kwargs.get("subject", ""),
-                    body=kwargs.get("body", ""),
-                )
-            if action == "schedule_meeting":
-                return self._schedule_meeting(
-                    title=kwargs.get("title", ""),
-                    participants=kwargs.get("participants", []),
-                    datetime_str=kwargs.get("datetime_str", ""),
-                    duration_minutes=kwargs.get("duration_minutes", 60),
-                )
-            if action == "list_contacts":
-                return self._list_contacts()
+        if not action:
             return AgentResult(
                 agent_name=self.name,
                 status="error",
                 message="No action specified.",
             )
+
+        try:
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
             return AgentResult(
                 agent_name=self.name,
@@ -106,7 +113,7 @@ class CommunicationAgent(BaseAgent):
             "recipient": recipient,
             "message": message,
             "channel": channel,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": iso_now(),
             "status": "queued",
         }
         return AgentResult(
@@ -114,7 +121,7 @@ class CommunicationAgent(BaseAgent):
             status="success",
             message=f"Message queued for {recipient} on '{channel}'.",
             data=record,
-            actions_taken=["send_message"],
+            actions_taken=("send_message",),
         )
 
     def _draft_email(self, to: str, subject: str, body: str) -> AgentResult:
@@ -130,7 +137,7 @@ class CommunicationAgent(BaseAgent):
             "to": to,
             "subject": subject,
             "body": body,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": iso_now(),
             "formatted": f"To: {to}\nSubject: {subject}\n\n{body}",
         }
         return AgentResult(
@@ -138,7 +145,7 @@ class CommunicationAgent(BaseAgent):
             status="success",
             message=f"Email draft created for {to}.",
             data=draft,
-            actions_taken=["draft_email"],
+            actions_taken=("draft_email",),
         )
 
     def _schedule_meeting(
@@ -161,7 +168,7 @@ class CommunicationAgent(BaseAgent):
             "participants": participants,
             "datetime": datetime_str,
             "duration_minutes": duration_minutes,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": iso_now(),
             "status": "scheduled",
         }
         return AgentResult(
@@ -169,27 +176,16 @@ class CommunicationAgent(BaseAgent):
             status="success",
             message=f"Meeting '{title}' scheduled for {datetime_str}.",
             data=meeting,
-            actions_taken=["schedule_meeting"],
+            actions_taken=("schedule_meeting",),
         )
 
     def _list_contacts(self) -> AgentResult:
         """Return contacts from ``config/contacts.json`` (creates empty if missing)."""
-        if not CONTACTS_FILE.exists():
-            CONTACTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            CONTACTS_FILE.write_text(
-                json.dumps({"contacts": []}, indent=2), encoding="utf-8"
-            )
-
-        try:
-            data = json.loads(CONTACTS_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            data = {"contacts": []}
-
-        contacts = data.get("contacts", [])
+        contacts = _load_contacts()
         return AgentResult(
             agent_name=self.name,
             status="success",
             message=f"Found {len(contacts)} contacts.",
             data={"contacts": contacts},
-            actions_taken=["list_contacts"],
+            actions_taken=("list_contacts",),
         )
@@ -7,20 +7,52 @@ Uses AI when available for high-quality content generation.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, ensure_dir, utc_strftime
+
+_WRITE_WORKERS = 4
+# Characters of an existing document included in an ``update_doc`` prompt.
+_MAX_PROMPT_CHARS = 8000
+# READMEs and reports whose input is shorter than this are filled from the
+# ``_*_MIN`` templates below instead of asking the AI.
+_SYNTHETIC_MAX_CHARS = 40
+
+_README_PROMPT = (
+    "Generate a professional README.md for a project named "
+    "'{project_name}'. Description: {description}\n"
+    "Include: overview, features, installation, usage, "
+    "configuration, contributing, and license sections."
+)
+_REPORT_PROMPT = (
+    "Generate a structured professional report.\n"
+    "Title: {title}\n"
+    "Content/Data: {content}\n"
+    "Include: executive summary, findings, analysis, "
+    "recommendations, and conclusion."
+)
+
+# Nothing is known beyond the name and description, so no empty sections.
+_README_MIN = "# {project_name}\n\n{description}\n"
+_REPORT_MIN = (
+    "# {title}\n\n"
+    "*Generated: {now}*\n\n"
+    "## Summary\n\n"
+    "{content}\n"
+)
 
 
 class DocumentationAgent(BaseAgent):
     """Agent that generates and maintains documentation artifacts.
 
     Actions: ``generate_readme``, ``generate_changelog``, ``generate_report``,
-    ``session_summary``, ``write_doc``, ``update_doc``.
+    ``session_summary``, ``write_doc``, ``update_doc``, ``batch_generate``.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(
             name="documentation",
@@ -37,48 +69,53 @@ class DocumentationAgent(BaseAgent):
     # BaseAgent interface
     # ------------------------------------------------------------------
 
-    def execute(self, **kwargs: Any) -> AgentResult:
-        action = kwargs.get("action")
-        message = kwargs.get("message", "")
+    # Resolved ``ask_ai_batch`` callable: ``None`` until first use, ``False``
+    # if the AI client could not be imported.
+    _ask_ai_batch: Union[Callable[[List[str]], List[str]], bool, None] = None
 
-        if action == "generate_readme":
-            return self._generate_readme(
-                kwargs.get("project_name", ""),
-                kwargs.get("description", message),
-                kwargs.get("output_path"),
-            )
-        if action == "generate_changelog":
-            return self._generate_changelog(
-                kwargs.get("entries", []),
-                kwargs.get("output_path"),
-            )
-        if action == "generate_report":
-            return self._generate_report(
-                kwargs.get("title", "Report"),
-                kwargs.get("content", message),
-                kwargs.get("output_path"),
-            )
-        if action == "session_summary":
-            return self._session_summary(kwargs.get("events", []))
-        if action == "write_doc":
-            return self._write_doc(
-                kwargs.get("title", ""),
-                kwargs.get("content", message),
-                kwargs.get("output_path"),
-            )
-        if action == "update_doc":
-            return self._update_doc(
-                kwargs.get("file_path", ""),
-                kwargs.get("instruction", message),
-            )
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["DocumentationAgent", Dict[str, Any]], AgentResult]] = {
+        "generate_readme": lambda self, kw: self._generate_readme(
+            kw.get("project_name", ""),
+            kw.get("description", kw.get("message", "")),
+            kw.get("output_path"),
+        ),
+        "generate_changelog": lambda self, kw: self._generate_changelog(
+            kw.get("entries", []),
+            kw.get("output_path"),
+        ),
+        "generate_report": lambda self, kw: self._generate_report(
+            kw.get("title", "Report"),
+            kw.get("content", kw.get("message", "")),
+            kw.get("output_path"),
+        ),
+        "session_summary": lambda self, kw: self._session_summary(kw.get("events", [])),
+        "write_doc": lambda self, kw: self._write_doc(
+            kw.get("title", ""),
+            kw.get("content", kw.get("message", "")),
+            kw.get("output_path"),
+        ),
+        "update_doc": lambda self, kw: self._update_doc(
+            kw.get("file_path", ""),
+            kw.get("instruction", kw.get("message", "")),
+            kw.get("include_original", False),
+        ),
+        "batch_generate": lambda self, kw: self._batch_generate(kw.get("items", [])),
+    }
+
+    def execute(self, **kwargs: Any) -> AgentResult:
+        handler = self._HANDLERS.get(kwargs.get("action"))
+        if handler is not None:
+            return handler(self, kwargs)
 
+        message = kwargs.get("message", "")
         if message:
             return self._write_doc("Auto-generated", message)
 
         return AgentResult(
             agent_name=self.name,
             status="error",
-            message="No action or message. Use: generate_readme, generate_changelog, generate_report, session_summary, write_doc, update_doc.",
+            message="No action or message. Use: generate_readme, generate_changelog, generate_report, session_summary, write_doc, update_doc, batch_generate.",
         )
 
     # ------------------------------------------------------------------
@@ -88,18 +125,23 @@ class DocumentationAgent(BaseAgent):
     def _generate_readme(
         self, project_name: str, description: str, output_path: Optional[str] = None,
     ) -> AgentResult:
-        content = self._ai_generate(
-            f"Generate a professional README.md for a project named "
-            f"'{project_name}'. Description: {description}\n"
-            f"Include: overview, features, installation, usage, "
-            f"configuration, contributing, and license sections."
+        synthetic = self._is_trivial(description)
+        if synthetic:
+            content = _README_MIN.format(
+                project_name=project_name or "Project", description=description,
+            )
+        else:
+            content = self._ai_generate(
+                _README_PROMPT.format(project_name=project_name, description=description)
+            )
+        return self._write_output(
+            content, output_path, "README generated.", synthetic=synthetic,
         )
-        return self._write_output(content, output_path, "README generated.")
 
     def _generate_changelog(
         self, entries: List[Dict[str, str]], output_path: Optional[str] = None,
     ) -> AgentResult:
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        now = utc_strftime("%Y-%m-%d")
         if entries:
             entry_text = "\n".join(
                 f"- {e.get('type', 'change')}: {e.get('description', '')}"
@@ -118,44 +160,55 @@ class DocumentationAgent(BaseAgent):
     def _generate_report(
         self, title: str, content: str, output_path: Optional[str] = None,
     ) -> AgentResult:
-        report = self._ai_generate(
-            f"Generate a structured professional report.\n"
-            f"Title: {title}\n"
-            f"Content/Data: {content}\n"
-            f"Include: executive summary, findings, analysis, "
-            f"recommendations, and conclusion."
+        synthetic = self._is_trivial(content)
+        if synthetic:
+            report = _REPORT_MIN.format(
+                title=title, now=utc_strftime("%Y-%m-%d %H:%M UTC"), content=content,
+            )
+        else:
+            report = self._ai_generate(_REPORT_PROMPT.format(title=title, content=content))
+        return self._write_output(
+            report, output_path, f"Report '{title}' generated.", synthetic=synthetic,
         )
-        return self._write_output(report, output_path, f"Report '{title}' generated.")
 
     def _session_summary(self, events: List[Dict[str, Any]]) -> AgentResult:
         if not events:
             summary = "No events recorded in this session."
         else:
-            lines = [f"## Session Summary — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}\n"]
-            for i, event in enumerate(events, 1):
-                agent = event.get("agent", "unknown")
-                action = event.get("action", "unknown")
-                detail = event.get("detail", "")
-                lines.append(f"{i}. **[{agent}]** {action}: {detail}")
-            lines.append(f"\n**Total actions:** {len(events)}")
-            summary = "\n".join(lines)
+            body = "\n".join(
+                f"{i}. **[{event.get('agent', 'unknown')}]** "
+                f"{event.get('action', 'unknown')}: {event.get('detail', '')}"
+                for i, event in enumerate(events, 1)
+            )
+            summary = (
+                f"## Session Summary — {utc_strftime('%Y-%m-%d %H:%M UTC')}\n\n"
+                f"{body}\n\n**Total actions:** {len(events)}"
+            )
 
         return AgentResult(
             agent_name=self.name,
             status="success",
             message="Session summary generated.",
             data={"summary": summary},
-            actions_taken=["generate_session_summary"],
+            actions_taken=("generate_session_summary",),
         )
 
     def _write_doc(
         self, title: str, content: str, output_path: Optional[str] = None,
     ) -> AgentResult:
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        now = utc_strftime("%Y-%m-%d %H:%M UTC")
         doc = f"# {title}\n\n*Generated: {now}*\n\n{content}\n"
         return self._write_output(doc, output_path, f"Document '{title}' created.")
 
-    def _update_doc(self, file_path: str, instruction: str) -> AgentResult:
+    def _update_doc(
+        self, file_path: str, instruction: str, include_original: bool = False,
+    ) -> AgentResult:
+        """Prepare an AI update of an existing document.
+
+        Only the first :data:`_MAX_PROMPT_CHARS` characters are read for
+        the prompt; the full text is loaded only when *include_original*
+        is set.
+        """
         if not file_path:
             return AgentResult(
                 agent_name=self.name, status="error",
@@ -167,17 +220,64 @@ class DocumentationAgent(BaseAgent):
                 agent_name=self.name, status="error",
                 message=f"File not found: {file_path}",
             )
-        original = path.read_text(encoding="utf-8")
+        with path.open("rb") as fh:
+            # 4 bytes per character is the UTF-8 upper bound.
+            head = fh.read(_MAX_PROMPT_CHARS * 4).decode("utf-8", errors="replace")
+        prompt_slice = head[:_MAX_PROMPT_CHARS]
         updated = self._ai_generate(
             f"Update the following document according to this instruction:\n"
-            f"{instruction}\n\nOriginal document:\n{original[:8000]}"
+            f"{instruction}\n\nOriginal document:\n{prompt_slice}"
         )
+        data: Dict[str, Any] = {
+            "file_path": file_path,
+            "prompt_slice_len": len(prompt_slice),
+            "updated": updated,
+        }
+        if include_original:
+            data["original"] = path.read_text(encoding="utf-8", errors="replace")
         return AgentResult(
             agent_name=self.name,
             status="success",
             message=f"Document update prepared (review before saving to {file_path}).",
-            data={"original": original, "updated": updated, "file_path": file_path},
-            actions_taken=["read_doc", "generate_update"],
+            data=data,
+            actions_taken=("read_doc", "generate_update"),
+        )
+
+    def _batch_generate(self, items: List[Dict[str, Any]]) -> AgentResult:
+        """Generate several documents from one AI request.
+
+        :param items: Dicts with a ``prompt`` and optional ``output_path``
+            and ``message``.
+        """
+        if not items or not all(item.get("prompt") for item in items):
+            return AgentResult(
+                agent_name=self.name, status="error",
+                message="batch_generate requires items, each with a prompt.",
+            )
+        contents = self._ai_generate_many([item["prompt"] for item in items])
+
+        def write(pair: Tuple[Dict[str, Any], str]) -> AgentResult:
+            item, content = pair
+            return self._write_output(
+                content, item.get("output_path"),
+                item.get("message", "Document generated."),
+            )
+
+        pairs = list(zip(items, contents))
+        writers = sum(1 for item in items if item.get("output_path"))
+        if writers > 1:
+            # Independent files: overlap their writes instead of
+            # serialising them on the caller's thread.
+            with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, writers)) as pool:
+                results = list(pool.map(write, pairs))
+        else:
+            results = [write(pair) for pair in pairs]
+        return AgentResult(
+            agent_name=self.name,
+            status="success",
+            message=f"Generated {len(results)} document(s).",
+            data={"results": [r.to_dict() for r in results]},
+            actions_taken=["batch_generate"],
         )
 
     # ------------------------------------------------------------------
@@ -185,14 +285,25 @@ class DocumentationAgent(BaseAgent):
     # ------------------------------------------------------------------
 
     def _write_output(
-        self, content: str, output_path: Optional[str], message: str,
+        self,
+        content: str,
+        output_path: Optional[str],
+        message: str,
+        synthetic: Optional[bool] = None,
     ) -> AgentResult:
+        """Return *content* as a result, writing it to *output_path* if given.
+
+        :param synthetic: When not ``None``, reported in ``data`` to tell
+            whether *content* was filled from a template rather than the AI.
+        """
         data: Dict[str, Any] = {"content": content}
+        if synthetic is not None:
+            data["synthetic"] = synthetic
         actions = ["generate_content"]
 
         if output_path:
             path = Path(output_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(path.parent)
             path.write_text(content, encoding="utf-8")
             data["file_path"] = str(path)
             actions.append("write_file")
@@ -203,9 +314,30 @@ class DocumentationAgent(BaseAgent):
             message=message, data=data, actions_taken=actions,
         )
 
+    def _is_trivial(self, text: str) -> bool:
+        """Whether *text* is too short (or the AI too absent) to be worth a call."""
+        return len(text.strip()) < _SYNTHETIC_MAX_CHARS or not self._resolve_ai()
+
+    @staticmethod
+    def _resolve_ai() -> Union[Callable[[List[str]], List[str]], bool]:
+        ask_ai_batch = DocumentationAgent._ask_ai_batch
+        if ask_ai_batch is None:
+            try:
+                from assistant.ai.client import ask_ai_batch
+            except Exception:
+                ask_ai_batch = False
+            DocumentationAgent._ask_ai_batch = ask_ai_batch
+        return ask_ai_batch
+
     def _ai_generate(self, prompt: str) -> str:
-        try:
-            from assistant.ai.client import ask_ai
-            return ask_ai(prompt)
-        except Exception:
-            return f"[AI unavailable] Prompt: {prompt[:200]}…"
+        return self._ai_generate_many([prompt])[0]
+
+    def _ai_generate_many(self, prompts: List[str]) -> List[str]:
+        """Answer *prompts* with one batched AI call (graceful fallback)."""
+        ask_ai_batch = self._resolve_ai()
+        if ask_ai_batch:
+            try:
+                return ask_ai_batch(prompts)
+            except Exception:
+                pass
+        return [f"[AI unavailable] Prompt: {p[:200]}…" for p in prompts]
@@ -8,13 +8,35 @@ structured response following the mandated output format.
 
 from __future__ import annotations
 
+import re
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
 from assistant.core.models import OmniJARVISResponse, Task, TaskStatus
 
+# (keywords, agent, plan action) in plan order.
+_STEP_MAP: Tuple[Tuple[FrozenSet[str], str, str], ...] = (
+    (frozenset({"code", "program", "coder", "génère"}), "code", "Generate / modify code"),
+    (frozenset({"analyse", "analyze", "review"}), "analysis", "Analyse content"),
+    (frozenset({"fichier", "file", "dossier"}), "system", "File system operation"),
+    (frozenset({"souviens", "remember", "note"}), "memory", "Store in memory"),
+    (frozenset({"document", "rapport", "readme"}), "documentation", "Generate documentation"),
+    (frozenset({"message", "email", "meeting"}), "communication", "Handle communication"),
+    (frozenset({"cloud", "backup", "sync"}), "cloud", "Cloud operation"),
+    (frozenset({"routine", "workflow", "automate"}), "productivity", "Automate workflow"),
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+# Most recent tasks kept by ExecutiveAgent; older ones are dropped.
+_TASK_LOG_SIZE = 1024
+# Agents driven in parallel by ExecutiveAgent.execute_plan().
+_PLAN_WORKERS = 10
+
 
 class ExecutiveAgent(BaseAgent):
     """Top-level orchestrator that interprets intent and delegates work.
@@ -24,6 +46,8 @@ class ExecutiveAgent(BaseAgent):
     multi-step requests into sub-tasks.
     """
 
+    __slots__ = ("_task_log", "_task_seq", "_tasks_logged", "_tasks_snapshot")
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(
             name="executive",
@@ -34,21 +58,95 @@ class ExecutiveAgent(BaseAgent):
             required_permissions=[],
             **kwargs,
         )
-        self._task_log: List[Task] = []
+        self._task_log: Deque[Task] = deque(maxlen=_TASK_LOG_SIZE)
+        # Task id → sequence number (count of tasks logged before it).
+        self._task_seq: Dict[str, int] = {}
+        self._tasks_logged = 0
+        # Serialised task log, rebuilt after the log changes.
+        self._tasks_snapshot: Optional[List[Dict[str, Any]]] = None
 
     # ------------------------------------------------------------------
     # BaseAgent interface
     # ------------------------------------------------------------------
 
+    # Resolved ``ask_ai_batch`` callable: ``None`` until first use, ``False``
+    # if the AI client could not be imported.
+    _ask_ai_batch: Union[Callable[[List[str]], List[str]], bool, None] = None
+
     def execute(self, **kwargs: Any) -> AgentResult:
         action = kwargs.get("action")
         if action == "decompose":
             return self._decompose(kwargs.get("request", ""))
         if action == "status":
-            return self._task_status()
+            return self._task_status(
+                kwargs.get("limit"),
+                kwargs.get("offset", 0),
+                kwargs.get("since_id"),
+            )
+        if action == "interpret_many":
+            return self._interpret_many(kwargs.get("messages", []))
         # Default: interpret a raw message
         return self._interpret(kwargs.get("message", kwargs.get("request", "")))
 
+    def execute_plan(
+        self,
+        tasks: List[Task],
+        registry: Dict[str, BaseAgent],
+        max_concurrency: int = _PLAN_WORKERS,
+    ) -> List[AgentResult]:
+        """Run *tasks* on their assigned agents, one thread per agent.
+
+        Tasks for different agents run concurrently; tasks for the same
+        agent run in order on one thread, since agents keep unsynchronised
+        state.  State shared between agents, such as their
+        :class:`~assistant.learning.LearningEngine`, is locked by its owner.
+        Each task's status, result and completion time are updated.
+
+        :param tasks: Tasks, typically from the ``decompose`` action.
+        :param registry: Agent name → agent instance.
+        :param max_concurrency: Maximum number of agents running at once.
+        :return: One result per task, in the order of *tasks*.
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, task in enumerate(tasks):
+            groups.setdefault(task.assigned_agent, []).append(i)
+        results: List[Optional[AgentResult]] = [None] * len(tasks)
+
+        def run_group(agent_name: str) -> None:
+            agent = registry.get(agent_name)
+            for i in groups[agent_name]:
+                task = tasks[i]
+                task.status = TaskStatus.IN_PROGRESS
+                if agent is None:
+                    result = AgentResult(
+                        agent_name=agent_name, status="error",
+                        message=f"No agent registered as '{agent_name}'.",
+                    )
+                else:
+                    try:
+                        result = agent.run(message=task.description)
+                    except Exception as exc:
+                        result = AgentResult(
+                            agent_name=agent_name, status="error",
+                            message=f"Agent '{agent_name}' raised an error: {exc}",
+                        )
+                task.status = (
+                    TaskStatus.COMPLETED if result.status == "success" else TaskStatus.FAILED
+                )
+                task.result = result.to_dict()
+                task.completed_at = iso_now()
+                results[i] = result
+
+        if len(groups) > 1:
+            workers = max(1, min(max_concurrency, len(groups)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(run_group, groups))
+        else:
+            for agent_name in groups:
+                run_group(agent_name)
+        self._tasks_snapshot = None
+        return results  # type: ignore[return-value]
+
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
@@ -77,6 +175,33 @@ class ExecutiveAgent(BaseAgent):
             actions_taken=["interpret_request", "generate_plan"],
         )
 
+    def _interpret_many(self, messages: List[str]) -> AgentResult:
+        """Interpret several messages with one batched AI call."""
+        if not messages:
+            return AgentResult(
+                agent_name=self.name,
+                status="error",
+                message="No messages provided to interpret.",
+            )
+
+        analyses = self._ai_interpret_many(messages)
+        return AgentResult(
+            agent_name=self.name,
+            status="success",
+            message=f"{len(messages)} request(s) interpreted.",
+            data={
+                "interpretations": [
+                    {
+                        "original_request": message,
+                        "interpretation": analysis,
+                        "plan": self._generate_plan(message, analysis),
+                    }
+                    for message, analysis in zip(messages, analyses)
+                ],
+            },
+            actions_taken=["interpret_request", "generate_plan"],
+        )
+
     def _decompose(self, request: str) -> AgentResult:
         """Break a complex request into discrete assignable tasks."""
         if not request:
@@ -87,7 +212,7 @@ class ExecutiveAgent(BaseAgent):
             )
 
         tasks = self._create_tasks(request)
-        self._task_log.extend(tasks)
+        self._log_tasks(tasks)
 
         return AgentResult(
             agent_name=self.name,
@@ -97,14 +222,37 @@ class ExecutiveAgent(BaseAgent):
             actions_taken=["decompose_request"],
         )
 
-    def _task_status(self) -> AgentResult:
-        """Report on all tracked tasks."""
+    def _task_status(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since_id: Optional[str] = None,
+    ) -> AgentResult:
+        """Report on tracked tasks, oldest first.
+
+        :param limit: Maximum number of tasks to return (all when ``None``).
+        :param offset: Number of tasks to skip.
+        :param since_id: Only report tasks logged after this task id.
+        """
+        if since_id is not None:
+            seq = self._task_seq.get(since_id)
+            if seq is None:
+                return AgentResult(
+                    agent_name=self.name,
+                    status="error",
+                    message=f"Unknown task id: {since_id}",
+                )
+            offset += seq + 1 - (self._tasks_logged - len(self._task_log))
+        snapshot = self._tasks_snapshot
+        if snapshot is None:
+            snapshot = self._tasks_snapshot = [t.to_dict() for t in self._task_log]
+        stop = None if limit is None else offset + limit
         return AgentResult(
             agent_name=self.name,
             status="success",
             message=f"Tracking {len(self._task_log)} task(s).",
-            data={"tasks": [t.to_dict() for t in self._task_log]},
-            actions_taken=["report_status"],
+            data={"tasks": snapshot[offset:stop]},
+            actions_taken=("report_status",),
         )
 
     # ------------------------------------------------------------------
@@ -113,38 +261,39 @@ class ExecutiveAgent(BaseAgent):
 
     def _ai_interpret(self, message: str) -> str:
         """Use AI for deeper semantic understanding (graceful fallback)."""
-        try:
-            from assistant.ai.client import ask_ai
-            prompt = (
-                "You are OmniJARVIS, a personal AI assistant. "
-                "Interpret the following user request concisely. "
-                "Identify the intent, required agents, and key actions:\n\n"
-                f"{message}"
-            )
-            return ask_ai(prompt)
-        except Exception:
-            return f"Direct interpretation: {message}"
+        return self._ai_interpret_many([message])[0]
+
+    def _ai_interpret_many(self, messages: List[str]) -> List[str]:
+        """Interpret *messages* with a single batched AI call."""
+        ask_ai_batch = ExecutiveAgent._ask_ai_batch
+        if ask_ai_batch is None:
+            try:
+                from assistant.ai.client import ask_ai_batch
+            except Exception:
+                ask_ai_batch = False
+            ExecutiveAgent._ask_ai_batch = ask_ai_batch
+        if ask_ai_batch:
+            try:
+                return ask_ai_batch([
+                    "You are OmniJARVIS, a personal AI assistant. "
+                    "Interpret the following user request concisely. "
+                    "Identify the intent, required agents, and key actions:\n\n"
+                    f"{message}"
+                    for message in messages
+                ])
+            except Exception:
+                pass
+        return [f"Direct interpretation: {message}" for message in messages]
 
     def _generate_plan(self, message: str, analysis: str) -> List[Dict[str, str]]:
         """Generate a step-by-step execution plan."""
-        msg = message.lower()
-        steps: List[Dict[str, str]] = []
-
-        step_map = [
-            (["code", "program", "coder", "génère"], "code", "Generate / modify code"),
-            (["analyse", "analyze", "review"], "analysis", "Analyse content"),
-            (["fichier", "file", "dossier"], "system", "File system operation"),
-            (["souviens", "remember", "note"], "memory", "Store in memory"),
-            (["document", "rapport", "readme"], "documentation", "Generate documentation"),
-            (["message", "email", "meeting"], "communication", "Handle communication"),
-            (["cloud", "backup", "sync"], "cloud", "Cloud operation"),
-            (["routine", "workflow", "automate"], "productivity", "Automate workflow"),
+        words = set(_WORD_RE.findall(message.lower()))
+        steps: List[Dict[str, str]] = [
+            {"agent": agent, "action": action, "detail": message}
+            for keywords, agent, action in _STEP_MAP
+            if not keywords.isdisjoint(words)
         ]
 
-        for keywords, agent, action in step_map:
-            if any(kw in msg for kw in keywords):
-                steps.append({"agent": agent, "action": action, "detail": message})
-
         if not steps:
             steps.append({
                 "agent": "executive",
@@ -154,6 +303,17 @@ class ExecutiveAgent(BaseAgent):
 
         return steps
 
+    def _log_tasks(self, tasks: List[Task]) -> None:
+        """Append *tasks* to the bounded log, forgetting evicted ids."""
+        log = self._task_log
+        self._tasks_snapshot = None
+        for task in tasks:
+            if len(log) == log.maxlen:
+                self._task_seq.pop(log[0].id, None)
+            log.append(task)
+            self._task_seq[task.id] = self._tasks_logged
+            self._tasks_logged += 1
+
     def _create_tasks(self, request: str) -> List[Task]:
         """Create Task objects from a request."""
         plan = self._generate_plan(request, "")
@@ -1,33 +1,98 @@
+"""
+Focus Agent — Turns the next open task into an AI-assisted action plan.
+
+Reads the first pending item of a Markdown plan (``plans/todo-v1.md`` by
+default), asks the AI for an analysis, and stores the same Markdown report
+in memory and as a log under ``memory/agent-logs/``.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict
+
 from assistant import tasks, memory
+from assistant.agents.base_agent import ensure_dir, utc_strftime
 from assistant.ai.agent import analyze
-from datetime import datetime
-from pathlib import Path
+
+AGENT_LOGS_DIR = Path("memory/agent-logs")
+
 
 class FocusAgent:
-    def run(self):
-        # 1. Trouver la prochaine tâche
-        task = tasks.get_next_task("todo-v1.md")
-        if not task:
-            return {"status": "no_tasks"}
+    """Legacy agent that plans the next pending task.
 
-        title = task["title"]
+    Exposes a single :meth:`run` entry point and is wrapped into an
+    :class:`AgentResult` by the orchestrator.
+
+    :param task_file: Plan file (relative to ``plans/``) to read from.
+    :param prompt: Analysis prompt template; ``{title}`` is replaced with
+        the task title.
+    """
+
+    __slots__ = ("task_file", "prompt")
 
-        # 2. Analyse IA
-        analysis = analyze(f"Analyse cette tâche et propose un plan d'action : {title}")
+    DEFAULT_PROMPT = "Analyse cette tâche et propose un plan d'action : {title}"
 
-        # 3. Générer un plan simple
-        plan = f"Plan généré pour la tâche '{title}':\n{analysis}"
+    def __init__(self, task_file: str = "todo-v1.md", prompt: str = DEFAULT_PROMPT) -> None:
+        self.task_file = task_file
+        self.prompt = prompt
 
-        # 4. Sauvegarder un log
-        log_dir = Path("memory/agent-logs")
-        log_dir.mkdir(parents=True, exist_ok=True)
+    def run(self) -> Dict[str, Any]:
+        """Analyse the next pending task, save the report, and log it.
 
-        log_key = f"focus_agent_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-        memory.save_context(log_key, plan, {"tags": ["agent", "focus"]})
+        :return: ``{"status": "no_tasks"}`` when nothing is pending,
+            otherwise the task title, analysis, memory key and log path.
+        """
+        task = tasks.get_next_task(self.task_file)
+        if not task:
+            return {"status": "no_tasks"}
+
+        title = task["title"]
+        analysis = self.analyze(title)
+
+        body = self._report_body(title, analysis)
+        log_key = self._log_key()
+        memory.save_context(
+            log_key, f"# FocusAgent Report\n\n{body}", {"tags": ["agent", "focus"]},
+        )
+        log_file = self._write_log(log_key, body)
 
         return {
             "status": "done",
             "task": title,
             "analysis": analysis,
-            "memory_key": log_key
+            "memory_key": log_key,
+            "log_file": str(log_file),
         }
+
+    def analyze(self, title: str) -> str:
+        """Ask the AI to analyse *title* using :attr:`prompt`."""
+        return analyze(self.prompt.format(title=title))
+
+    @staticmethod
+    def _log_key() -> str:
+        """Return a memory key / log name unique to the millisecond."""
+        ns = time.time_ns()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime(ns // 1_000_000_000))
+        return f"focus_agent_{stamp}_{ns // 1_000_000 % 1000:03d}"
+
+    @staticmethod
+    def _report_body(title: str, analysis: str) -> str:
+        """Markdown shared by the memory entry and the log file.
+
+        The analysis is the action plan itself, so it is written once.
+        """
+        return f"**Task:** {title}\n\n**Plan:**\n{analysis}\n"
+
+    @staticmethod
+    def _write_log(log_key: str, body: str) -> Path:
+        """Write the Markdown report for one run and return its path."""
+        ensure_dir(AGENT_LOGS_DIR)
+        path = AGENT_LOGS_DIR / f"{log_key}.md"
+        path.write_text(
+            f"# FocusAgent Log — {utc_strftime('%Y-%m-%d %H:%M UTC')}\n\n{body}",
+            encoding="utf-8",
+        )
+        return path
+
+
+__all__ = ["FocusAgent"]
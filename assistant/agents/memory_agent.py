@@ -8,7 +8,7 @@ session summaries.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from assistant.agents.base_agent import BaseAgent, AgentResult
 from assistant.core.memory_store import MemoryStore
@@ -21,6 +21,8 @@ class MemoryAgent(BaseAgent):
     ``delete``.
     """
 
+    __slots__ = ("_store",)
+
     def __init__(self, store: Optional[MemoryStore] = None, **kwargs: Any) -> None:
         super().__init__(
             name="memory",
@@ -38,22 +40,28 @@ class MemoryAgent(BaseAgent):
     # BaseAgent interface
     # ------------------------------------------------------------------
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["MemoryAgent", Dict[str, Any]], AgentResult]] = {
+        "store": lambda self, kw: self._store_note(
+            kw.get("message", ""), kw.get("tags"), kw.get("source", "user"),
+        ),
+        "recall": lambda self, kw: self._recall(kw.get("entry_id")),
+        "search": lambda self, kw: self._search(kw.get("query", kw.get("message", ""))),
+        "list": lambda self, kw: self._list_entries(kw.get("limit", 50), kw.get("tags")),
+        "summarise": lambda self, kw: self._summarise(kw.get("last_n", 10)),
+        "summarize": lambda self, kw: self._summarise(kw.get("last_n", 10)),
+        "delete": lambda self, kw: self._delete(kw.get("entry_id")),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         action = kwargs.get("action")
         message = kwargs.get("message", "")
 
-        if action == "store" or (not action and message):
-            return self._store_note(message, kwargs.get("tags"), kwargs.get("source", "user"))
-        if action == "recall":
-            return self._recall(kwargs.get("entry_id"))
-        if action == "search":
-            return self._search(kwargs.get("query", message))
-        if action == "list":
-            return self._list_entries(kwargs.get("limit", 50), kwargs.get("tags"))
-        if action == "summarise" or action == "summarize":
-            return self._summarise(kwargs.get("last_n", 10))
-        if action == "delete":
-            return self._delete(kwargs.get("entry_id"))
+        handler = self._HANDLERS.get(action) if action else None
+        if handler is not None:
+            return handler(self, kwargs)
+        if not action and message:
+            return self._HANDLERS["store"](self, kwargs)
 
         # Default: treat as a note to store
         if message:
@@ -2,23 +2,72 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import atexit
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import (
+    append_jsonl, load_list, migrate_to_jsonl, save_list,
+)
 
 CONFIG_ROOT = Path("config")
 MEMORY_ROOT = Path("memory")
 DEVICES_FILE = CONFIG_ROOT / "devices.json"
-DEVICE_QUEUE_FILE = MEMORY_ROOT / "device_queue.json"
+DEVICE_QUEUE_FILE = MEMORY_ROOT / "device_queue.jsonl"
 
-VALID_DEVICE_TYPES: List[str] = ["phone", "watch", "glasses", "tablet", "pc", "iot"]
+VALID_DEVICE_TYPES: FrozenSet[str] = frozenset({"phone", "watch", "glasses", "tablet", "pc", "iot"})
+_VALID_DEVICE_TYPES = str(sorted(VALID_DEVICE_TYPES))
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "list_devices", "register_device", "send_to_device", "sync_devices", "device_status",
-]
+})
+_VALID_ACTIONS = str(sorted(_ACTIONS))
+
+# Queue entries not yet written, per absolute queue-file path.  They are
+# group-committed once _QUEUE_BATCH accumulate or _QUEUE_FLUSH_DELAY passes.
+_QUEUE_BUFFER: Dict[str, List[Dict[str, Any]]] = {}
+_QUEUE_TIMER: Optional[threading.Timer] = None
+_QUEUE_BATCH = 64
+_QUEUE_FLUSH_DELAY = 1.0  # seconds
+_QUEUE_LOCK = threading.RLock()
+
+
+def _flush_queue() -> None:
+    """Append all buffered queue entries, one write per queue file.
+
+    A legacy ``device_queue.json`` next to a queue file is migrated into it
+    first, so its entries keep their place ahead of the new ones.
+    """
+    global _QUEUE_TIMER
+    with _QUEUE_LOCK:
+        if _QUEUE_TIMER is not None:
+            _QUEUE_TIMER.cancel()
+            _QUEUE_TIMER = None
+        for path, entries in _QUEUE_BUFFER.items():
+            queue_file = Path(path)
+            migrate_to_jsonl(queue_file.with_suffix(".json"), queue_file, "queue")
+            append_jsonl(queue_file, entries)
+        _QUEUE_BUFFER.clear()
+
+
+atexit.register(_flush_queue)
+
+
+def _enqueue(entry: Dict[str, Any]) -> None:
+    """Buffer *entry* for the device queue file."""
+    global _QUEUE_TIMER
+    with _QUEUE_LOCK:
+        pending = _QUEUE_BUFFER.setdefault(os.path.abspath(DEVICE_QUEUE_FILE), [])
+        pending.append(entry)
+        if sum(len(entries) for entries in _QUEUE_BUFFER.values()) >= _QUEUE_BATCH:
+            _flush_queue()
+        elif _QUEUE_TIMER is None:
+            _QUEUE_TIMER = threading.Timer(_QUEUE_FLUSH_DELAY, _flush_queue)
+            _QUEUE_TIMER.daemon = True
+            _QUEUE_TIMER.start()
 
 
 class MobilityAgent(BaseAgent):
@@ -32,56 +81,53 @@ class MobilityAgent(BaseAgent):
             **kwargs,
         )
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["MobilityAgent", Dict[str, Any]], AgentResult]] = {
+        "list_devices": lambda self, kw: self._list_devices(),
+        "register_device": lambda self, kw: self._register_device(
+            name=kw.get("name", ""), device_type=kw.get("device_type", ""),
+            connection_info=kw.get("connection_info", {})),
+        "send_to_device": lambda self, kw: self._send_to_device(
+            device_name=kw.get("device_name", ""), payload=kw.get("payload", {})),
+        "sync_devices": lambda self, kw: self._sync_devices(),
+        "device_status": lambda self, kw: self._device_status(kw.get("device_name")),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested mobility action."""
         action: Optional[str] = kwargs.get("action")
         if action and action not in _ACTIONS:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Unknown action '{action}'. Valid: {_ACTIONS}")
+            return self._error(f"Unknown action '{action}'. Valid: {_VALID_ACTIONS}")
+        if not action:
+            return self._error("No action specified.")
         try:
-            if action == "list_devices":
-                return self._list_devices()
-            if action == "register_device":
-                return self._register_device(
-                    name=kwargs.get("name", ""), device_type=kwargs.get("device_type", ""),
-                    connection_info=kwargs.get("connection_info", {}))
-            if action == "send_to_device":
-                return self._send_to_device(
-                    device_name=kwargs.get("device_name", ""), payload=kwargs.get("payload", {}))
-            if action == "sync_devices":
-                return self._sync_devices()
-            if action == "device_status":
-                return self._device_status(kwargs.get("device_name"))
-            return AgentResult(agent_name=self.name, status="error", message="No action specified.")
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Mobility agent error: {exc}")
+            return self._error(f"Mobility agent error: {exc}")
 
     def _list_devices(self) -> AgentResult:
         """List all registered devices."""
         devices = self._load_devices()
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Found {len(devices)} registered devices.",
-                           data={"devices": devices}, actions_taken=["list_devices"])
+                           data={"devices": list(devices.values())},
+                           actions_taken=["list_devices"])
 
     def _register_device(self, name: str, device_type: str,
                          connection_info: Dict[str, Any]) -> AgentResult:
         """Add a device to the registry."""
         if not name or not device_type:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="'name' and 'device_type' are required.")
+            return self._error("'name' and 'device_type' are required.")
         if device_type not in VALID_DEVICE_TYPES:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Invalid device type '{device_type}'. Valid: {VALID_DEVICE_TYPES}")
+            return self._error(f"Invalid device type '{device_type}'. Valid: {_VALID_DEVICE_TYPES}")
         devices = self._load_devices()
-        if any(d["name"] == name for d in devices):
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Device '{name}' is already registered.")
+        if name in devices:
+            return self._error(f"Device '{name}' is already registered.")
         device = {
             "name": name, "device_type": device_type, "connection_info": connection_info,
-            "registered_at": datetime.now(timezone.utc).isoformat(), "status": "online",
+            "registered_at": iso_now(), "status": "online",
         }
-        devices.append(device)
+        devices[name] = device
         self._save_devices(devices)
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Device '{name}' ({device_type}) registered.",
@@ -90,19 +136,15 @@ class MobilityAgent(BaseAgent):
     def _send_to_device(self, device_name: str, payload: Dict[str, Any]) -> AgentResult:
         """Queue a payload for a device."""
         if not device_name:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="'device_name' is required.")
+            return self._error("'device_name' is required.")
         devices = self._load_devices()
-        if not any(d["name"] == device_name for d in devices):
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Device '{device_name}' not found.")
-        queue = self._load_queue()
+        if device_name not in devices:
+            return self._error(f"Device '{device_name}' not found.")
         entry = {
             "device_name": device_name, "payload": payload,
-            "queued_at": datetime.now(timezone.utc).isoformat(), "status": "pending",
+            "queued_at": iso_now(), "status": "pending",
         }
-        queue.append(entry)
-        self._save_queue(queue)
+        _enqueue(entry)
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Payload queued for device '{device_name}'.",
                            data=entry, actions_taken=["send_to_device"])
@@ -112,7 +154,7 @@ class MobilityAgent(BaseAgent):
         devices = self._load_devices()
         report: List[Dict[str, str]] = [
             {"name": d["name"], "type": d.get("device_type", "unknown"), "sync_status": "synced"}
-            for d in devices
+            for d in devices.values()
         ]
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Sync complete for {len(report)} devices.",
@@ -122,39 +164,27 @@ class MobilityAgent(BaseAgent):
         """Return status of one or all devices."""
         devices = self._load_devices()
         if device_name:
-            device = next((d for d in devices if d["name"] == device_name), None)
+            device = devices.get(device_name)
             if not device:
-                return AgentResult(agent_name=self.name, status="error",
-                                   message=f"Device '{device_name}' not found.")
+                return self._error(f"Device '{device_name}' not found.")
             return AgentResult(agent_name=self.name, status="success",
                                message=f"Status for device '{device_name}'.",
                                data={"device": device}, actions_taken=["device_status"])
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Status for {len(devices)} devices.",
-                           data={"devices": devices}, actions_taken=["device_status"])
+                           data={"devices": list(devices.values())},
+                           actions_taken=["device_status"])
 
     def _load_json(self, path: Path, key: str) -> List[Dict[str, Any]]:
         """Load a JSON list from *path* under *key*, creating the file if needed."""
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps({key: []}, indent=2), encoding="utf-8")
-        try:
-            return json.loads(path.read_text(encoding="utf-8")).get(key, [])
-        except (json.JSONDecodeError, OSError):
-            return []
+        return load_list(path, key)
 
     def _save_json(self, path: Path, key: str, items: List[Dict[str, Any]]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps({key: items}, indent=2), encoding="utf-8")
-
-    def _load_devices(self) -> List[Dict[str, Any]]:
-        return self._load_json(DEVICES_FILE, "devices")
-
-    def _save_devices(self, devices: List[Dict[str, Any]]) -> None:
-        self._save_json(DEVICES_FILE, "devices", devices)
+        save_list(path, key, items)
 
-    def _load_queue(self) -> List[Dict[str, Any]]:
-        return self._load_json(DEVICE_QUEUE_FILE, "queue")
+    def _load_devices(self) -> Dict[str, Dict[str, Any]]:
+        """Return the registered devices keyed by name."""
+        return {d["name"]: d for d in self._load_json(DEVICES_FILE, "devices")}
 
-    def _save_queue(self, queue: List[Dict[str, Any]]) -> None:
-        self._save_json(DEVICE_QUEUE_FILE, "queue", queue)
+    def _save_devices(self, devices: Dict[str, Dict[str, Any]]) -> None:
+        self._save_json(DEVICES_FILE, "devices", list(devices.values()))
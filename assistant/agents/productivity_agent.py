@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import load_list, save_list
+from assistant.core.serialization import JSONDecodeError, loads
 
 CONFIG_ROOT = Path("config")
 MEMORY_ROOT = Path("memory")
 ROUTINES_FILE = CONFIG_ROOT / "routines.json"
 WORKFLOWS_FILE = CONFIG_ROOT / "workflows.json"
-HISTORY_FILE = MEMORY_ROOT / "interaction_history.json"
+HISTORY_FILE = MEMORY_ROOT / "interaction_history.jsonl"
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "create_routine", "list_routines", "run_routine",
     "create_workflow", "list_workflows", "daily_summary",
-]
+})
+_VALID_ACTIONS = str(sorted(_ACTIONS))
 
 
 class ProductivityAgent(BaseAgent):
@@ -32,46 +33,39 @@ class ProductivityAgent(BaseAgent):
             **kwargs,
         )
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["ProductivityAgent", Dict[str, Any]], AgentResult]] = {
+        "create_routine": lambda self, kw: self._create_routine(
+            name=kw.get("name", ""), steps=kw.get("steps", []),
+            schedule=kw.get("schedule")),
+        "list_routines": lambda self, kw: self._list_routines(),
+        "run_routine": lambda self, kw: self._run_routine(kw.get("name", "")),
+        "create_workflow": lambda self, kw: self._create_workflow(
+            name=kw.get("name", ""), steps=kw.get("steps", []),
+            triggers=kw.get("triggers")),
+        "list_workflows": lambda self, kw: self._list_workflows(),
+        "daily_summary": lambda self, kw: self._daily_summary(),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested productivity action."""
         action: Optional[str] = kwargs.get("action")
         if action and action not in _ACTIONS:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Unknown action '{action}'. Valid: {_ACTIONS}")
+            return self._error(f"Unknown action '{action}'. Valid: {_VALID_ACTIONS}")
+        if not action:
+            return self._error("No action specified.")
         try:
-            if action == "create_routine":
-                return self._create_routine(
-                    name=kwargs.get("name", ""), steps=kwargs.get("steps", []),
-                    schedule=kwargs.get("schedule"))
-            if action == "list_routines":
-                return self._list_routines()
-            if action == "run_routine":
-                return self._run_routine(kwargs.get("name", ""))
-            if action == "create_workflow":
-                return self._create_workflow(
-                    name=kwargs.get("name", ""), steps=kwargs.get("steps", []),
-                    triggers=kwargs.get("triggers"))
-            if action == "list_workflows":
-                return self._list_workflows()
-            if action == "daily_summary":
-                return self._daily_summary()
-            return AgentResult(agent_name=self.name, status="error", message="No action specified.")
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Productivity agent error: {exc}")
+            return self._error(f"Productivity agent error: {exc}")
 
     def _create_routine(self, name: str, steps: List[str],
                         schedule: Optional[str] = None) -> AgentResult:
         """Save a named routine (list of steps)."""
         if not name or not steps:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="'name' and 'steps' are required.")
-        routines = self._load_json(ROUTINES_FILE, "routines")
-        routine = {"name": name, "steps": steps, "schedule": schedule,
-                    "created_at": datetime.now(timezone.utc).isoformat()}
-        routines = [r for r in routines if r.get("name") != name]
-        routines.append(routine)
-        self._save_json(ROUTINES_FILE, "routines", routines)
+            return self._error("'name' and 'steps' are required.")
+        routine = self._upsert(ROUTINES_FILE, "routines",
+                               {"name": name, "steps": steps, "schedule": schedule})
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Routine '{name}' saved with {len(steps)} steps.",
                            data=routine, actions_taken=["create_routine"])
@@ -86,13 +80,11 @@ class ProductivityAgent(BaseAgent):
     def _run_routine(self, name: str) -> AgentResult:
         """Execute a routine step-by-step (dry-run)."""
         if not name:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="Routine 'name' is required.")
+            return self._error("Routine 'name' is required.")
         routines = self._load_json(ROUTINES_FILE, "routines")
         routine = next((r for r in routines if r.get("name") == name), None)
         if not routine:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Routine '{name}' not found.")
+            return self._error(f"Routine '{name}' not found.")
         execution: List[Dict[str, str]] = [
             {"step": idx, "action": step, "status": "would_execute"}
             for idx, step in enumerate(routine.get("steps", []), start=1)
@@ -106,14 +98,9 @@ class ProductivityAgent(BaseAgent):
                          triggers: Optional[List[str]] = None) -> AgentResult:
         """Create a multi-step workflow definition."""
         if not name or not steps:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="'name' and 'steps' are required.")
-        workflows = self._load_json(WORKFLOWS_FILE, "workflows")
-        workflow = {"name": name, "steps": steps, "triggers": triggers or [],
-                     "created_at": datetime.now(timezone.utc).isoformat()}
-        workflows = [w for w in workflows if w.get("name") != name]
-        workflows.append(workflow)
-        self._save_json(WORKFLOWS_FILE, "workflows", workflows)
+            return self._error("'name' and 'steps' are required.")
+        workflow = self._upsert(WORKFLOWS_FILE, "workflows",
+                                {"name": name, "steps": steps, "triggers": triggers or []})
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Workflow '{name}' created with {len(steps)} steps.",
                            data=workflow, actions_taken=["create_workflow"])
@@ -127,36 +114,62 @@ class ProductivityAgent(BaseAgent):
 
     def _daily_summary(self) -> AgentResult:
         """Generate a daily activity summary from interaction history."""
-        today = datetime.now(timezone.utc).date().isoformat()
-        interactions: List[Dict[str, Any]] = []
-        if HISTORY_FILE.exists():
-            try:
-                data = json.loads(HISTORY_FILE.read_text(encoding="utf-8"))
-                interactions = [e for e in data.get("interactions", [])
-                                if e.get("timestamp", "").startswith(today)]
-            except (json.JSONDecodeError, OSError):
-                pass
+        today = iso_now()[:10]
+        marker = today.encode("ascii")
+        total = 0
+        agents_used: Dict[str, None] = {}
+        queries: List[str] = []
+        try:
+            with HISTORY_FILE.open("rb") as fh:
+                for line in fh:
+                    if marker not in line:  # cheap prefilter before parsing
+                        continue
+                    try:
+                        entry = loads(line)
+                    except JSONDecodeError:
+                        continue
+                    if not entry.get("timestamp", "").startswith(today):
+                        continue
+                    total += 1
+                    agents_used[entry.get("agent_used", "unknown")] = None
+                    if len(queries) < 20:
+                        queries.append(entry.get("query", ""))
+        except OSError:
+            pass
         summary = {
-            "date": today, "total_interactions": len(interactions),
-            "agents_used": list({i.get("agent_used", "unknown") for i in interactions}),
-            "queries": [i.get("query", "") for i in interactions[:20]],
+            "date": today, "total_interactions": total,
+            "agents_used": list(agents_used), "queries": queries,
         }
         return AgentResult(agent_name=self.name, status="success",
-                           message=f"Daily summary for {today}: {len(interactions)} interactions.",
+                           message=f"Daily summary for {today}: {total} interactions.",
                            data=summary, actions_taken=["daily_summary"])
 
+    def _upsert(self, path: Path, key: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Store *item* under its name, replacing any entry with that name.
+
+        Re-saving an identical definition is a no-op: the stored entry
+        (with its original ``created_at``) is returned and nothing is written.
+
+        :param path: JSON file holding the list.
+        :param key: Top-level key of the list.
+        :param item: Definition without ``created_at``.
+        """
+        items = self._load_json(path, key)
+        name = item["name"]
+        current = next((i for i in items if i.get("name") == name), None)
+        if current is not None and all(current.get(f) == v for f, v in item.items()):
+            return current
+        item["created_at"] = iso_now()
+        items = [i for i in items if i.get("name") != name]
+        items.append(item)
+        self._save_json(path, key, items)
+        return item
+
     @staticmethod
     def _load_json(path: Path, key: str) -> List[Dict[str, Any]]:
         """Load a JSON list from *path* under *key*, creating the file if needed."""
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps({key: []}, indent=2), encoding="utf-8")
-        try:
-            return json.loads(path.read_text(encoding="utf-8")).get(key, [])
-        except (json.JSONDecodeError, OSError):
-            return []
+        return load_list(path, key)
 
     @staticmethod
     def _save_json(path: Path, key: str, items: List[Dict[str, Any]]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps({key: items}, indent=2), encoding="utf-8")
+        save_list(path, key, items)
@@ -2,27 +2,76 @@
 
 from __future__ import annotations
 
-import json
+import mmap
 import os
+import re
 import stat
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents.base_agent import BaseAgent, AgentResult, iso_now
+from assistant.core.json_files import load_list
 
 CONFIG_ROOT = Path("config")
 MEMORY_ROOT = Path("memory")
 ALERTS_FILE = MEMORY_ROOT / "security_alerts.json"
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "audit_report", "check_permissions", "scan_config", "list_alerts", "security_status",
-]
+})
+_VALID_ACTIONS = str(sorted(_ACTIONS))
 
 _SECRET_PATTERNS: List[str] = [
     "password", "secret", "api_key", "apikey", "token", "private_key",
 ]
 
+# All secret patterns as one case-insensitive byte regex, so each config
+# file is scanned once without decoding or lower-casing it.
+_SECRET_RE = re.compile(
+    b"|".join(re.escape(p.encode("ascii")) for p in _SECRET_PATTERNS), re.IGNORECASE,
+)
+
+
+_CONFIG_SUFFIXES: FrozenSet[str] = frozenset({".json", ".yaml", ".yml"})
+_WORLD_ACCESS = stat.S_IROTH | stat.S_IWOTH
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield the regular files below *root*, recursively.
+
+    Uses :func:`os.scandir`, whose entries answer ``is_file``/``is_dir`` from
+    the directory listing itself.  Symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _find_secret(path: str) -> Optional[str]:
+    """Return the first secret pattern found in *path*, if any.
+
+    The file is memory-mapped rather than read into a string.
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return None  # empty files cannot be mapped
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                match = _SECRET_RE.search(view)
+                found = bytes(match.group()) if match else None
+    return found.lower().decode("ascii") if found else None
+
 
 class SecurityAgent(BaseAgent):
     """Security monitoring and audit logging agent."""
@@ -35,28 +84,26 @@ class SecurityAgent(BaseAgent):
             **kwargs,
         )
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["SecurityAgent", Dict[str, Any]], AgentResult]] = {
+        "audit_report": lambda self, kw: self._audit_report(),
+        "check_permissions": lambda self, kw: self._check_permissions(),
+        "scan_config": lambda self, kw: self._scan_config(),
+        "list_alerts": lambda self, kw: self._list_alerts(),
+        "security_status": lambda self, kw: self._security_status(),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested security action."""
         action: Optional[str] = kwargs.get("action")
         if action and action not in _ACTIONS:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Unknown action '{action}'. Valid: {_ACTIONS}")
+            return self._error(f"Unknown action '{action}'. Valid: {_VALID_ACTIONS}")
+        if not action:
+            return self._error("No action specified.")
         try:
-            if action == "audit_report":
-                return self._audit_report()
-            if action == "check_permissions":
-                return self._check_permissions()
-            if action == "scan_config":
-                return self._scan_config()
-            if action == "list_alerts":
-                return self._list_alerts()
-            if action == "security_status":
-                return self._security_status()
-            return AgentResult(agent_name=self.name, status="error",
-                               message="No action specified.")
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Security agent error: {exc}")
+            return self._error(f"Security agent error: {exc}")
 
     def _audit_report(self) -> AgentResult:
         """Generate an audit report from the permission manager's log."""
@@ -69,7 +116,7 @@ class SecurityAgent(BaseAgent):
             agent_name=self.name, status="success",
             message=f"Audit report: {len(log)} entries.",
             data={"total_entries": len(log), "audit_log": log,
-                   "generated_at": datetime.now(timezone.utc).isoformat()},
+                   "generated_at": iso_now()},
             actions_taken=["audit_report"])
 
     def _check_permissions(self) -> AgentResult:
@@ -90,28 +137,24 @@ class SecurityAgent(BaseAgent):
             return AgentResult(agent_name=self.name, status="success",
                                message="Config directory does not exist — nothing to scan.",
                                data={"issues": []}, actions_taken=["scan_config"])
-        for config_file in CONFIG_ROOT.rglob("*"):
-            if not config_file.is_file():
-                continue
+        for entry in _walk_files(os.fspath(CONFIG_ROOT)):
             try:
-                mode = config_file.stat().st_mode
-                if mode & stat.S_IROTH or mode & stat.S_IWOTH:
-                    issues.append({"file": str(config_file),
+                mode = entry.stat().st_mode
+                if mode & _WORLD_ACCESS:
+                    issues.append({"file": entry.path,
                                    "issue": "world-readable or world-writable",
                                    "severity": "medium"})
             except OSError:
                 pass
-            if config_file.suffix in (".json", ".yaml", ".yml"):
+            if os.path.splitext(entry.name)[1] in _CONFIG_SUFFIXES:
                 try:
-                    content = config_file.read_text(encoding="utf-8").lower()
-                    for pattern in _SECRET_PATTERNS:
-                        if pattern in content:
-                            issues.append({"file": str(config_file),
-                                           "issue": f"Possible exposed secret ('{pattern}' found)",
-                                           "severity": "high"})
-                            break
-                except OSError:
-                    pass
+                    pattern = _find_secret(entry.path)
+                except (OSError, ValueError):
+                    pattern = None
+                if pattern:
+                    issues.append({"file": entry.path,
+                                   "issue": f"Possible exposed secret ('{pattern}' found)",
+                                   "severity": "high"})
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Config scan complete: {len(issues)} issues found.",
                            data={"issues": issues}, actions_taken=["scan_config"])
@@ -125,31 +168,35 @@ class SecurityAgent(BaseAgent):
 
     def _security_status(self) -> AgentResult:
         """Overall security health summary."""
-        alerts = self._load_alerts()
-        open_alerts = [a for a in alerts if a.get("status") != "resolved"]
+        total, open_count, high_open = self._count_alerts()
         perm_count = 0
         if self._permission_manager:
             perm_count = len(self._permission_manager.list_permissions())
         health = "healthy"
-        if open_alerts:
-            high = [a for a in open_alerts if a.get("severity") == "high"]
-            health = "critical" if high else "warning"
+        if open_count:
+            health = "critical" if high_open else "warning"
         summary = {
             "health": health, "active_permissions": perm_count,
-            "open_alerts": len(open_alerts), "total_alerts": len(alerts),
-            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "open_alerts": open_count, "total_alerts": total,
+            "checked_at": iso_now(),
         }
         return AgentResult(agent_name=self.name, status="success",
                            message=f"Security status: {health}.",
                            data=summary, actions_taken=["security_status"])
 
+    @classmethod
+    def _count_alerts(cls) -> Tuple[int, int, int]:
+        """Return ``(total, open, high-severity open)`` alert counts in one pass."""
+        alerts = cls._load_alerts()
+        open_count = high_open = 0
+        for alert in alerts:
+            if alert.get("status") != "resolved":
+                open_count += 1
+                if alert.get("severity") == "high":
+                    high_open += 1
+        return len(alerts), open_count, high_open
+
     @staticmethod
     def _load_alerts() -> List[Dict[str, Any]]:
         """Load security alerts, creating the file if needed."""
-        if not ALERTS_FILE.exists():
-            ALERTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            ALERTS_FILE.write_text(json.dumps({"alerts": []}, indent=2), encoding="utf-8")
-        try:
-            return json.loads(ALERTS_FILE.read_text(encoding="utf-8")).get("alerts", [])
-        except (json.JSONDecodeError, OSError):
-            return []
+        return load_list(ALERTS_FILE, "alerts")
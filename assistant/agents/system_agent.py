@@ -2,19 +2,79 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
+import re
 import shlex
 import shutil
 import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from assistant.agents.base_agent import BaseAgent, AgentResult
 
-_ACTIONS: List[str] = [
+_ACTIONS: FrozenSet[str] = frozenset({
     "list_processes", "system_info", "disk_usage", "open_app", "execute_command",
-]
+})
+_VALID_ACTIONS = str(sorted(_ACTIONS))
+
+_MAX_PROCESSES = 100
+
+# Program name → absolute path, filled by _resolve_executable.
+_EXECUTABLES: Dict[str, str] = {}
+
+# Partition reported by _disk_usage, and its last (monotonic time, data).
+_DISK_ROOT = Path.home().anchor or "/"
+_DISK_USAGE: Optional[Tuple[float, Dict[str, float]]] = None
+_DISK_USAGE_TTL = 1.0  # seconds
+_GIB = 1024 ** 3
+
+# shlex.split only treats these whitespace characters as separators, and
+# only quotes and backslashes change how words are formed.
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'\\]")
+_SHLEX_WORD_RE = re.compile(r"[^ \t\r\n]+")
+
+
+def _split_command(command: str) -> List[str]:
+    """Split *command* like :func:`shlex.split`.
+
+    Commands without quotes or backslashes are split with a precompiled
+    regex instead of constructing a lexer.
+    """
+    if _SHLEX_SPECIAL_RE.search(command):
+        return shlex.split(command)
+    return _SHLEX_WORD_RE.findall(command)
+
+
+@functools.cache
+def _system_snapshot() -> Dict[str, Any]:
+    """Return the process-invariant system facts reported by ``system_info``."""
+    return {
+        "os": platform.system(), "os_release": platform.release(),
+        "architecture": platform.machine(), "hostname": platform.node(),
+        "python_version": sys.version, "cpu_count": os.cpu_count(),
+    }
+
+
+def _resolve_executable(program: str) -> Optional[str]:
+    """Return the absolute path of *program*, caching PATH lookups.
+
+    Names containing a path separator are returned unchanged; programs not
+    found on PATH are not cached, so installing one later is picked up.
+    """
+    if os.sep in program or (os.altsep and os.altsep in program):
+        return program
+    path = _EXECUTABLES.get(program)
+    if path is None or not os.access(path, os.X_OK):
+        path = shutil.which(program)
+        if path is None:
+            _EXECUTABLES.pop(program, None)
+            return None
+        _EXECUTABLES[program] = path
+    return path
 
 
 class SystemAgent(BaseAgent):
@@ -28,80 +88,91 @@ class SystemAgent(BaseAgent):
             **kwargs,
         )
 
+    # Action name → handler taking ``(agent, kwargs)``.
+    _HANDLERS: Dict[str, Callable[["SystemAgent", Dict[str, Any]], AgentResult]] = {
+        "list_processes": lambda self, kw: self._list_processes(),
+        "system_info": lambda self, kw: self._system_info(),
+        "disk_usage": lambda self, kw: self._disk_usage(),
+        "open_app": lambda self, kw: self._open_app(kw.get("app_name", "")),
+        "execute_command": lambda self, kw: self._execute_command(kw.get("command") or ""),
+    }
+
     def execute(self, **kwargs: Any) -> AgentResult:
         """Dispatch to the requested system action."""
         action: Optional[str] = kwargs.get("action")
         command: Optional[str] = kwargs.get("command")
         if action and action not in _ACTIONS:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"Unknown action '{action}'. Valid: {_ACTIONS}")
+            return self._error(f"Unknown action '{action}'. Valid: {_VALID_ACTIONS}")
+        if not action:
+            action = "execute_command" if command else "system_info"
         try:
-            if action == "list_processes":
-                return self._list_processes()
-            if action == "system_info":
-                return self._system_info()
-            if action == "disk_usage":
-                return self._disk_usage()
-            if action == "open_app":
-                return self._open_app(kwargs.get("app_name", ""))
-            if action == "execute_command" or command:
-                return self._execute_command(command or "")
-            return self._system_info()
+            return self._HANDLERS[action](self, kwargs)
         except Exception as exc:
-            return AgentResult(agent_name=self.name, status="error",
-                               message=f"System agent error: {exc}")
+            return self._error(f"System agent error: {exc}")
 
     def _list_processes(self) -> AgentResult:
         """Return running process information (cross-platform)."""
         processes: List[Dict[str, Any]] = []
+        truncated = False
         if platform.system() != "Windows":
-            proc_path = Path("/proc")
-            if proc_path.exists():
-                for entry in proc_path.iterdir():
-                    if entry.name.isdigit():
+            try:
+                with os.scandir("/proc") as it:
+                    for entry in it:
+                        pid = entry.name
+                        if not pid.isdigit():
+                            continue
                         try:
-                            cmdline = (entry / "cmdline").read_text().replace("\x00", " ").strip()
-                            if cmdline:
-                                processes.append({"pid": int(entry.name), "command": cmdline})
-                        except (OSError, PermissionError):
+                            with open(f"/proc/{pid}/cmdline", "rb") as fh:
+                                raw = fh.read()
+                        except OSError:
                             continue
+                        cmdline = raw.replace(b"\x00", b" ").strip()
+                        if cmdline:
+                            if len(processes) == _MAX_PROCESSES:
+                                truncated = True
+                                break
+                            processes.append({"pid": int(pid),
+                                              "command": cmdline.decode("utf-8", "replace")})
+            except OSError:
+                pass
         else:
             processes.append({"note": "Use 'tasklist' via execute_command on Windows."})
-        return AgentResult(agent_name=self.name, status="success",
-                           message=f"Found {len(processes)} processes.",
-                           data={"processes": processes[:100]}, actions_taken=["list_processes"])
+        message = (f"Showing first {len(processes)} processes." if truncated
+                   else f"Found {len(processes)} processes.")
+        return AgentResult(agent_name=self.name, status="success", message=message,
+                           data={"processes": processes, "truncated": truncated},
+                           actions_taken=["list_processes"])
 
     def _system_info(self) -> AgentResult:
         """Return OS, architecture, hostname, and Python version."""
-        import sys
-        info = {
-            "os": platform.system(), "os_release": platform.release(),
-            "architecture": platform.machine(), "hostname": platform.node(),
-            "python_version": sys.version, "cpu_count": os.cpu_count(),
-        }
         return AgentResult(agent_name=self.name, status="success",
                            message="System information retrieved.",
-                           data=info, actions_taken=["system_info"])
+                           data=dict(_system_snapshot()), actions_taken=["system_info"])
 
     def _disk_usage(self) -> AgentResult:
-        """Return disk space information for the root partition."""
-        root = Path.home().anchor or "/"
-        usage = shutil.disk_usage(root)
-        data = {
-            "total_gb": round(usage.total / (1024 ** 3), 2),
-            "used_gb": round(usage.used / (1024 ** 3), 2),
-            "free_gb": round(usage.free / (1024 ** 3), 2),
-            "usage_percent": round(usage.used / usage.total * 100, 1),
-        }
+        """Return disk space information for the root partition.
+
+        Polls closer together than :data:`_DISK_USAGE_TTL` reuse the last
+        reading.
+        """
+        global _DISK_USAGE
+        now = time.monotonic()
+        if _DISK_USAGE is None or now - _DISK_USAGE[0] >= _DISK_USAGE_TTL:
+            usage = shutil.disk_usage(_DISK_ROOT)
+            _DISK_USAGE = (now, {
+                "total_gb": round(usage.total / _GIB, 2),
+                "used_gb": round(usage.used / _GIB, 2),
+                "free_gb": round(usage.free / _GIB, 2),
+                "usage_percent": round(usage.used / usage.total * 100, 1),
+            })
         return AgentResult(agent_name=self.name, status="success",
                            message="Disk usage retrieved.",
-                           data=data, actions_taken=["disk_usage"])
+                           data=dict(_DISK_USAGE[1]), actions_taken=["disk_usage"])
 
     def _open_app(self, app_name: str) -> AgentResult:
         """Return the command that WOULD open an application (placeholder)."""
         if not app_name:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="No application name provided.")
+            return self._error("No application name provided.")
         system = platform.system()
         if system == "Darwin":
             cmd = f"open -a {app_name}"
@@ -117,14 +188,15 @@ class SystemAgent(BaseAgent):
     def _execute_command(self, command: str) -> AgentResult:
         """Run a shell command (shell=False, timeout=30). Requires system.execute permission."""
         if not command:
-            return AgentResult(agent_name=self.name, status="error",
-                               message="No command provided.")
+            return self._error("No command provided.")
         if self._permission_manager and not self._permission_manager.check_permission("system.execute"):
             return AgentResult(agent_name=self.name, status="pending_permission",
                                message="system.execute permission required to run commands.",
                                data={"missing_permissions": ["system.execute"]})
-        cmd_parts = shlex.split(command)
-        result = subprocess.run(cmd_parts, capture_output=True, text=True, timeout=30)
+        cmd_parts = _split_command(command)
+        executable = _resolve_executable(cmd_parts[0]) if cmd_parts else None
+        result = subprocess.run(cmd_parts, executable=executable,
+                                capture_output=True, text=True, timeout=30)
         return AgentResult(
             agent_name=self.name,
             status="success" if result.returncode == 0 else "error",
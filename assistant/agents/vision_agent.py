@@ -3,25 +3,112 @@
 from __future__ import annotations
 
 import base64
+import functools
+import hashlib
 import mimetypes
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.core.serialization import JSONDecodeError, loads
 
-_ACTIONS: List[str] = ["analyze_image", "extract_text", "describe_scene"]
+_ACTIONS: List[str] = ["analyze_image", "extract_text", "describe_scene", "batch_actions"]
 
+_VISION_MODEL = "llama-3.2-90b-vision-preview"
 
-def _groq_available() -> bool:
-    """Return ``True`` if the ``groq`` package can be imported and an API key is set."""
+# Prompt sent for each single-image action.
+_PROMPTS: Dict[str, str] = {
+    "analyze_image": "Analyze this image in detail.",
+    "extract_text": "Extract all visible text from this image. Return only the text.",
+    "describe_scene": "Describe this scene in detail, noting objects, people, and context.",
+}
+
+_BATCH_PROMPT = (
+    "Answer each of the following requests about this image. Reply with only "
+    "a JSON object whose keys are the request names and whose values are the "
+    "answers as strings.\n\n{requests}"
+)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_B64_CHUNK = 3 * 64 * 1024  # a multiple of 3, so chunk encodings concatenate
+
+
+def _parse_batch_reply(reply: str) -> Dict[str, Any]:
+    """Return the JSON object in a batched reply, or ``{}`` if there is none."""
+    match = _JSON_OBJECT_RE.search(reply)
+    if not match:
+        return {}
+    try:
+        parsed = loads(match.group())
+    except JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+class _Image(NamedTuple):
+    """A validated image: its path or URL, size and guessed MIME type."""
+
+    path: str
+    size: Optional[int]  # None for remote URLs
+    mime: Optional[str]
+
+
+@functools.lru_cache(maxsize=64)
+def _mime_for(suffix: str) -> Optional[str]:
+    """Return the MIME type for a lower-cased file *suffix*, if known."""
+    return mimetypes.guess_type(f"image{suffix}")[0]
+
+
+def _is_url(image_path: str) -> bool:
+    """Return ``True`` if *image_path* is a remote ``http(s)`` image URL."""
+    return image_path.startswith(("https://", "http://"))
+
+
+def _encode_image(image_path: str, mime: str, size: Optional[int] = None) -> Tuple[bytes, str]:
+    """Return the SHA-256 digest of an image and its ``data:`` URI.
+
+    The file is read in chunks that are hashed and base64-encoded straight
+    into a buffer sized up front, so the raw image is never held in memory
+    as a whole.
+
+    :param size: File size in bytes, if already known (saves a ``stat``).
+    """
+    prefix = f"data:{mime};base64,".encode("ascii")
+    if size is None:
+        size = os.path.getsize(image_path)
+    buf = bytearray(len(prefix) + (size + 2) // 3 * 4)
+    buf[:len(prefix)] = prefix
+    pos = len(prefix)
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as fh:
+        while chunk := fh.read(_B64_CHUNK):
+            digest.update(chunk)
+            encoded = base64.b64encode(chunk)
+            buf[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    del buf[pos:]
+    return digest.digest(), buf.decode("ascii")
+
+
+@functools.cache
+def _groq_installed() -> bool:
+    """Return ``True`` if the ``groq`` package can be imported (checked once)."""
     try:
         from groq import Groq  # noqa: F401
-        return bool(os.environ.get("GROQ_API_KEY"))
+        return True
     except Exception:
         return False
 
 
+def _groq_available() -> bool:
+    """Return ``True`` if the ``groq`` package can be imported and an API key is set.
+
+    The key is read on every call so that setting or rotating it takes
+    effect without a restart.
+    """
+    return _groq_installed() and bool(os.environ.get("GROQ_API_KEY"))
+
+
 class VisionAgent(BaseAgent):
     """Image analysis and object recognition agent."""
 
@@ -46,46 +133,56 @@ class VisionAgent(BaseAgent):
                 return self._extract_text(kwargs.get("image_path", ""))
             if action == "describe_scene":
                 return self._describe_scene(kwargs.get("image_path", ""))
+            if action == "batch_actions":
+                return self._batch_actions(kwargs.get("image_path", ""),
+                                           kwargs.get("actions") or [])
             return AgentResult(agent_name=self.name, status="error",
                                message="No action specified.")
         except Exception as exc:
             return AgentResult(agent_name=self.name, status="error",
                                message=f"Vision agent error: {exc}")
 
-    def _validate_image(self, image_path: str) -> Optional[AgentResult]:
-        """Return an error result if *image_path* is invalid, else ``None``."""
+    def _validate_image(self, image_path: str) -> Tuple[Optional[AgentResult], Optional[_Image]]:
+        """Return ``(error, None)`` if *image_path* is invalid, else ``(None, image)``.
+
+        A local file is stat'ed once here; its size and MIME type are
+        carried in the returned :class:`_Image` for the request to reuse.
+        """
         if not image_path:
             return AgentResult(agent_name=self.name, status="error",
-                               message="No image path provided.")
-        if not Path(image_path).exists():
+                               message="No image path provided."), None
+        if _is_url(image_path):
+            return None, _Image(image_path, None, None)
+        try:
+            size = os.stat(image_path).st_size
+        except OSError:
             return AgentResult(agent_name=self.name, status="error",
-                               message=f"Image not found: {image_path}")
-        return None
+                               message=f"Image not found: {image_path}"), None
+        return None, _Image(image_path, size, _mime_for(os.path.splitext(image_path)[1].lower()))
 
     def _analyze_image(self, image_path: str) -> AgentResult:
         """Analyse an image using Groq vision or return a placeholder."""
-        err = self._validate_image(image_path)
+        err, image = self._validate_image(image_path)
         if err:
             return err
         if _groq_available():
-            return self._call_vision_api(image_path, "Analyze this image in detail.")
+            return self._call_vision_api(image, _PROMPTS["analyze_image"])
         return AgentResult(
             agent_name=self.name, status="success",
             message="Image analysis placeholder (no AI backend configured).",
             data={"image_path": image_path,
-                   "file_size_bytes": Path(image_path).stat().st_size,
-                   "mime_type": mimetypes.guess_type(image_path)[0],
+                   "file_size_bytes": image.size,
+                   "mime_type": image.mime,
                    "analysis": "AI analysis unavailable — configure GROQ_API_KEY."},
             actions_taken=["analyze_image_placeholder"])
 
     def _extract_text(self, image_path: str) -> AgentResult:
         """Extract text from an image."""
-        err = self._validate_image(image_path)
+        err, image = self._validate_image(image_path)
         if err:
             return err
         if _groq_available():
-            return self._call_vision_api(
-                image_path, "Extract all visible text from this image. Return only the text.")
+            return self._call_vision_api(image, _PROMPTS["extract_text"])
         return AgentResult(
             agent_name=self.name, status="success",
             message="Text extraction placeholder (no AI backend configured).",
@@ -95,12 +192,11 @@ class VisionAgent(BaseAgent):
 
     def _describe_scene(self, image_path: str) -> AgentResult:
         """Describe what is visible in an image."""
-        err = self._validate_image(image_path)
+        err, image = self._validate_image(image_path)
         if err:
             return err
         if _groq_available():
-            return self._call_vision_api(
-                image_path, "Describe this scene in detail, noting objects, people, and context.")
+            return self._call_vision_api(image, _PROMPTS["describe_scene"])
         return AgentResult(
             agent_name=self.name, status="success",
             message="Scene description placeholder (no AI backend configured).",
@@ -108,25 +204,120 @@ class VisionAgent(BaseAgent):
                    "description": "AI scene description unavailable — configure GROQ_API_KEY."},
             actions_taken=["describe_scene_placeholder"])
 
-    def _call_vision_api(self, image_path: str, prompt: str) -> AgentResult:
-        """Send an image to the Groq vision endpoint."""
-        from groq import Groq
-        path = Path(image_path)
-        mime = mimetypes.guess_type(image_path)[0] or "image/png"
-        encoded = base64.b64encode(path.read_bytes()).decode()
-        data_uri = f"data:{mime};base64,{encoded}"
-        client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+    def _batch_actions(self, image_path: str, actions: List[str]) -> AgentResult:
+        """Run several single-image actions on one image with one request.
+
+        Answers already cached for an action are reused.  When more than
+        one is missing, they are asked for together in a single request
+        that sends the image once.  Any answer missing from that reply is
+        fetched on its own, like an individual action call.
+        """
+        unknown = [a for a in actions if a not in _PROMPTS]
+        if not actions or unknown:
+            return AgentResult(agent_name=self.name, status="error",
+                               message=f"'actions' must be a non-empty subset of {list(_PROMPTS)}.")
+        err, image = self._validate_image(image_path)
+        if err:
+            return err
+        actions = list(dict.fromkeys(actions))
+        if not _groq_available():
+            return AgentResult(
+                agent_name=self.name, status="success",
+                message=f"Batch of {len(actions)} vision actions (no AI backend configured).",
+                data={"image_path": image_path,
+                       "results": {a: getattr(self, f"_{a}")(image_path).data for a in actions}},
+                actions_taken=["batch_actions_placeholder"])
+
+        from assistant.ai import cache as ai_cache
+        digest, image_url = self._image_payload(image)
+        keys: Dict[str, Optional[str]] = {
+            a: ai_cache.cache_key(_VISION_MODEL, _PROMPTS[a], attachment=digest)
+            if digest is not None else None
+            for a in actions
+        }
+        results: Dict[str, Optional[str]] = {
+            a: ai_cache.get(k) if k is not None else None for a, k in keys.items()
+        }
+        missing = [a for a in actions if results[a] is None]
+        if len(missing) > 1:
+            requests = "\n".join(f"- {a}: {_PROMPTS[a]}" for a in missing)
+            answers = _parse_batch_reply(
+                self._request(image_url, _BATCH_PROMPT.format(requests=requests)))
+            for a in missing:
+                answer = answers.get(a)
+                if isinstance(answer, str) and answer:
+                    results[a] = answer
+                    if keys[a] is not None:
+                        ai_cache.put(keys[a], answer)
+        for a in actions:
+            if results[a] is None:
+                results[a] = self._ask(image_url, _PROMPTS[a], digest)
+        return AgentResult(
+            agent_name=self.name, status="success",
+            message=f"Vision batch complete ({len(actions)} actions).",
+            data={"image_path": image_path, "results": results, "model": _VISION_MODEL},
+            actions_taken=["vision_batch_call"])
+
+    def _call_vision_api(self, image: _Image, prompt: str) -> AgentResult:
+        """Send an image to the Groq vision endpoint.
+
+        ``http(s)`` URLs are passed through for the API to fetch, so no
+        bytes are base64-inflated into the request.  Responses about local
+        files are cached on the image bytes and prompt, so asking the same
+        question about an unchanged image does not reach the API.
+        """
+        digest, image_url = self._image_payload(image)
+        result_text = self._ask(image_url, prompt, digest)
+        return AgentResult(
+            agent_name=self.name, status="success",
+            message="Vision analysis complete.",
+            data={"image_path": image.path, "result": result_text, "model": _VISION_MODEL},
+            actions_taken=["vision_api_call"])
+
+    @staticmethod
+    def _image_payload(image: _Image) -> Tuple[Optional[bytes], str]:
+        """Return ``(digest, url)`` to send for *image*.
+
+        The digest is ``None`` for remote URLs, whose content may change.
+        """
+        if image.size is None:
+            return None, image.path
+        return _encode_image(image.path, image.mime or "image/png", image.size)
+
+    def _ask(self, image_url: str, prompt: str, digest: Optional[bytes]) -> str:
+        """Answer *prompt* about an image, through the response cache."""
+        from assistant.ai import cache as ai_cache
+        key = None
+        if digest is not None:
+            key = ai_cache.cache_key(_VISION_MODEL, prompt, attachment=digest)
+            cached = ai_cache.get(key)
+            if cached is not None:
+                return cached
+        result_text = self._request(image_url, prompt)
+        if key is not None:
+            ai_cache.put(key, result_text)
+        return result_text
+
+    @staticmethod
+    def _request(image_url: str, prompt: str) -> str:
+        """Send one prompt and image to the Groq vision endpoint.
+
+        Requests are made at ``temperature=0``, so a cached answer is the
+        one the model would give again.
+        """
+        from assistant.ai import ratelimit
+        from assistant.ai.client import get_client
+        client = get_client()
+        limiter = ratelimit.get_limiter()
+        if limiter is not None:
+            limiter.acquire(ratelimit.estimate_tokens(prompt) + 1024)
         response = client.chat.completions.create(
-            model="llama-3.2-90b-vision-preview",
+            model=_VISION_MODEL,
             messages=[{"role": "user", "content": [
                 {"type": "text", "text": prompt},
-                {"type": "image_url", "image_url": {"url": data_uri}},
+                {"type": "image_url", "image_url": {"url": image_url}},
             ]}],
             max_tokens=1024,
+            temperature=0,
         )
-        result_text = response.choices[0].message.content or ""
-        return AgentResult(
-            agent_name=self.name, status="success",
-            message="Vision analysis complete.",
-            data={"image_path": image_path, "result": result_text, "model": "llama-3.2-90b-vision-preview"},
-            actions_taken=["vision_api_call"])
+        return response.choices[0].message.content or ""
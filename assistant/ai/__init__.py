@@ -4,5 +4,8 @@ AI integration module for SignalTrust Assistant.
 Provides AI-powered features using the Groq API.
 """
 
-from assistant.ai.client import ask_ai, load_api_key
+from assistant.ai.client import (
+    ask_ai, ask_ai_async, ask_ai_batch, ask_ai_many, ask_ai_many_async, ask_ai_stream,
+    get_client, load_api_key,
+)
 from assistant.ai.agent import summarize, analyze, generate_code, improve_memory_entry
@@ -0,0 +1,189 @@
+"""
+Response cache for SignalTrust Assistant AI calls.
+
+Two tiers keyed on ``sha256(model, temperature, system, prompt)``: an
+in-process LRU and one JSON file per response under ``memory/ai-cache/``
+that expires after :data:`DEFAULT_TTL` seconds.  Expired files are swept
+from disk when a response is stored, at most every :data:`PRUNE_INTERVAL`
+seconds across processes (the last sweep is recorded as the mtime of a
+stamp file).  Only successful responses are stored.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from assistant.core.serialization import JSONDecodeError, dumps_bytes, loads
+
+CACHE_DIR = Path("memory/ai-cache")
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+MEMORY_SIZE = 512
+PRUNE_INTERVAL = 3600  # seconds between sweeps of expired disk entries
+
+# Cleared by ``--no-cache``: lookups then miss and nothing is stored.
+ENABLED = True
+
+_MEMORY: "OrderedDict[str, str]" = OrderedDict()
+_LOCK = threading.Lock()
+_LAST_PRUNE: Optional[float] = None  # time.monotonic() of the last sweep
+
+
+def cache_key(
+    model: str,
+    prompt: str,
+    system: Optional[str] = None,
+    attachment: Optional[bytes] = None,
+    temperature: float = 0.0,
+) -> str:
+    """
+    Return the hex digest identifying one model request.
+
+    :param attachment: Bytes identifying data sent along with the prompt
+        (e.g. an image or its digest), so requests about different files
+        never share an entry.
+    :param temperature: Sampling temperature of the request; requests at
+        different temperatures never share an entry.
+    """
+    digest = hashlib.sha256(model.encode("utf-8"))
+    digest.update(b"\0" + repr(float(temperature)).encode("ascii"))
+    digest.update(b"\0" + (system or "").encode("utf-8"))
+    digest.update(b"\0" + prompt.encode("utf-8"))
+    if attachment is not None:
+        digest.update(b"\0" + hashlib.sha256(attachment).digest())
+    return digest.hexdigest()
+
+
+def _path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def get(key: str, ttl: float = DEFAULT_TTL) -> Optional[str]:
+    """
+    Look up a cached response.
+
+    :param key: Value from :func:`cache_key`.
+    :param ttl: Maximum age in seconds of an on-disk entry.
+    :return: The response, or ``None`` on a miss.
+    """
+    if not ENABLED:
+        return None
+    with _LOCK:
+        hit = _MEMORY.get(key)
+        if hit is not None:
+            _MEMORY.move_to_end(key)
+            return hit
+    try:
+        record = loads(_path(key).read_bytes())
+    except (OSError, JSONDecodeError):
+        return None
+    if time.time() - record.get("created", 0) > ttl:
+        return None
+    response = record.get("response")
+    if isinstance(response, str):
+        _remember(key, response)
+        return response
+    return None
+
+
+def put(key: str, response: str) -> None:
+    """
+    Store *response* in both tiers.
+
+    :param key: Value from :func:`cache_key`.
+    :param response: Response text to cache.
+    """
+    if not ENABLED:
+        return
+    _remember(key, response)
+    path = _path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps_bytes({"created": time.time(), "response": response}))
+    except OSError:
+        pass  # the disk tier is best-effort
+    _maybe_prune()
+
+
+def prune(ttl: float = DEFAULT_TTL) -> int:
+    """
+    Delete on-disk entries older than *ttl* seconds.
+
+    :return: Number of files removed.
+    """
+    cutoff = time.time() - ttl
+    removed = 0
+    try:
+        buckets = [e for e in os.scandir(CACHE_DIR) if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return 0
+    for bucket in buckets:
+        try:
+            entries = list(os.scandir(bucket.path))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+    return removed
+
+
+def evict(
+    prompt: str,
+    model: str = "llama3-70b-8192",
+    system: Optional[str] = None,
+    temperature: float = 0.0,
+) -> None:
+    """
+    Drop the cached response for *prompt* from both tiers.
+
+    :param prompt: The prompt whose response should be forgotten.
+    :param model: Model the prompt was sent to.
+    :param system: System instructions the prompt was sent with.
+    :param temperature: Sampling temperature the prompt was sent with.
+    """
+    key = cache_key(model, prompt, system, temperature=temperature)
+    with _LOCK:
+        _MEMORY.pop(key, None)
+    _path(key).unlink(missing_ok=True)
+
+
+def clear_memory() -> None:
+    """Empty the in-process tier (the disk tier is left untouched)."""
+    with _LOCK:
+        _MEMORY.clear()
+
+
+def _maybe_prune() -> None:
+    global _LAST_PRUNE
+    now = time.monotonic()
+    with _LOCK:
+        if _LAST_PRUNE is not None and now - _LAST_PRUNE < PRUNE_INTERVAL:
+            return
+        _LAST_PRUNE = now
+    stamp = CACHE_DIR / ".last-prune"
+    try:
+        if time.time() - stamp.stat().st_mtime < PRUNE_INTERVAL:
+            return  # another process swept recently
+    except OSError:
+        pass
+    try:
+        stamp.touch()
+    except OSError:
+        return
+    prune()
+
+
+def _remember(key: str, response: str) -> None:
+    with _LOCK:
+        _MEMORY[key] = response
+        _MEMORY.move_to_end(key)
+        if len(_MEMORY) > MEMORY_SIZE:
+            _MEMORY.popitem(last=False)
@@ -4,10 +4,33 @@ AI client for SignalTrust Assistant.
 Handles communication with the Groq API.
 """
 
+import asyncio
+import atexit
 import os
-from typing import Optional
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional
 
-from groq import Groq, GroqError
+from groq import AsyncGroq, Groq, GroqError
+
+from assistant.ai import cache as ai_cache
+from assistant.ai import ratelimit
+
+_SYSTEM_PROMPT = "You are SignalTrust Assistant, an AI helper for software development."
+
+_BATCH_INSTRUCTIONS = (
+    "Answer each of the following {count} independent requests separately. "
+    "Start every answer with its marker (e.g. [1]) on its own line, in order, "
+    "and do not add any text outside the marked answers."
+)
+_BATCH_MARKER = re.compile(r"^\[(\d+)\][ \t]*\n?", re.MULTILINE)
+
+MAX_CONCURRENCY = 20  # in-flight requests per ask_ai_many call
+
+# One client per API key, so its connection pool (and TLS sessions) are
+# reused across calls.
+_CLIENTS: Dict[str, Groq] = {}
+_CLIENTS_LOCK = threading.Lock()
 
 
 def load_api_key() -> str:
@@ -26,31 +49,312 @@ def load_api_key() -> str:
     return key
 
 
-def ask_ai(prompt: str, model: str = "llama3-70b-8192", temperature: float = 0.7) -> str:
+def get_client() -> Groq:
+    """
+    Return the shared Groq client for the current ``GROQ_API_KEY``.
+
+    :raises RuntimeError: If the environment variable is not set.
+    """
+    api_key = load_api_key()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = Groq(api_key=api_key)
+    return client
+
+
+def close_clients() -> None:
+    """Close and forget every shared client (called at exit)."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_clients)
+
+
+def ask_ai(
+    prompt: str,
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+    cache: Optional[bool] = None,
+) -> str:
     """
     Send a prompt to the Groq API and return the response text.
 
+    Deterministic (``temperature=0``) responses are cached (see
+    :mod:`assistant.ai.cache`), so repeating an identical request does not
+    reach the API.
+
     :param prompt: The user prompt to send.
     :param model: The model to use (default: llama3-70b-8192).
     :param temperature: Sampling temperature (default: 0.7).
+    :param system: Optional fixed instructions appended to the system
+        message.  Keeping constant instructions here, and only the variable
+        content in *prompt*, gives every call the same prompt prefix so
+        the provider can reuse it.
+    :param cache: ``True`` to cache a sampled (``temperature > 0``)
+        response too, ``False`` to bypass the cache.  By default only
+        ``temperature=0`` requests are cached, so sampled calls still get
+        a fresh answer each time.
     :return: The assistant's response text.
     """
-    api_key = load_api_key()
-    client = Groq(api_key=api_key)
+    key = _cache_key(model, prompt, system, temperature, cache)
+    if key is not None:
+        cached = ai_cache.get(key)
+        if cached is not None:
+            return cached
+
+    client = get_client()
+    _throttle(prompt, system)
 
     try:
         response = client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": "You are SignalTrust Assistant, an AI helper for software development."},
-                {"role": "user", "content": prompt},
-            ],
+            messages=_messages(prompt, system),
+            temperature=temperature,
+        )
+    except GroqError as exc:
+        raise RuntimeError(f"Groq API request failed: {exc}") from exc
+
+    content = _content(response)
+    if key is not None:
+        ai_cache.put(key, content)
+    return content
+
+
+def ask_ai_stream(
+    prompt: str,
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+    cache: Optional[bool] = None,
+) -> Iterator[str]:
+    """
+    Like :func:`ask_ai`, but yield the response text as it is generated.
+
+    A cached response is yielded as one piece.  A streamed response is
+    cached only once it has been received completely.
+
+    :return: Iterator over pieces of the response text.
+    """
+    key = _cache_key(model, prompt, system, temperature, cache)
+    if key is not None:
+        cached = ai_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    client = get_client()
+    _throttle(prompt, system)
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=_messages(prompt, system),
+            temperature=temperature,
+            stream=True,
+        )
+        parts: List[str] = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if piece:
+                parts.append(piece)
+                yield piece
+    except GroqError as exc:
+        raise RuntimeError(f"Groq API request failed: {exc}") from exc
+
+    if key is not None:
+        ai_cache.put(key, "".join(parts))
+
+
+def ask_ai_batch(
+    prompts: List[str],
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+) -> List[str]:
+    """
+    Answer several independent prompts with a single Groq request.
+
+    The prompts are numbered ``[1]``, ``[2]``, … in one user message so the
+    system prompt and instructions are sent once, and the reply is split
+    back on those markers.  Any answer missing from the reply is fetched
+    with an individual :func:`ask_ai` call, so the result always lines up
+    with *prompts*.
+
+    :param prompts: The user prompts to answer.
+    :param model: The model to use (default: llama3-70b-8192).
+    :param temperature: Sampling temperature (default: 0.7).
+    :param system: Optional fixed instructions, as for :func:`ask_ai`.
+    :return: One response per prompt, in order.
+    """
+    if len(prompts) <= 1:
+        return [ask_ai(p, model, temperature, system) for p in prompts]
+
+    body = "\n\n".join(f"[{i}] {p}" for i, p in enumerate(prompts, 1))
+    reply = ask_ai(
+        f"{_BATCH_INSTRUCTIONS.format(count=len(prompts))}\n\n{body}",
+        model, temperature, system,
+    )
+
+    answers: Dict[int, str] = {}
+    matches = list(_BATCH_MARKER.finditer(reply))
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(reply)
+        answers.setdefault(int(match.group(1)), reply[match.end():end].strip())
+
+    return [
+        answers.get(i) or ask_ai(p, model, temperature, system)
+        for i, p in enumerate(prompts, 1)
+    ]
+
+
+async def ask_ai_async(
+    prompt: str,
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+    cache: Optional[bool] = None,
+) -> str:
+    """
+    Coroutine version of :func:`ask_ai`, using ``AsyncGroq``.
+
+    Parameters, caching and errors are the same as for :func:`ask_ai`.
+    """
+    key = _cache_key(model, prompt, system, temperature, cache)
+    if key is not None:
+        cached = ai_cache.get(key)
+        if cached is not None:
+            return cached
+
+    client = AsyncGroq(api_key=load_api_key())
+    try:
+        return await _ask_async(client, prompt, model, temperature, system, key)
+    finally:
+        await client.close()
+
+
+async def ask_ai_many_async(
+    prompts: List[str],
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+    concurrency: int = MAX_CONCURRENCY,
+    cache: Optional[bool] = None,
+) -> List[str]:
+    """
+    Send *prompts* as concurrent requests and return their responses.
+
+    Unlike :func:`ask_ai_batch`, every prompt gets its own request, so the
+    answers never depend on splitting a combined reply.  Cached prompts
+    are answered without a request; at most *concurrency* requests are in
+    flight at once, all sharing one client.
+
+    :param prompts: The user prompts to answer.
+    :param model: The model to use (default: llama3-70b-8192).
+    :param temperature: Sampling temperature (default: 0.7).
+    :param system: Optional fixed instructions, as for :func:`ask_ai`.
+    :param concurrency: Maximum number of simultaneous requests.
+    :param cache: Caching policy, as for :func:`ask_ai`.
+    :return: One response per prompt, in order.
+    """
+    keys = [_cache_key(model, p, system, temperature, cache) for p in prompts]
+    results: List[Optional[str]] = [ai_cache.get(k) if k is not None else None for k in keys]
+    pending = [i for i, r in enumerate(results) if r is None]
+    if not pending:
+        return results  # type: ignore[return-value]
+
+    client = AsyncGroq(api_key=load_api_key())
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(i: int) -> None:
+        async with limit:
+            results[i] = await _ask_async(client, prompts[i], model, temperature, system, keys[i])
+
+    try:
+        await asyncio.gather(*(one(i) for i in pending))
+    finally:
+        await client.close()
+    return results  # type: ignore[return-value]
+
+
+def ask_ai_many(
+    prompts: List[str],
+    model: str = "llama3-70b-8192",
+    temperature: float = 0.7,
+    system: Optional[str] = None,
+    concurrency: int = MAX_CONCURRENCY,
+    cache: Optional[bool] = None,
+) -> List[str]:
+    """
+    Blocking wrapper around :func:`ask_ai_many_async`.
+
+    Must not be called from a running event loop; await
+    :func:`ask_ai_many_async` there instead.
+    """
+    return asyncio.run(ask_ai_many_async(
+        prompts, model, temperature, system, concurrency, cache))
+
+
+async def _ask_async(
+    client: AsyncGroq,
+    prompt: str,
+    model: str,
+    temperature: float,
+    system: Optional[str],
+    key: Optional[str],
+) -> str:
+    limiter = ratelimit.get_limiter()
+    if limiter is not None:
+        await limiter.acquire_async(ratelimit.estimate_tokens(_SYSTEM_PROMPT, system, prompt))
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=_messages(prompt, system),
             temperature=temperature,
         )
     except GroqError as exc:
         raise RuntimeError(f"Groq API request failed: {exc}") from exc
 
+    content = _content(response)
+    if key is not None:
+        ai_cache.put(key, content)
+    return content
+
+
+def _cache_key(
+    model: str,
+    prompt: str,
+    system: Optional[str],
+    temperature: float,
+    cache: Optional[bool],
+) -> Optional[str]:
+    """Return the cache key for a request, or ``None`` if it is not cached."""
+    if cache is None:
+        cache = temperature == 0
+    return ai_cache.cache_key(model, prompt, system, temperature=temperature) if cache else None
+
+
+def _throttle(prompt: str, system: Optional[str]) -> None:
+    """Wait for the configured rate limit (if any) before a request."""
+    limiter = ratelimit.get_limiter()
+    if limiter is not None:
+        limiter.acquire(ratelimit.estimate_tokens(_SYSTEM_PROMPT, system, prompt))
+
+
+def _messages(prompt: str, system: Optional[str]) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": f"{_SYSTEM_PROMPT}\n\n{system}" if system else _SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _content(response: Any) -> str:
     if not response.choices:
         raise RuntimeError("Groq API returned an empty response.")
-
     return response.choices[0].message.content or ""
@@ -0,0 +1,117 @@
+"""
+Client-side rate limiting for SignalTrust Assistant AI calls.
+
+A :class:`TokenBucket` holds a requests-per-minute and a tokens-per-minute
+budget that refill continuously.  Every request reserves its share before
+it is sent and waits for the budget to recover if it overdraws it, so a
+burst of calls is spread out at the configured rate instead of running
+into HTTP 429 responses and their retry back-off.
+
+Limits are read from ``SIGNALTRUST_RPM`` and ``SIGNALTRUST_TPM``; when
+neither is set, calls are not throttled.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# Tokens reserved for the reply of a request, which is unknown up front.
+COMPLETION_TOKENS = 256
+
+_BUCKETS: Dict[Tuple[float, float], "TokenBucket"] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    """Requests-per-minute and tokens-per-minute budget.
+
+    Reservations are taken in call order and may drive a budget negative;
+    the caller then sleeps until it is paid back, which keeps throughput
+    at the configured rate without starving large requests.
+
+    Usage::
+
+        bucket = TokenBucket(rpm=30, tpm=6000)
+        bucket.acquire(estimate_tokens(prompt))
+        await bucket.acquire_async(estimate_tokens(prompt))
+
+    :param rpm: Requests per minute (``0`` for no request limit).
+    :param tpm: Tokens per minute (``0`` for no token limit).
+    :param clock: Monotonic time source in seconds.
+    """
+
+    def __init__(self, rpm: float = 0, tpm: float = 0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._rpm = float(rpm)
+        self._tpm = float(tpm)
+        self._clock = clock
+        self._requests = self._rpm
+        self._tokens = self._tpm
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """Take one request and *tokens* from the budget.
+
+        :return: Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            wait = 0.0
+            if self._rpm:
+                self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60) - 1
+                wait = max(wait, -self._requests * 60 / self._rpm)
+            if self._tpm:
+                self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60) - tokens
+                wait = max(wait, -self._tokens * 60 / self._tpm)
+            return wait
+
+    def acquire(self, tokens: int) -> None:
+        """Reserve budget for one request, sleeping until it is available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """Coroutine version of :meth:`acquire`."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """Return a rough token count for a request made of *texts*.
+
+    Uses the usual ~4 characters per token and adds
+    :data:`COMPLETION_TOKENS` for the reply.
+    """
+    return sum(len(t) for t in texts if t) // 4 + COMPLETION_TOKENS
+
+
+def get_limiter() -> Optional[TokenBucket]:
+    """Return the shared bucket for the configured limits, or ``None``.
+
+    :raises RuntimeError: If a limit variable is not a number.
+    """
+    limits = (_limit("SIGNALTRUST_RPM"), _limit("SIGNALTRUST_TPM"))
+    if not any(limits):
+        return None
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(limits)
+        if bucket is None:
+            bucket = _BUCKETS[limits] = TokenBucket(*limits)
+    return bucket
+
+
+def _limit(name: str) -> float:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        raise RuntimeError(f"{name} must be a number, got {value!r}.") from None
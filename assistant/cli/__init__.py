@@ -12,34 +12,37 @@ Usage::
     python -m assistant.cli ai ask "What is Python?"
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+import functools
+import importlib
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from assistant import __version__
 
-from assistant import memory, tasks, scripts, projects, ecosystem
-from assistant.ai import agent as ai_agent
-from assistant.ai.client import ask_ai
-from assistant.agents.focus_agent import FocusAgent
+if TYPE_CHECKING:
+    import argparse
 
 
 def _print(obj: Any, as_json: bool = False) -> None:
     if as_json:
-        print(json.dumps(obj, indent=2, ensure_ascii=False))
+        from assistant.core.serialization import dumps, dumps_bytes
+
+        # Write encoded bytes straight to the binary stream to skip the
+        # str → UTF-8 round-trip that print() would perform.
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            print(dumps(obj, indent=True))
+            return
+        sys.stdout.flush()
+        buffer.write(dumps_bytes(obj, indent=True, newline=True))
+        buffer.flush()
     else:
         print(obj)
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="omnijarvis",
-        description="🧠 OmniJARVIS — L'Assistante Personnelle AI Ultime",
-    )
-    parser.add_argument("--json", action="store_true", help="Output JSON")
-
-    sub = parser.add_subparsers(dest="module", required=True)
-
-    # ── jarvis (natural language) ──────────────────────────────────
+def _build_jarvis(sub: Any) -> None:
     j = sub.add_parser("jarvis", help="Send a natural-language request to OmniJARVIS")
     j.add_argument("message", nargs="?", default="", help="Your request")
     j.add_argument("--agent", help="Force a specific agent")
@@ -48,7 +51,8 @@ def _build_parser() -> argparse.ArgumentParser:
     j.add_argument("--revoke", help="Revoke a permission (action type)")
     j.add_argument("--scope", default="session", choices=["once", "session", "always"])
 
-    # ── agent ──────────────────────────────────────────────────────
+
+def _build_agent(sub: Any) -> None:
     ag = sub.add_parser("agent", help="Manage OmniJARVIS agents")
     ag_sub = ag.add_subparsers(dest="command", required=True)
     ag_sub.add_parser("list", help="List all agents")
@@ -58,7 +62,8 @@ def _build_parser() -> argparse.ArgumentParser:
     ag_focus = ag_sub.add_parser("focus", help="Run FocusAgent")
     ag_focus.add_argument("--file", default="todo-v1.md")
 
-    # ── permissions ────────────────────────────────────────────────
+
+def _build_permissions(sub: Any) -> None:
     perm = sub.add_parser("permissions", help="Manage permissions")
     perm_sub = perm.add_subparsers(dest="command", required=True)
     perm_sub.add_parser("list", help="List active permissions")
@@ -69,7 +74,8 @@ def _build_parser() -> argparse.ArgumentParser:
     pr = perm_sub.add_parser("revoke", help="Revoke a permission")
     pr.add_argument("action")
 
-    # ── memory (legacy) ────────────────────────────────────────────
+
+def _build_memory(sub: Any) -> None:
     mem = sub.add_parser("memory")
     mem_sub = mem.add_subparsers(dest="command", required=True)
     mem_sub.add_parser("list")
@@ -79,7 +85,8 @@ def _build_parser() -> argparse.ArgumentParser:
     ms.add_argument("key")
     ms.add_argument("value")
 
-    # ── tasks (legacy) ─────────────────────────────────────────────
+
+def _build_tasks(sub: Any) -> None:
     tk = sub.add_parser("tasks")
     tk_sub = tk.add_subparsers(dest="command", required=True)
     tl = tk_sub.add_parser("list")
@@ -87,21 +94,24 @@ def _build_parser() -> argparse.ArgumentParser:
     tn = tk_sub.add_parser("next")
     tn.add_argument("--file", default="todo-v1.md")
 
-    # ── scripts (legacy) ──────────────────────────────────────────
+
+def _build_scripts(sub: Any) -> None:
     sc = sub.add_parser("scripts")
     sc_sub = sc.add_subparsers(dest="command", required=True)
     sg = sc_sub.add_parser("generate")
     sg.add_argument("--type", required=True, choices=["powershell", "python", "git", "actions"])
     sg.add_argument("--description", required=True)
 
-    # ── projects (legacy) ─────────────────────────────────────────
+
+def _build_projects(sub: Any) -> None:
     pj = sub.add_parser("projects")
     pj_sub = pj.add_subparsers(dest="command", required=True)
     pj_sub.add_parser("list")
     ps = pj_sub.add_parser("status")
     ps.add_argument("name")
 
-    # ── ecosystem (legacy) ────────────────────────────────────────
+
+def _build_ecosystem(sub: Any) -> None:
     ec = sub.add_parser("ecosystem")
     ec_sub = ec.add_subparsers(dest="command", required=True)
     er = ec_sub.add_parser("repo")
@@ -112,8 +122,11 @@ def _build_parser() -> argparse.ArgumentParser:
     ecc.add_argument("repo")
     ecc.add_argument("--n", type=int, default=10)
 
-    # ── ai (legacy) ───────────────────────────────────────────────
+
+def _build_ai(sub: Any) -> None:
     ai = sub.add_parser("ai")
+    ai.add_argument("--no-cache", action="store_true",
+                    help="Always query the API; do not read or write cached responses")
     ai_sub = ai.add_subparsers(dest="command", required=True)
     aa = ai_sub.add_parser("ask")
     aa.add_argument("prompt")
@@ -127,132 +140,213 @@ def _build_parser() -> argparse.ArgumentParser:
     aim.add_argument("key")
     aim.add_argument("content")
 
+
+# Sub-command name → builder that registers only that command's parser tree.
+_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    "jarvis": _build_jarvis,
+    "agent": _build_agent,
+    "permissions": _build_permissions,
+    "memory": _build_memory,
+    "tasks": _build_tasks,
+    "scripts": _build_scripts,
+    "projects": _build_projects,
+    "ecosystem": _build_ecosystem,
+    "ai": _build_ai,
+}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the top-level sub-command in *argv*, or ``None`` if unknown.
+
+    Only global flags (``--json``, ``-h``) may precede the sub-command, so
+    the first non-flag token is the module name.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _BUILDERS else None
+    return None
+
+
+@functools.cache
+def _build_parser(module: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser (cached, so repeated calls in one process reuse it).
+
+    :param module: When given, only that sub-command's parser tree is
+        registered.  Otherwise every sub-command is registered (needed for
+        top-level ``--help`` and for reporting unknown commands).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="omnijarvis",
+        description="🧠 OmniJARVIS — L'Assistante Personnelle AI Ultime",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    parser.add_argument("-V", "--version", action="version",
+                        version=f"%(prog)s {__version__}")
+
+    sub = parser.add_subparsers(dest="module", required=True)
+    if module in _BUILDERS:
+        _BUILDERS[module](sub)
+    else:
+        for build in _BUILDERS.values():
+            build(sub)
     return parser
 
 
-def main() -> int:
-    parser = _build_parser()
-    args = parser.parse_args()
-    as_json = getattr(args, "json", False)
-
-    # ── OmniJARVIS orchestrator commands ──────────────────────────
-    if args.module == "jarvis":
-        from assistant.orchestrator import OmniJARVIS
-        jarvis = OmniJARVIS()
-
-        # Permission management shortcuts
-        if args.grant:
-            jarvis.grant_permission(args.grant, args.scope)
-            _print({"status": "granted", "action": args.grant, "scope": args.scope}, as_json)
-            return 0
-        if args.revoke:
-            jarvis.revoke_permission(args.revoke)
-            _print({"status": "revoked", "action": args.revoke}, as_json)
-            return 0
-
-        if not args.message:
-            print(f"\n🧠 {jarvis.INIT_MESSAGE}\n")
-            return 0
-
-        # Direct agent call or routed message
-        if args.agent:
-            result = jarvis.handle_direct(args.agent, action=args.action, message=args.message)
-            _print(result.to_dict() if as_json else result.to_dict(), as_json)
+# ── Command handlers ─────────────────────────────────────────────
+# Each handler takes ``(args, as_json)`` and prints its own output.  The
+# subsystem a command needs is imported inside its handler, so a single
+# command does not pay the import cost of every module.
+
+_Handler = Callable[["argparse.Namespace", bool], None]
+
+
+def _mod(name: str) -> Any:
+    """Import ``assistant.<name>`` on first use."""
+    return importlib.import_module(f"assistant.{name}")
+
+
+def _jarvis() -> Any:
+    from assistant.orchestrator import OmniJARVIS
+    return OmniJARVIS()
+
+
+def _permissions() -> Any:
+    """Return a permission manager without loading the orchestrator's agents."""
+    from assistant.permissions import PermissionManager
+    return PermissionManager()
+
+
+def _ai(args: "argparse.Namespace", name: str) -> Any:
+    """Return ``assistant.ai.<name>``, applying ``--no-cache`` first."""
+    _mod("ai.cache").ENABLED = not args.no_cache
+    return _mod(f"ai.{name}")
+
+
+def _cmd_jarvis(args: "argparse.Namespace", as_json: bool) -> None:
+    # Permission management shortcuts
+    if args.grant:
+        _permissions().grant_permission(args.grant, args.scope)
+        _print({"status": "granted", "action": args.grant, "scope": args.scope}, as_json)
+        return
+    if args.revoke:
+        _permissions().revoke_permission(args.revoke)
+        _print({"status": "revoked", "action": args.revoke}, as_json)
+        return
+
+    jarvis = _jarvis()
+
+    if not args.message:
+        print(f"\n🧠 {jarvis.INIT_MESSAGE}\n")
+        return
+
+    # Direct agent call or routed message
+    if args.agent:
+        result = jarvis.handle_direct(args.agent, action=args.action, message=args.message)
+        _print(result.to_dict(), as_json)
+    else:
+        response = jarvis.handle(args.message)
+        if as_json:
+            _print(response.to_dict(), as_json=True)
         else:
-            response = jarvis.handle(args.message)
-            if as_json:
-                _print(response.to_dict(), as_json=True)
-            else:
-                print(response.format_text())
-        return 0
+            print(response.format_text())
 
-    if args.module == "agent":
-        from assistant.orchestrator import OmniJARVIS
-        jarvis = OmniJARVIS()
-
-        if args.command == "list":
-            _print(jarvis.list_agents(), as_json)
-        elif args.command == "status":
-            print(jarvis.session_summary())
-        elif args.command == "stats":
-            _print(jarvis.get_stats(), as_json)
-        elif args.command == "profile":
-            _print(jarvis.get_profile(), as_json)
-        elif args.command == "focus":
-            agent = FocusAgent(task_file=args.file)
-            result = agent.run()
-            _print(result, as_json)
-        return 0
 
-    if args.module == "permissions":
-        from assistant.orchestrator import OmniJARVIS
-        jarvis = OmniJARVIS()
-
-        if args.command == "list":
-            _print(jarvis.list_permissions(), as_json)
-        elif args.command == "audit":
-            _print(jarvis.audit_log(), as_json)
-        elif args.command == "grant":
-            jarvis.grant_permission(args.action, args.scope)
-            _print({"status": "granted", "action": args.action, "scope": args.scope}, as_json)
-        elif args.command == "revoke":
-            jarvis.revoke_permission(args.action)
-            _print({"status": "revoked", "action": args.action}, as_json)
-        return 0
+def _cmd_agent_focus(args: "argparse.Namespace", as_json: bool) -> None:
+    from assistant.agents.focus_agent import FocusAgent
+    _print(FocusAgent(task_file=args.file).run(), as_json)
+
+
+def _cmd_permissions_grant(args: "argparse.Namespace", as_json: bool) -> None:
+    _permissions().grant_permission(args.action, args.scope)
+    _print({"status": "granted", "action": args.action, "scope": args.scope}, as_json)
 
-    # ── Legacy commands ───────────────────────────────────────────
-    if args.module == "memory":
-        if args.command == "list":
-            _print(memory.list_contexts(), as_json)
-        elif args.command == "load":
-            _print(memory.load_context(args.key), as_json)
-        elif args.command == "save":
-            memory.save_context(args.key, args.value)
-            _print({"status": "ok"}, as_json)
-
-    elif args.module == "tasks":
-        if args.command == "list":
-            _print(tasks.list_tasks(args.file), as_json)
-        elif args.command == "next":
-            _print(tasks.get_next_task(args.file), as_json)
-
-    elif args.module == "scripts":
-        if args.command == "generate":
-            if args.type == "powershell":
-                _print(scripts.generate_powershell(args.description), as_json=False)
-            elif args.type == "python":
-                _print(scripts.generate_python(args.description), as_json=False)
-            elif args.type == "git":
-                _print("\n".join(scripts.generate_git_commands(args.description)), as_json=False)
-            elif args.type == "actions":
-                _print(scripts.generate_github_actions(args.description), as_json=False)
-
-    elif args.module == "projects":
-        if args.command == "list":
-            _print(projects.list_projects(), as_json)
-        elif args.command == "status":
-            _print(projects.get_project_status(args.name), as_json)
-
-    elif args.module == "ecosystem":
-        if args.command == "repo":
-            _print(ecosystem.get_repo_info(args.repo), as_json)
-        elif args.command == "issues":
-            _print(ecosystem.list_open_issues(args.repo), as_json)
-        elif args.command == "commits":
-            _print(ecosystem.list_recent_commits(args.repo, args.n), as_json)
-
-    elif args.module == "ai":
-        if args.command == "ask":
-            _print(ask_ai(args.prompt), as_json=False)
-        elif args.command == "summarize":
-            _print(ai_agent.summarize(args.text), as_json=False)
-        elif args.command == "analyze":
-            _print(ai_agent.analyze(args.text), as_json=False)
-        elif args.command == "codegen":
-            _print(ai_agent.generate_code(args.description), as_json=False)
-        elif args.command == "improve-memory":
-            _print(ai_agent.improve_memory_entry(args.key, args.content), as_json=False)
 
+def _cmd_permissions_revoke(args: "argparse.Namespace", as_json: bool) -> None:
+    _permissions().revoke_permission(args.action)
+    _print({"status": "revoked", "action": args.action}, as_json)
+
+
+def _cmd_memory_save(args: "argparse.Namespace", as_json: bool) -> None:
+    _mod("memory").save_context(args.key, args.value)
+    _print({"status": "ok"}, as_json)
+
+
+def _cmd_scripts_generate(args: "argparse.Namespace", as_json: bool) -> None:
+    scripts = _mod("scripts")
+    if args.type == "git":
+        print("\n".join(scripts.generate_git_commands(args.description)))
+    else:
+        print(getattr(scripts, _SCRIPT_GENERATORS[args.type])(args.description))
+
+
+def _cmd_ai_ask(args: "argparse.Namespace", as_json: bool) -> None:
+    # Print the answer as it is generated rather than after the last token.
+    for piece in _ai(args, "client").ask_ai_stream(args.prompt):
+        sys.stdout.write(piece)
+        sys.stdout.flush()
+    sys.stdout.write("\n")
+
+
+# ``scripts generate --type`` value → generator function (git's command
+# list is joined into lines above).
+_SCRIPT_GENERATORS: Dict[str, str] = {
+    "powershell": "generate_powershell",
+    "python": "generate_python",
+    "actions": "generate_github_actions",
+}
+
+# (module, command) → handler; ``jarvis`` has no sub-command.
+_COMMANDS: Dict[Tuple[str, Optional[str]], _Handler] = {
+    ("jarvis", None): _cmd_jarvis,
+    ("agent", "list"): lambda a, j: _print(_jarvis().list_agents(), j),
+    ("agent", "status"): lambda a, j: print(_jarvis().session_summary()),
+    ("agent", "stats"): lambda a, j: _print(_jarvis().get_stats(), j),
+    ("agent", "profile"): lambda a, j: _print(_jarvis().get_profile(), j),
+    ("agent", "focus"): _cmd_agent_focus,
+    ("permissions", "list"): lambda a, j: _print(_permissions().list_permissions(), j),
+    ("permissions", "audit"): lambda a, j: _print(_permissions().audit_log(), j),
+    ("permissions", "grant"): _cmd_permissions_grant,
+    ("permissions", "revoke"): _cmd_permissions_revoke,
+    # ── Legacy commands ───────────────────────────────────────────
+    ("memory", "list"): lambda a, j: _print(_mod("memory").list_contexts(), j),
+    ("memory", "load"): lambda a, j: _print(_mod("memory").load_context(a.key), j),
+    ("memory", "save"): _cmd_memory_save,
+    ("tasks", "list"): lambda a, j: _print(_mod("tasks").list_tasks(a.file), j),
+    ("tasks", "next"): lambda a, j: _print(_mod("tasks").get_next_task(a.file), j),
+    ("scripts", "generate"): _cmd_scripts_generate,
+    ("projects", "list"): lambda a, j: _print(_mod("projects").list_projects(), j),
+    ("projects", "status"): lambda a, j: _print(_mod("projects").get_project_status(a.name), j),
+    ("ecosystem", "repo"): lambda a, j: _print(_mod("ecosystem").get_repo_info(a.repo), j),
+    ("ecosystem", "issues"): lambda a, j: _print(_mod("ecosystem").list_open_issues(a.repo), j),
+    ("ecosystem", "commits"): lambda a, j: _print(
+        _mod("ecosystem").list_recent_commits(a.repo, a.n), j),
+    ("ai", "ask"): _cmd_ai_ask,
+    ("ai", "summarize"): lambda a, j: print(_ai(a, "agent").summarize(a.text)),
+    ("ai", "analyze"): lambda a, j: print(_ai(a, "agent").analyze(a.text)),
+    ("ai", "codegen"): lambda a, j: print(_ai(a, "agent").generate_code(a.description)),
+    ("ai", "improve-memory"): lambda a, j: print(
+        _ai(a, "agent").improve_memory_entry(a.key, a.content)),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the CLI.
+
+    :param argv: Arguments to parse (defaults to ``sys.argv[1:]``).  Passing
+        them explicitly lets a long-lived process (REPL, daemon) call
+        :func:`main` repeatedly while reusing the cached parsers.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    # Fast path: answer --version without building any parser.
+    if argv in (["--version"], ["-V"]):
+        print(f"omnijarvis {__version__}")
+        return 0
+    parser = _build_parser(_sniff_subcommand(argv))
+    args = parser.parse_args(argv)
+    _COMMANDS[(args.module, getattr(args, "command", None))](args, args.json)
     return 0
 
 
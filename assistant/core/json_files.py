@@ -0,0 +1,141 @@
+"""
+OmniJARVIS JSON files — Cached access to ``{key: [...]}`` state files.
+
+Several agents keep their state as a single JSON object holding one list
+(``{"devices": [...]}``, ``{"alerts": [...]}``...).  :func:`load_list`
+parses such a file once and serves later calls from memory until the
+file's mtime or size changes; :func:`save_list` writes through the cache.
+
+Append-only logs use JSON Lines instead (one record per line), so adding
+a record is a single append: see :func:`read_jsonl` and
+:func:`append_jsonl`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from assistant.core.serialization import JSONDecodeError, dumps_bytes, loads
+
+# (abs path, key) → ((mtime_ns, size), parsed list).
+_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+_LOCK = threading.Lock()
+
+
+def load_list(path: Path, key: str) -> List[Dict[str, Any]]:
+    """Return the list stored under *key* in *path*.
+
+    The file is created (holding an empty list) if missing.  Unreadable or
+    malformed files yield an empty list.  Callers get a fresh list they may
+    mutate; the items themselves are shared with the cache.
+
+    :param path: JSON file to read.
+    :param key: Top-level key holding the list.
+    """
+    fspath = os.fspath(path)
+    try:
+        st = os.stat(fspath)
+    except FileNotFoundError:
+        save_list(path, key, [])
+        return []
+    except OSError:
+        return []
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_key = (os.path.abspath(fspath), key)
+    with _LOCK:
+        cached = _CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
+    try:
+        with open(fspath, "rb") as fh:
+            items = loads(fh.read()).get(key, [])
+    except (JSONDecodeError, OSError):
+        return []
+    with _LOCK:
+        _CACHE[cache_key] = (stamp, items)
+    return list(items)
+
+
+def save_list(path: Path, key: str, items: List[Dict[str, Any]]) -> None:
+    """Write *items* under *key* to *path* and refresh the cache.
+
+    The file is replaced atomically, so readers never see a torn write.
+
+    :param path: JSON file to write (parent directories are created).
+    :param key: Top-level key holding the list.
+    :param items: List to store.
+    """
+    _atomic_write(path, dumps_bytes({key: items}, indent=True))
+    st = path.stat()
+    with _LOCK:
+        _CACHE[(os.path.abspath(path), key)] = ((st.st_mtime_ns, st.st_size), list(items))
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Parse one JSON record per line, skipping blank or torn lines.
+
+    :param path: JSON Lines file; a missing file yields an empty list.
+    """
+    records: List[Dict[str, Any]] = []
+    try:
+        with path.open("rb") as fh:
+            for line in fh:
+                if line.strip():
+                    try:
+                        records.append(loads(line))
+                    except JSONDecodeError:
+                        continue
+    except OSError:
+        pass
+    return records
+
+
+def append_jsonl(path: Path, records: Iterable[Dict[str, Any]]) -> None:
+    """Append *records* to *path* as JSON Lines in a single write.
+
+    :param path: JSON Lines file (parent directories are created).
+    :param records: Records to append.
+    """
+    data = b"".join(dumps_bytes(record, newline=True) for record in records)
+    if not data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab") as fh:
+        fh.write(data)
+
+
+def migrate_to_jsonl(legacy: Path, path: Path, key: str) -> None:
+    """Move the ``{key: [...]}`` list in *legacy* to the front of *path*.
+
+    No-op when *legacy* does not exist or cannot be parsed.  The new file
+    is written to a sibling and renamed into place, so an interrupted
+    migration never leaves a truncated log behind.
+
+    :param legacy: Old single-document JSON file (removed on success).
+    :param path: JSON Lines file to migrate into.
+    :param key: Top-level key holding the list in *legacy*.
+    """
+    if not legacy.exists():
+        return
+    try:
+        records = loads(legacy.read_bytes()).get(key, [])
+    except (JSONDecodeError, OSError):
+        return
+    records += read_jsonl(path)
+    _atomic_write(path, b"".join(dumps_bytes(r, newline=True) for r in records))
+    legacy.unlink()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling temporary file and rename it over *path*."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,124 @@
+"""
+OmniJARVIS Memory Index — Token index used to speed up memory search.
+
+Maps every ``\\w+`` token of an item's (lower-cased) text to the items that
+contain it, and every substring of up to :data:`_GRAM` characters of those
+tokens to the tokens containing it.  A query token is matched against the
+vocabulary through that gram index, the matching tokens' postings narrow
+the candidate items, and the exact substring match is confirmed on those
+alone, so results are identical to a linear case-insensitive substring
+scan.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+_GRAM = 3  # longest indexed substring of a token
+
+
+def _grams(token: str) -> Set[str]:
+    """Return every substring of *token* of length 1 to :data:`_GRAM`."""
+    return {
+        token[i:i + n]
+        for n in range(1, min(_GRAM, len(token)) + 1)
+        for i in range(len(token) - n + 1)
+    }
+
+
+class MemoryIndex:
+    """Inverted index over searchable texts.
+
+    Usage::
+
+        index = MemoryIndex()
+        key = index.add("Deploy on Friday", entry)
+        index.search("friday")  # -> [entry]
+        index.remove(key)
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocab: Dict[str, Set[str]] = {}  # gram → tokens containing it
+        self._items: Dict[int, Tuple[str, Any]] = {}
+        self._next_key = 0
+
+    def add(self, text: str, item: Any) -> int:
+        """Index *item* under *text*.
+
+        :return: Key to pass to :meth:`remove`.  Keys grow with each call,
+            so :meth:`search` returns items in insertion order.
+        """
+        key = self._next_key
+        self._next_key += 1
+        text = text.lower()
+        self._items[key] = (text, item)
+        for token in set(_TOKEN_RE.findall(text)):
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                for gram in _grams(token):
+                    self._vocab.setdefault(gram, set()).add(token)
+            keys.add(key)
+        return key
+
+    def remove(self, key: int) -> None:
+        """Drop the item indexed under *key* (no-op if unknown)."""
+        record = self._items.pop(key, None)
+        if record is None:
+            return
+        for token in set(_TOKEN_RE.findall(record[0])):
+            keys = self._postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[token]
+                    for gram in _grams(token):
+                        tokens = self._vocab[gram]
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._vocab[gram]
+
+    def search(self, query: str) -> List[Any]:
+        """Return the items whose text contains *query* (case-insensitive).
+
+        Cost is proportional to the gram-index entries of the query tokens
+        plus the candidate items, not to the size of the vocabulary; only a
+        query without any ``\\w`` character falls back to scanning every
+        item.
+        """
+        q = query.lower()
+        candidates = None
+        # A token of the query is a substring of some token of every match;
+        # the longest tokens are the most selective, so they go first.
+        for token in sorted(set(_TOKEN_RE.findall(q)), key=len, reverse=True):
+            keys: Set[int] = set()
+            for indexed in self._tokens_containing(token):
+                keys |= self._postings[indexed]
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                return []
+        if candidates is None:
+            candidates = self._items.keys()
+        items = self._items
+        return [items[key][1] for key in sorted(candidates) if q in items[key][0]]
+
+    def _tokens_containing(self, token: str) -> Set[str]:
+        """Return the indexed tokens that contain *token* as a substring."""
+        if len(token) <= _GRAM:
+            return self._vocab.get(token, set())
+        # Intersect the token sets of the query's grams, smallest first,
+        # then confirm the full substring on the survivors.
+        sets = sorted(
+            (self._vocab.get(token[i:i + _GRAM], set())
+             for i in range(len(token) - _GRAM + 1)),
+            key=len,
+        )
+        found = set(sets[0])
+        for tokens in sets[1:]:
+            if not found:
+                break
+            found &= tokens
+        return {indexed for indexed in found if token in indexed}
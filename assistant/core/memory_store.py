@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from assistant.core.memory_index import MemoryIndex
 
 MEMORY_ROOT = Path("memory")
 STORE_FILE = MEMORY_ROOT / "omnijarvis_store.json"
@@ -33,6 +34,10 @@ class MemoryStore:
     def __init__(self, store_file: Optional[Path] = None) -> None:
         self._store_file: Path = store_file or STORE_FILE
         self._entries: List[Dict[str, Any]] = self._load()
+        # Search index, built on first search; ``_index_keys`` parallels
+        # ``_entries``.
+        self._index: Optional[MemoryIndex] = None
+        self._index_keys: List[int] = []
 
     # ------------------------------------------------------------------
     # Public API
@@ -59,6 +64,8 @@ class MemoryStore:
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
         self._entries.append(entry)
+        if self._index is not None:
+            self._index_keys.append(self._index.add(self._haystack(entry), entry))
         self._save()
         return entry
 
@@ -85,15 +92,17 @@ class MemoryStore:
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Full-text search across all entry data and tags.
 
+        Served from a :class:`MemoryIndex` built on the first call and kept
+        up to date by :meth:`add_entry` and :meth:`delete_entry`.
+
         :param query: Case-insensitive substring to search for.
         """
-        q = query.lower()
-        results: List[Dict[str, Any]] = []
-        for entry in self._entries:
-            haystack = json.dumps(entry, ensure_ascii=False).lower()
-            if q in haystack:
-                results.append(entry)
-        return results
+        if self._index is None:
+            self._index = MemoryIndex()
+            self._index_keys = [
+                self._index.add(self._haystack(entry), entry) for entry in self._entries
+            ]
+        return self._index.search(query)
 
     def get_entry(self, entry_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve a single entry by its numeric ID."""
@@ -110,6 +119,8 @@ class MemoryStore:
         for i, entry in enumerate(self._entries):
             if entry.get("id") == entry_id:
                 self._entries.pop(i)
+                if self._index is not None:
+                    self._index.remove(self._index_keys.pop(i))
                 self._save()
                 return True
         return False
@@ -131,6 +142,10 @@ class MemoryStore:
             lines.append(f"  • [{tags}] {preview}")
         return "\n".join(lines)
 
+    @staticmethod
+    def _haystack(entry: Dict[str, Any]) -> str:
+        return json.dumps(entry, ensure_ascii=False)
+
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
@@ -139,7 +154,7 @@ class MemoryStore:
         if not self._store_file.exists():
             return []
         try:
-            data = json.loads(self._store_file.read_text(encoding="utf-8"))
+            data = json.loads(self._store_file.read_bytes())
             return data.get("entries", [])
         except (json.JSONDecodeError, OSError):
             return []
@@ -0,0 +1,65 @@
+"""
+OmniJARVIS Serialisation — Fast JSON encode/decode helpers.
+
+Uses :mod:`orjson` when it is installed and falls back to the standard
+library :mod:`json` otherwise, so callers get the fast path without a
+hard dependency.  Output is always UTF-8 (the ``ensure_ascii=False``
+behaviour of the stdlib encoder) and, unless indented, compact.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+# ``orjson.JSONDecodeError`` subclasses the stdlib error, so callers can
+# catch this single type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps_bytes(obj: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 encoded JSON bytes.
+
+    :param obj: JSON-serialisable object.
+    :param indent: Pretty-print with a two-space indent.
+    :param newline: Append a trailing ``\\n``.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = dumps(obj, indent=indent)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialise *obj* to a JSON string.
+
+    :param obj: JSON-serialisable object.
+    :param indent: Pretty-print with a two-space indent.
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    # Match orjson's compact form rather than the stdlib's ", " / ": ".
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from *data* (raw bytes are accepted without decoding).
+
+    :raises JSONDecodeError: If *data* is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,16 +3,20 @@ Adaptive Learning and User Preference System for OmniJARVIS.
 
 Learns from every interaction and adapts behaviour based on user
 preferences, past queries, and satisfaction signals.  All state is
-persisted to JSON files so it survives restarts.
+persisted to disk so it survives restarts: the profile as a JSON file and
+the interaction history as an append-only JSON Lines log.
 """
 
 import json
+import threading
 from collections import Counter
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from assistant.core.json_files import append_jsonl, migrate_to_jsonl, read_jsonl
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -22,7 +26,7 @@ CONFIG_ROOT = Path("config")
 MEMORY_ROOT = Path("memory")
 
 DEFAULT_PROFILE_PATH = CONFIG_ROOT / "user_profile.json"
-DEFAULT_HISTORY_PATH = MEMORY_ROOT / "interaction_history.json"
+DEFAULT_HISTORY_PATH = MEMORY_ROOT / "interaction_history.jsonl"
 
 HIGH_ACTIVITY_THRESHOLD = 20
 
@@ -108,13 +112,16 @@ class LearningEngine:
 
         :param profile_path: Path to the user profile JSON file.
             Defaults to ``config/user_profile.json``.
-        :param history_path: Path to the interaction history JSON file.
-            Defaults to ``memory/interaction_history.json``.
+        :param history_path: Path to the interaction history JSON Lines
+            file.  Defaults to ``memory/interaction_history.jsonl``.
         """
         self._profile_path: Path = profile_path or DEFAULT_PROFILE_PATH
         self._history_path: Path = history_path or DEFAULT_HISTORY_PATH
         self._profile: UserProfile = self._load_profile()
         self._history: List[InteractionRecord] = self._load_history()
+        # Agents run concurrently (see ExecutiveAgent.execute_plan) and share
+        # one engine, so updates to the profile and history are serialised.
+        self._lock = threading.RLock()
 
     # ------------------------------------------------------------------
     # Interaction recording
@@ -144,11 +151,12 @@ class LearningEngine:
             satisfaction=satisfaction,
             tags=tags or [],
         )
-        self._history.append(record)
-        self._profile.interaction_count += 1
-        self._profile.updated_at = datetime.now(timezone.utc).isoformat()
-        self._save_history()
-        self._save_profile()
+        with self._lock:
+            self._history.append(record)
+            self._profile.interaction_count += 1
+            self._profile.updated_at = datetime.now(timezone.utc).isoformat()
+            append_jsonl(self._history_path, [asdict(record)])
+            self._save_profile()
         return record
 
     # ------------------------------------------------------------------
@@ -420,9 +428,7 @@ class LearningEngine:
         if not self._profile_path.exists():
             return UserProfile()
         try:
-            data = json.loads(
-                self._profile_path.read_text(encoding="utf-8")
-            )
+            data = json.loads(self._profile_path.read_bytes())
             return UserProfile(
                 name=data.get("name", "User"),
                 preferences=data.get("preferences", {}),
@@ -441,46 +447,34 @@ class LearningEngine:
 
     def _save_profile(self) -> None:
         """Persist the current user profile to disk."""
-        self._profile_path.parent.mkdir(parents=True, exist_ok=True)
-        self._profile_path.write_text(
-            json.dumps(asdict(self._profile), indent=2),
-            encoding="utf-8",
-        )
+        with self._lock:
+            self._profile_path.parent.mkdir(parents=True, exist_ok=True)
+            self._profile_path.write_text(
+                json.dumps(asdict(self._profile), indent=2),
+                encoding="utf-8",
+            )
 
     def _load_history(self) -> List[InteractionRecord]:
-        """Load interaction history from disk, or return an empty list."""
-        if not self._history_path.exists():
-            return []
-        try:
-            data = json.loads(
-                self._history_path.read_text(encoding="utf-8")
-            )
-            records: List[InteractionRecord] = []
-            for entry in data.get("interactions", []):
-                records.append(
-                    InteractionRecord(
-                        query=entry.get("query", ""),
-                        response_summary=entry.get("response_summary", ""),
-                        agent_used=entry.get("agent_used", "unknown"),
-                        satisfaction=entry.get("satisfaction"),
-                        timestamp=entry.get(
-                            "timestamp",
-                            datetime.now(timezone.utc).isoformat(),
-                        ),
-                        tags=entry.get("tags", []),
-                    )
-                )
-            return records
-        except (json.JSONDecodeError, OSError):
-            return []
+        """Load interaction history from disk, or return an empty list.
 
-    def _save_history(self) -> None:
-        """Persist the full interaction history to disk."""
-        self._history_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "interactions": [asdict(r) for r in self._history],
-        }
-        self._history_path.write_text(
-            json.dumps(payload, indent=2),
-            encoding="utf-8",
-        )
+        A legacy ``{"interactions": [...]}`` file next to a ``.jsonl``
+        history path is migrated into the log first.
+        """
+        if self._history_path.suffix == ".jsonl":
+            migrate_to_jsonl(
+                self._history_path.with_suffix(".json"), self._history_path, "interactions",
+            )
+        return [
+            InteractionRecord(
+                query=entry.get("query", ""),
+                response_summary=entry.get("response_summary", ""),
+                agent_used=entry.get("agent_used", "unknown"),
+                satisfaction=entry.get("satisfaction"),
+                timestamp=entry.get(
+                    "timestamp",
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+                tags=entry.get("tags", []),
+            )
+            for entry in read_jsonl(self._history_path)
+        ]
@@ -17,7 +17,7 @@ INDEX_FILE = MEMORY_ROOT / "index.json"
 def _load_index() -> Dict[str, Any]:
     if not INDEX_FILE.exists():
         return {}
-    return json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+    return json.loads(INDEX_FILE.read_bytes())
 
 
 def _save_index(index: Dict[str, Any]) -> None:
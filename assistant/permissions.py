@@ -157,8 +157,18 @@ class PermissionManager:
         self._session_permissions: Dict[str, str] = {}
         self._audit_trail: List[SecurityAuditEntry] = []
         self._persistent_permissions: Dict[str, str] = {}
+        self._epoch: int = 0
         self._load_persistent_permissions()
 
+    @property
+    def epoch(self) -> int:
+        """Counter bumped whenever a standing permission is granted or revoked.
+
+        Callers may cache permission checks and re-validate only when this
+        value changes.
+        """
+        return self._epoch
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -234,8 +244,10 @@ class PermissionManager:
 
         if permission_scope == PermissionScope.SESSION:
             self._session_permissions[action] = scope
+            self._epoch += 1
         elif permission_scope == PermissionScope.ALWAYS:
             self._persistent_permissions[action] = scope
+            self._epoch += 1
             self._save_persistent_permissions()
 
         self._record_audit(
@@ -270,6 +282,7 @@ class PermissionManager:
         if action in self._persistent_permissions:
             del self._persistent_permissions[action]
             self._save_persistent_permissions()
+        self._epoch += 1
 
         self._record_audit(
             action=action,
@@ -354,9 +367,7 @@ class PermissionManager:
             self._persistent_permissions = {}
             return
         try:
-            data = json.loads(
-                self._permissions_file.read_text(encoding="utf-8")
-            )
+            data = json.loads(self._permissions_file.read_bytes())
             self._persistent_permissions = data.get("permissions", {})
         except (json.JSONDecodeError, OSError):
             self._persistent_permissions = {}
@@ -1 +1,4 @@
-python run.py @args
+# Trim interpreter start-up: load the frozen stdlib and skip the column
+# position tables (PYTHONNODEBUGRANGES).
+$env:PYTHONNODEBUGRANGES = "1"
+python -X frozen_modules=on run.py @args
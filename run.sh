@@ -1,2 +1,5 @@
 #!/bin/bash
-python3 run.py "$@"
+# Trim interpreter start-up: load the frozen stdlib and skip the column
+# position tables (PYTHONNODEBUGRANGES). exec replaces this shell process.
+export PYTHONNODEBUGRANGES=1
+exec python3 -X frozen_modules=on run.py "$@"
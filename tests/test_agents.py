@@ -1,14 +1,38 @@
 """Tests for OmniJARVIS specialized agents."""
 
+import base64
+import hashlib
+import json
+import os
+import shlex
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
 import pytest
 
-from assistant.agents.base_agent import BaseAgent, AgentResult
+from assistant.agents import base_agent
+from assistant.agents.base_agent import BaseAgent, AgentResult, ensure_dir, iso_now, utc_strftime
+from assistant.agents import system_agent
 from assistant.agents.system_agent import SystemAgent
 from assistant.agents.security_agent import SecurityAgent
 from assistant.agents.executive_agent import ExecutiveAgent
 from assistant.agents.memory_agent import MemoryAgent
 from assistant.agents.analysis_agent import AnalysisAgent
 from assistant.agents.documentation_agent import DocumentationAgent
+from assistant.agents.cloud_agent import CloudAgent
+from assistant.agents import mobility_agent
+from assistant.agents.mobility_agent import MobilityAgent
+from assistant.agents.productivity_agent import ProductivityAgent
+from assistant.agents import vision_agent
+from assistant.agents.vision_agent import VisionAgent
+from assistant.agents import executive_agent
+from assistant.agents import code_agent
+from assistant.agents.code_agent import CodeAgent
+from assistant.agents.communication_agent import CommunicationAgent
+from assistant.agents import focus_agent
+from assistant.agents.focus_agent import FocusAgent
 from assistant.core.memory_store import MemoryStore
 from assistant.permissions import PermissionManager
 from assistant.learning import LearningEngine
@@ -27,6 +51,35 @@ def le(tmp_path):
     )
 
 
+class TestAgentResult:
+    def test_timestamp_is_utc_iso(self):
+        parsed = datetime.fromisoformat(AgentResult("a", "success", "ok").timestamp)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert iso_now() <= iso_now()
+
+    def test_utc_strftime(self):
+        stamp = utc_strftime("%Y-%m-%d %H:%M UTC")
+        assert datetime.strptime(stamp, "%Y-%m-%d %H:%M UTC")
+
+    def test_to_dict(self):
+        result = AgentResult(
+            agent_name="a", status="success", message="ok",
+            data={"k": [1, 2]}, actions_taken=["x"],
+        )
+        d = result.to_dict()
+        assert d == {
+            "agent_name": "a", "status": "success", "message": "ok",
+            "data": {"k": [1, 2]}, "actions_taken": ["x"],
+            "timestamp": result.timestamp,
+        }
+        d["actions_taken"].append("y")
+        assert result.actions_taken == ["x"]
+
+    def test_to_dict_lists_tuple_actions(self):
+        result = AgentResult("a", "success", "ok", actions_taken=("x",))
+        assert result.to_dict()["actions_taken"] == ["x"]
+
+
 class TestBaseAgent:
     def test_cannot_instantiate_directly(self):
         with pytest.raises(TypeError):
@@ -46,6 +99,40 @@ class TestBaseAgent:
         result = agent.run()
         assert result.status == "success"
 
+    def test_large_kwargs_are_logged_abbreviated(self, pm, le):
+        class DummyAgent(BaseAgent):
+            def execute(self, **kwargs):
+                return AgentResult(
+                    agent_name=self.name, status="success", message="done"
+                )
+
+        agent = DummyAgent(name="dummy", description="test agent", learning_engine=le)
+        agent.run(action="analyze_code", code="x" * 100_000)
+        query = le.get_interaction_history(limit=1)[0]["query"]
+        assert "analyze_code" in query
+        assert len(query) < 1000
+
+    def test_ensure_dir_creates_each_directory_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(base_agent, "_ENSURED_DIRS", set())
+        target = tmp_path / "a" / "b"
+        ensure_dir(target)
+        assert target.is_dir()
+        target.rmdir()
+        ensure_dir(target)  # memoised: no second mkdir
+        assert not target.exists()
+
+    def test_hot_agents_have_no_instance_dict(self, tmp_path):
+        store = MemoryStore(store_file=tmp_path / "store.json")
+        for agent in (
+            ExecutiveAgent(), MemoryAgent(store=store), DocumentationAgent(), FocusAgent(),
+        ):
+            assert not hasattr(agent, "__dict__")
+
+    def test_error_factory(self):
+        result = MobilityAgent().execute(action="fly")
+        assert (result.agent_name, result.status) == ("mobility", "error")
+        assert "Valid: ['device_status'," in result.message
+
     def test_describe(self, pm, le):
         class DummyAgent(BaseAgent):
             def execute(self, **kwargs):
@@ -73,11 +160,53 @@ class TestSystemAgent:
         result = agent.run(action="disk_usage")
         assert result.status == "success"
 
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+    def test_list_processes_flags_truncation(self, pm, le, monkeypatch):
+        pm.grant_permission("system.execute", scope="session")
+        agent = SystemAgent(permission_manager=pm, learning_engine=le)
+        monkeypatch.setattr(system_agent, "_MAX_PROCESSES", 1_000_000)
+        result = agent.run(action="list_processes")
+        assert result.data["truncated"] is False
+        assert result.message == f"Found {len(result.data['processes'])} processes."
+        monkeypatch.setattr(system_agent, "_MAX_PROCESSES", 0)
+        result = agent.run(action="list_processes")
+        assert (result.data["processes"], result.data["truncated"]) == ([], True)
+        assert result.message == "Showing first 0 processes."
+
+    def test_disk_usage_reuses_recent_reading(self, pm, le, monkeypatch):
+        pm.grant_permission("system.execute", scope="session")
+        agent = SystemAgent(permission_manager=pm, learning_engine=le)
+        agent.run(action="disk_usage")
+        monkeypatch.setattr(system_agent.shutil, "disk_usage",
+                            lambda root: pytest.fail("disk re-polled"))
+        assert agent.run(action="disk_usage").data["total_gb"] > 0
+
     def test_requires_permission(self, pm, le):
         agent = SystemAgent(permission_manager=pm, learning_engine=le)
         result = agent.run(action="system_info")
         assert result.status == "pending_permission"
 
+    def test_revoke_invalidates_cached_check(self, pm, le):
+        pm.grant_permission("system.execute", scope="session")
+        agent = SystemAgent(permission_manager=pm, learning_engine=le)
+        assert agent.run(action="system_info").status == "success"
+        pm.revoke_permission("system.execute")
+        assert agent.run(action="system_info").status == "pending_permission"
+
+    def test_execute_command_caches_executable(self, pm, le):
+        pm.grant_permission("system.execute", scope="session")
+        agent = SystemAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="execute_command", command="echo 'a  b'")
+        assert result.status == "success"
+        assert result.data["stdout"] == "a  b\n"
+        assert system_agent._EXECUTABLES["echo"] == shutil.which("echo")
+
+    @pytest.mark.parametrize("command", [
+        "ls -la  /tmp", "a\tb\x0cc #x", "echo 'a b' \"c\"", "a\\ b", "  ", "",
+    ])
+    def test_split_command_matches_shlex(self, command):
+        assert system_agent._split_command(command) == shlex.split(command)
+
 
 class TestSecurityAgent:
     def test_security_status(self, pm, le):
@@ -85,12 +214,253 @@ class TestSecurityAgent:
         result = agent.run(action="security_status")
         assert result.status == "success"
 
+    def test_security_status_counts_open_alerts(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        alerts = [
+            {"status": "resolved", "severity": "high"},
+            {"status": "open", "severity": "low"},
+            {"severity": "high"},
+        ]
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "security_alerts.json").write_text(
+            json.dumps({"alerts": alerts}), encoding="utf-8")
+        data = SecurityAgent(permission_manager=pm).run(action="security_status").data
+        assert (data["health"], data["open_alerts"], data["total_alerts"]) == ("critical", 2, 3)
+
     def test_check_permissions(self, pm, le):
         pm.grant_permission("file.read", scope="session")
         agent = SecurityAgent(permission_manager=pm, learning_engine=le)
         result = agent.run(action="check_permissions")
         assert result.status == "success"
 
+    def test_scan_config_flags_secrets(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        config = tmp_path / "config"
+        config.mkdir()
+        (config / "app.json").write_text('{"API_KEY": "abc"}', encoding="utf-8")
+        (config / "empty.yaml").write_text("", encoding="utf-8")
+        (config / "notes.txt").write_text("password", encoding="utf-8")
+        (config / "nested").mkdir()
+        (config / "nested" / "db.yml").write_text("Password: x", encoding="utf-8")
+        for f in (*config.iterdir(), config / "nested" / "db.yml"):
+            if f.is_file():
+                f.chmod(0o600)
+        agent = SecurityAgent(permission_manager=pm, learning_engine=le)
+        issues = agent.run(action="scan_config").data["issues"]
+        assert sorted(issues, key=lambda i: i["file"]) == [{
+            "file": str(Path("config") / "app.json"),
+            "issue": "Possible exposed secret ('api_key' found)",
+            "severity": "high",
+        }, {
+            "file": str(Path("config") / "nested" / "db.yml"),
+            "issue": "Possible exposed secret ('password' found)",
+            "severity": "high",
+        }]
+
+    def test_scan_config_flags_world_access(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        config = tmp_path / "config"
+        config.mkdir()
+        for name, mode in (("private.txt", 0o600), ("shared.txt", 0o604), ("open.txt", 0o602)):
+            (config / name).write_text("x", encoding="utf-8")
+            (config / name).chmod(mode)
+        agent = SecurityAgent(permission_manager=pm, learning_engine=le)
+        issues = agent.run(action="scan_config").data["issues"]
+        assert sorted(i["file"] for i in issues) == [
+            str(Path("config") / "open.txt"), str(Path("config") / "shared.txt"),
+        ]
+
+
+class TestVisionAgent:
+    @pytest.fixture
+    def vision(self, pm, le, tmp_path, monkeypatch):
+        """Return ``(agent, fake_client)`` with an isolated response cache."""
+        from assistant.ai import cache as ai_cache
+        from assistant.ai import client as ai_client
+        monkeypatch.setattr(ai_cache, "CACHE_DIR", tmp_path / "ai-cache")
+        monkeypatch.setattr(ai_cache, "_MEMORY", type(ai_cache._MEMORY)())
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        fake = MagicMock()
+        monkeypatch.setattr(ai_client, "get_client", lambda: fake)
+        pm.grant_permission("file.read", scope="session")
+        pm.grant_permission("network.request", scope="session")
+        return VisionAgent(permission_manager=pm, learning_engine=le), fake
+
+    @staticmethod
+    def _replies(fake, *texts):
+        responses = []
+        for text in texts:
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = text
+            responses.append(response)
+        fake.chat.completions.create.side_effect = responses
+
+    def test_repeated_question_about_same_image_is_cached(self, vision, tmp_path):
+        agent, fake = vision
+        self._replies(fake, "a cat", "a dog")
+        image = tmp_path / "cat.png"
+        image.write_bytes(b"\x89PNG fake")
+        for _ in range(2):
+            result = agent.run(action="describe_scene", image_path=str(image))
+            assert result.data["result"] == "a cat"
+        fake.chat.completions.create.assert_called_once()
+        image.write_bytes(b"\x89PNG other")
+        agent.run(action="describe_scene", image_path=str(image))
+        assert fake.chat.completions.create.call_count == 2
+
+    def test_image_url_is_passed_through(self, vision):
+        agent, fake = vision
+        self._replies(fake, "a dog")
+        url = "https://example.com/dog.jpg"
+        result = agent.run(action="analyze_image", image_path=url)
+        assert result.data["result"] == "a dog"
+        content = fake.chat.completions.create.call_args[1]["messages"][0]["content"]
+        assert content[1]["image_url"]["url"] == url
+
+    def test_batch_actions_send_the_image_once(self, vision, tmp_path):
+        agent, fake = vision
+        self._replies(fake, 'Sure: {"extract_text": "EXIT", "describe_scene": "a door"}')
+        image = tmp_path / "door.png"
+        image.write_bytes(b"\x89PNG door")
+        result = agent.run(action="batch_actions", image_path=str(image),
+                           actions=["extract_text", "describe_scene"])
+        assert result.data["results"] == {"extract_text": "EXIT", "describe_scene": "a door"}
+        fake.chat.completions.create.assert_called_once()
+        # Each answer is cached as if asked on its own.
+        assert agent.run(action="extract_text", image_path=str(image)).data["result"] == "EXIT"
+        fake.chat.completions.create.assert_called_once()
+
+    def test_batch_actions_fetch_missing_answers_individually(self, vision, tmp_path):
+        agent, fake = vision
+        self._replies(fake, '{"analyze_image": "busy"}', "nothing legible")
+        image = tmp_path / "x.png"
+        image.write_bytes(b"\x89PNG x")
+        result = agent.run(action="batch_actions", image_path=str(image),
+                           actions=["analyze_image", "extract_text"])
+        assert result.data["results"] == {"analyze_image": "busy",
+                                          "extract_text": "nothing legible"}
+        assert fake.chat.completions.create.call_count == 2
+        bad = agent.run(action="batch_actions", image_path=str(image), actions=["fly"])
+        assert bad.status == "error"
+
+    def test_encode_image_streams_base64(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vision_agent, "_B64_CHUNK", 3)
+        image = tmp_path / "x.png"
+        for payload in (b"", b"abcd", bytes(range(256)) * 3):
+            image.write_bytes(payload)
+            digest, uri = vision_agent._encode_image(str(image), "image/png")
+            assert uri == "data:image/png;base64," + base64.b64encode(payload).decode()
+            assert digest == hashlib.sha256(payload).digest()
+
+    def test_image_is_stated_once_per_request(self, vision, tmp_path, monkeypatch):
+        agent, fake = vision
+        self._replies(fake, "a boat")
+        image = tmp_path / "boat.JPG"
+        image.write_bytes(b"\xff\xd8 boat")
+        stats = []
+        real_stat = os.stat
+        monkeypatch.setattr(vision_agent.os, "stat",
+                            lambda p, *a, **k: stats.append(p) or real_stat(p, *a, **k))
+        monkeypatch.setattr(vision_agent.os.path, "getsize", MagicMock(side_effect=AssertionError))
+        agent.run(action="describe_scene", image_path=str(image))
+        assert stats.count(str(image)) == 1
+        content = fake.chat.completions.create.call_args[1]["messages"][0]["content"]
+        assert content[1]["image_url"]["url"].startswith("data:image/jpeg;base64,")
+
+
+class TestMobilityAgent:
+    def test_register_and_list_devices(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("network.request", scope="session")
+        agent = MobilityAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="register_device", name="Pixel", device_type="phone")
+        assert result.status == "success"
+        devices = agent.run(action="list_devices").data["devices"]
+        assert [d["name"] for d in devices] == ["Pixel"]
+        saved = json.loads((tmp_path / "config" / "devices.json").read_text(encoding="utf-8"))
+        assert saved["devices"][0]["device_type"] == "phone"
+
+    def test_device_lookup_by_name(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("network.request", scope="session")
+        agent = MobilityAgent(permission_manager=pm, learning_engine=le)
+        agent.run(action="register_device", name="Pixel", device_type="phone")
+        agent.run(action="register_device", name="Watch", device_type="watch")
+        dup = agent.run(action="register_device", name="Pixel", device_type="tablet")
+        assert dup.status == "error"
+        status = agent.run(action="device_status", device_name="Watch")
+        assert status.data["device"]["device_type"] == "watch"
+        assert agent.run(action="device_status", device_name="Nope").status == "error"
+
+    def test_send_to_device_group_commits_queue(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(mobility_agent, "_QUEUE_FLUSH_DELAY", 60)
+        monkeypatch.setattr(mobility_agent, "_QUEUE_BATCH", 3)
+        pm.grant_permission("network.request", scope="session")
+        agent = MobilityAgent(permission_manager=pm, learning_engine=le)
+        agent.run(action="register_device", name="Pixel", device_type="phone")
+        queue_file = tmp_path / "memory" / "device_queue.jsonl"
+        legacy = tmp_path / "memory" / "device_queue.json"
+        legacy.parent.mkdir(exist_ok=True)
+        legacy.write_text(json.dumps({"queue": [{"payload": {"n": -1}}]}), encoding="utf-8")
+
+        for i in range(2):
+            assert agent.run(action="send_to_device", device_name="Pixel",
+                             payload={"n": i}).status == "success"
+        assert not queue_file.exists()
+
+        for i in range(3):
+            agent.run(action="send_to_device", device_name="Pixel", payload={"n": i})
+        lines = queue_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["payload"]["n"] for line in lines] == [-1, 0, 1, 0]
+        assert not legacy.exists()
+        mobility_agent._flush_queue()
+        lines = queue_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 6
+
+
+class TestProductivityAgent:
+    def test_create_and_run_routine(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("system.execute", scope="session")
+        pm.grant_permission("file.modify", scope="session")
+        agent = ProductivityAgent(permission_manager=pm, learning_engine=le)
+        agent.run(action="create_routine", name="morning", steps=["news", "mail"])
+        result = agent.run(action="run_routine", name="morning")
+        assert result.status == "success"
+        assert len(result.data["execution"]) == 2
+
+    def test_unchanged_routine_is_not_rewritten(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("system.execute", scope="session")
+        pm.grant_permission("file.modify", scope="session")
+        agent = ProductivityAgent(permission_manager=pm, learning_engine=le)
+        first = agent.run(action="create_routine", name="m", steps=["a"]).data
+        saves = []
+        monkeypatch.setattr(ProductivityAgent, "_save_json",
+                            staticmethod(lambda *args: saves.append(args)))
+        again = agent.run(action="create_routine", name="m", steps=["a"]).data
+        assert again["created_at"] == first["created_at"]
+        assert saves == []
+        agent.run(action="create_routine", name="m", steps=["a", "b"])
+        assert [r["steps"] for r in saves[0][2]] == [["a", "b"]]
+
+    def test_daily_summary_reads_history_log(self, pm, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("system.execute", scope="session")
+        pm.grant_permission("file.modify", scope="session")
+        engine = LearningEngine(profile_path=tmp_path / "profile.json")
+        engine.record_interaction("hello", "hi", "system")
+        engine.record_interaction("deploy", "ok", "code")
+        with (tmp_path / "memory" / "interaction_history.jsonl").open("a") as fh:
+            fh.write('{"timestamp": "1999-01-01T00:00:00", "query": "old"}\n')
+
+        agent = ProductivityAgent(permission_manager=pm)
+        summary = agent.run(action="daily_summary").data
+        assert summary["total_interactions"] == 2
+        assert sorted(summary["agents_used"]) == ["code", "system"]
+
 
 class TestExecutiveAgent:
     def test_interpret(self, pm, le):
@@ -105,11 +475,88 @@ class TestExecutiveAgent:
         assert result.status == "success"
         assert "tasks" in result.data
 
+    def test_plan_matches_whole_keywords_in_step_order(self):
+        agent = ExecutiveAgent()
+        plan = agent._generate_plan("Backup the FILE, then write a README", "")
+        assert [step["agent"] for step in plan] == ["system", "documentation", "cloud"]
+        assert agent._generate_plan("decoded notebook", "")[0]["agent"] == "executive"
+
     def test_status(self, pm, le):
         agent = ExecutiveAgent(permission_manager=pm, learning_engine=le)
         result = agent.run(action="status")
         assert result.status == "success"
 
+    def test_status_is_bounded_and_paginated(self, monkeypatch):
+        monkeypatch.setattr(executive_agent, "_TASK_LOG_SIZE", 3)
+        agent = ExecutiveAgent()
+        ids = [
+            agent.run(action="decompose", request=f"step {i}").data["tasks"][0]["id"]
+            for i in range(5)
+        ]
+        tasks = agent.run(action="status").data["tasks"]
+        assert [t["id"] for t in tasks] == ids[2:]
+        page = agent.run(action="status", limit=1, offset=1).data["tasks"]
+        assert [t["id"] for t in page] == [ids[3]]
+        newer = agent.run(action="status", since_id=ids[2]).data["tasks"]
+        assert [t["id"] for t in newer] == ids[3:]
+        assert agent.run(action="status", since_id=ids[0]).status == "error"
+
+    def test_execute_plan_runs_agents_concurrently(self):
+        import threading
+
+        from assistant.core.models import Task, TaskStatus
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingAgent(BaseAgent):
+            def execute(self, **kwargs):
+                barrier.wait()  # both agents must be running at once
+                return AgentResult(self.name, "success", kwargs["message"])
+
+        registry = {
+            name: WaitingAgent(name=name, description="test") for name in ("a", "b")
+        }
+        tasks = [
+            Task(id="1", description="first", assigned_agent="a"),
+            Task(id="2", description="second", assigned_agent="b"),
+            Task(id="3", description="third", assigned_agent="missing"),
+        ]
+        results = ExecutiveAgent().execute_plan(tasks, registry)
+        assert [r.message for r in results[:2]] == ["first", "second"]
+        assert results[2].status == "error"
+        assert [t.status for t in tasks] == [
+            TaskStatus.COMPLETED, TaskStatus.COMPLETED, TaskStatus.FAILED,
+        ]
+
+    def test_execute_plan_agents_share_one_learning_engine(self, le, tmp_path):
+        from assistant.core.models import Task
+
+        class EchoAgent(BaseAgent):
+            def execute(self, **kwargs):
+                return AgentResult(self.name, "success", kwargs["message"])
+
+        registry = {
+            name: EchoAgent(name=name, description="test", learning_engine=le)
+            for name in ("a", "b", "c")
+        }
+        tasks = [
+            Task(id=str(i), description=f"task {i}", assigned_agent="abc"[i % 3])
+            for i in range(60)
+        ]
+        ExecutiveAgent().execute_plan(tasks, registry)
+        assert le.get_profile()["interaction_count"] == 60
+        profile = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+        assert profile["interaction_count"] == 60
+        assert len(le.get_interaction_history(limit=100)) == 60
+
+    def test_status_snapshot_is_reused_until_decompose(self):
+        agent = ExecutiveAgent()
+        agent.run(action="decompose", request="write a readme")
+        first = agent.run(action="status").data["tasks"]
+        assert agent.run(action="status").data["tasks"][0] is first[0]
+        agent.run(action="decompose", request="backup files")
+        assert len(agent.run(action="status").data["tasks"]) == 2
+
 
 class TestMemoryAgent:
     def test_store_note(self, pm, le, tmp_path):
@@ -137,6 +584,28 @@ class TestAnalysisAgent:
         result = agent.run(action="analyze_text", message="The system is performing well")
         assert result.status == "success"
 
+    def test_analyze_file_reads_bounded_prefix(self, pm, le, tmp_path):
+        pm.grant_permission("file.read", scope="session")
+        big = tmp_path / "big.log"
+        big.write_text("é" * 50_000, encoding="utf-8")
+        agent = AnalysisAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="analyze_file", file_path=str(big))
+        assert result.status == "success"
+        assert result.data["file_size"] == 100_000
+        assert result.data["analyzed_chars"] == 8000
+
+    def test_batch(self, pm, le):
+        pm.grant_permission("file.read", scope="session")
+        agent = AnalysisAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="batch", requests=[
+            {"action": "analyze_text", "message": "first"},
+            {"action": "compare", "text_a": "a", "text_b": "b"},
+        ])
+        assert result.status == "success"
+        assert [r["actions_taken"] for r in result.data["results"]] == [
+            ["analyze_text"], ["compare_texts"],
+        ]
+
 
 class TestDocumentationAgent:
     def test_session_summary(self, pm, le):
@@ -147,3 +616,285 @@ class TestDocumentationAgent:
         ])
         assert result.status == "success"
         assert "summary" in result.data
+
+    def test_batch_generate(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        pm.grant_permission("file.modify", scope="session")
+        agent = DocumentationAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="batch_generate", items=[
+            {"prompt": "Write a FAQ"},
+            {"prompt": "Write a guide", "output_path": str(tmp_path / "guide.md")},
+            {"prompt": "Write notes", "output_path": str(tmp_path / "n" / "notes.md")},
+        ])
+        assert result.status == "success"
+        docs = result.data["results"]
+        assert docs[0]["data"]["content"].startswith("[AI unavailable]")
+        assert (tmp_path / "guide.md").exists()
+        assert docs[2]["data"]["file_path"] == str(tmp_path / "n" / "notes.md")
+
+    def test_short_readme_skips_ai(self, pm, le, monkeypatch):
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        pm.grant_permission("file.modify", scope="session")
+        agent = DocumentationAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="generate_readme", project_name="demo", description="A tool")
+        assert result.data["synthetic"] is True
+        assert result.data["content"] == "# demo\n\nA tool\n"
+
+        result = agent.run(
+            action="generate_report", title="Q3",
+            content="Revenue grew in every region while costs stayed flat.",
+        )
+        assert result.data["synthetic"] is False
+        assert result.data["content"].startswith("[AI unavailable]")
+
+    def test_update_doc_reads_bounded_prefix(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        pm.grant_permission("file.modify", scope="session")
+        doc = tmp_path / "big.md"
+        doc.write_text("x" * 50_000, encoding="utf-8")
+        agent = DocumentationAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="update_doc", file_path=str(doc), instruction="trim")
+        assert result.data["prompt_slice_len"] == 8000
+        assert "original" not in result.data
+
+        result = agent.run(
+            action="update_doc", file_path=str(doc), instruction="trim",
+            include_original=True,
+        )
+        assert len(result.data["original"]) == 50_000
+
+        doc.write_text("文" * 9000, encoding="utf-8")  # 3 bytes per character
+        result = agent.run(action="update_doc", file_path=str(doc), instruction="trim")
+        assert result.data["prompt_slice_len"] == 8000
+
+
+class TestCloudAgent:
+    def test_list_services_reloads_on_change(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pm.grant_permission("cloud.sync", scope="session")
+        pm.grant_permission("cloud.upload", scope="session")
+        pm.grant_permission("cloud.download", scope="session")
+        agent = CloudAgent(permission_manager=pm, learning_engine=le)
+        assert agent.run(action="list_services").data["services"] == []
+
+        (tmp_path / "config" / "cloud_services.json").write_text(
+            '{"services": [{"name": "drive", "sync_dir": "missing"}]}',
+            encoding="utf-8",
+        )
+        result = agent.run(action="sync_status")
+        assert result.data["services"][0]["status"] == "not_found"
+
+    def test_backup_files(self, pm, le, tmp_path):
+        for perm in ("cloud.sync", "cloud.upload", "cloud.download"):
+            pm.grant_permission(perm, scope="session")
+        src = tmp_path / "src"
+        (src / "nested").mkdir(parents=True)
+        (src / "a.txt").write_text("alpha", encoding="utf-8")
+        (src / "nested" / "b.bin").write_bytes(b"\x00" * 70_000)
+        os.utime(src / "nested", ns=(1_000_000, 1_000_000))
+        agent = CloudAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="backup_files", source_dir=str(src),
+                           backup_dir=str(tmp_path / "backups"))
+        assert result.status == "success"
+        backup = Path(result.data["backup"])
+        assert (backup / "a.txt").read_text(encoding="utf-8") == "alpha"
+        assert (backup / "nested" / "b.bin").read_bytes() == b"\x00" * 70_000
+        assert (backup / "nested").stat().st_mtime_ns == 1_000_000
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+    def test_backup_rejects_special_files(self, pm, le, tmp_path):
+        for perm in ("cloud.sync", "cloud.upload", "cloud.download"):
+            pm.grant_permission(perm, scope="session")
+        src = tmp_path / "src"
+        src.mkdir()
+        os.mkfifo(src / "pipe")
+        agent = CloudAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="backup_files", source_dir=str(src),
+                           backup_dir=str(tmp_path / "backups"))
+        assert result.status == "error"
+        assert "not a regular file" in result.message
+
+
+class TestCodeAgent:
+    def test_history_is_cached_and_flushed(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(code_agent, "_HISTORY_FLUSH_DELAY", 60)
+        for perm in ("system.execute", "file.modify", "file.read"):
+            pm.grant_permission(perm, scope="session")
+        agent = CodeAgent(permission_manager=pm, learning_engine=le)
+        assert agent.run(action="execute_code", code="print(1)").status == "success"
+        assert agent.run(action="execute_code", code="print(2)").status == "success"
+
+        ledger = tmp_path / "memory" / "code_agent_history.jsonl"
+        assert not ledger.exists()  # buffered until the group commit
+
+        result = agent.run(action="list_generated")
+        assert len(result.data["history"]) == 2
+        lines = ledger.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["execute_code"] * 2
+
+        result.data["history"].clear()  # callers get a copy
+        with ledger.open("a", encoding="utf-8") as fh:  # another process
+            fh.write(json.dumps({"action": "generate_code"}) + "\n")
+        history = agent.run(action="list_generated").data["history"]
+        assert [e["action"] for e in history] == ["execute_code"] * 2 + ["generate_code"]
+
+    def test_legacy_json_history_is_migrated(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "memory").mkdir()
+        legacy = tmp_path / "memory" / "code_agent_history.json"
+        legacy.write_text('[{"action": "generate_code"}]', encoding="utf-8")
+        (tmp_path / "memory" / "code_agent_history.jsonl").write_text(
+            '{"action": "modify_code"}\n{"action": "tor', encoding="utf-8",
+        )
+
+        history = CodeAgent().execute(action="list_generated").data["history"]
+        assert [e["action"] for e in history] == ["generate_code", "modify_code"]
+        assert not legacy.exists()
+
+    def test_safe_resolve_rejects_sibling_prefix(self, tmp_path, monkeypatch):
+        work = tmp_path / "work"
+        (tmp_path / "workshop").mkdir()
+        work.mkdir()
+        monkeypatch.chdir(work)
+        (work / "a.py").write_text("", encoding="utf-8")
+        resolved, st = code_agent._safe_resolve("a.py")
+        assert resolved == work.resolve() / "a.py"
+        assert st.st_size == 0
+        assert code_agent._safe_resolve("b.py") == (work.resolve() / "b.py", None)
+        with pytest.raises(ValueError):
+            code_agent._safe_resolve("../workshop/a.py")
+        with pytest.raises(ValueError):
+            code_agent._safe_resolve(str(tmp_path / "workshop" / "a.py"))
+
+    def test_safe_resolve_follows_symlinks_out_of_cwd(self, tmp_path, monkeypatch):
+        work = tmp_path / "work"
+        work.mkdir()
+        (work / "link.py").symlink_to(tmp_path / "outside.py")
+        (work / "linkdir").symlink_to(tmp_path)
+        monkeypatch.chdir(work)
+        for path in ("link.py", "linkdir/outside.py"):
+            with pytest.raises(ValueError):
+                code_agent._safe_resolve(path)
+
+    def test_safe_resolve_rechecks_replaced_directories(self, tmp_path, monkeypatch):
+        work = tmp_path / "work"
+        (work / "pkg").mkdir(parents=True)
+        monkeypatch.chdir(work)
+        assert code_agent._safe_resolve("pkg/mod.py")[0] == work.resolve() / "pkg" / "mod.py"
+        (work / "pkg").rmdir()
+        (work / "pkg").symlink_to(tmp_path)
+        with pytest.raises(ValueError):
+            code_agent._safe_resolve("pkg/mod.py")
+
+    def test_execute_output_is_bounded(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(code_agent, "_MAX_OUTPUT_BYTES", 1000)
+        for perm in ("system.execute", "file.modify", "file.read"):
+            pm.grant_permission(perm, scope="session")
+        agent = CodeAgent(permission_manager=pm, learning_engine=le)
+        result = agent.run(action="execute_code", code="print('x' * 100_000)")
+        assert result.status == "success"
+        assert result.data["stdout"] == "x" * 1000 + code_agent._OUTPUT_TRUNCATED
+        exact = agent.run(action="execute_code", code="print('y' * 999)")
+        assert exact.data["stdout"] == "y" * 999 + "\n"
+
+    def test_ai_responses_use_the_shared_cache(self, tmp_path, monkeypatch):
+        from assistant.ai import cache as ai_cache
+        from assistant.ai import client as ai_client
+        monkeypatch.setattr(ai_cache, "CACHE_DIR", tmp_path / "ai-cache")
+        monkeypatch.setattr(ai_cache, "_MEMORY", type(ai_cache._MEMORY)())
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        fake = MagicMock()
+        fake.chat.completions.create.return_value.choices[0].message.content = "EXPLAINED"
+        monkeypatch.setattr(ai_client, "get_client", lambda: fake)
+        monkeypatch.setattr(CodeAgent, "_ask_ai", None)
+        agent = CodeAgent()
+        assert agent._ask_ai_safe("explain me") == "EXPLAINED"
+        assert agent._ask_ai_safe("explain me") == "EXPLAINED"
+        fake.chat.completions.create.assert_called_once()
+        assert fake.chat.completions.create.call_args[1]["temperature"] == 0.7
+        monkeypatch.setattr(ai_cache, "ENABLED", False)  # --no-cache
+        agent._ask_ai_safe("explain me")
+        assert fake.chat.completions.create.call_count == 2
+
+    def test_modify_code_uses_supplied_source(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "mod.py").write_text("on disk", encoding="utf-8")
+        agent = CodeAgent()
+        monkeypatch.setattr(agent, "_ask_ai_safe", lambda prompt: prompt)
+        result = agent.execute(action="modify_code", file_path="mod.py",
+                               instruction="rename", code="in memory")
+        assert result.data["original"] == "in memory"
+        assert "on disk" not in result.data["modified"]
+
+    def test_oversized_file_is_rejected_before_reading(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(code_agent, "_MAX_REVIEW_BYTES", 10)
+        (tmp_path / "big.py").write_text("x = 1\n" * 10, encoding="utf-8")
+        agent = CodeAgent()
+        for action in ("review_code", "explain_code", "modify_code"):
+            result = agent.execute(action=action, file_path="big.py")
+            assert result.status == "error"
+            assert "exceeds 10 bytes" in result.message
+
+
+class TestCommunicationAgent:
+    def test_list_contacts_reloads_on_change(self, pm, le, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        agent = CommunicationAgent(permission_manager=pm, learning_engine=le)
+        assert agent.execute(action="list_contacts").data["contacts"] == []
+
+        (tmp_path / "config" / "contacts.json").write_text(
+            '{"contacts": [{"name": "Ada"}]}', encoding="utf-8",
+        )
+        contacts = agent.execute(action="list_contacts").data["contacts"]
+        assert contacts == [{"name": "Ada"}]
+        contacts.clear()
+        assert len(agent.execute(action="list_contacts").data["contacts"]) == 1
+
+
+class TestFocusAgent:
+    def test_single_documented_entry_point(self):
+        assert FocusAgent.run.__doc__
+        assert focus_agent.__all__ == ["FocusAgent"]
+
+    def test_run_saves_plan_and_log(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        saved = {}
+        monkeypatch.setattr(focus_agent.tasks, "get_next_task",
+                            lambda f: {"title": "Ship v2"})
+        monkeypatch.setattr(focus_agent, "analyze", lambda prompt: f"AI<{prompt}>")
+        monkeypatch.setattr(focus_agent.memory, "save_context",
+                            lambda key, value, meta: saved.update({key: value}),
+                            raising=False)
+
+        result = FocusAgent(prompt="Plan {title}").run()
+        assert result["status"] == "done"
+        assert result["analysis"] == "AI<Plan Ship v2>"
+        assert "Ship v2" in saved[result["memory_key"]]
+        log = Path(result["log_file"]).read_text(encoding="utf-8")
+        assert "**Task:** Ship v2" in log
+        report = saved[result["memory_key"]]
+        assert report.startswith("# FocusAgent Report")
+        assert log.endswith(report.split("\n\n", 1)[1])
+        assert log.count("AI<Plan Ship v2>") == 1
+        assert len(result["memory_key"].rsplit("_", 1)[1]) == 3  # milliseconds
+
+
+class TestAgentRegistry:
+    def test_registry_resolves_classes(self):
+        from assistant.agents import AGENT_REGISTRY
+
+        assert AGENT_REGISTRY["security"] is SecurityAgent
+        assert "cloud" in AGENT_REGISTRY
+        assert len(AGENT_REGISTRY) == 13
+        with pytest.raises(KeyError):
+            AGENT_REGISTRY["unknown"]
+
+    def test_package_attribute_access(self):
+        import assistant.agents as agents
+
+        assert agents.SystemAgent is SystemAgent
+        with pytest.raises(AttributeError):
+            agents.NotAnAgent
@@ -1,11 +1,26 @@
 """Tests for the Groq-powered AI client."""
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from assistant.ai.client import ask_ai, load_api_key
+from assistant.ai import cache
+from assistant.ai import client as ai_client
+from assistant.ai import ratelimit
+from assistant.ai.client import (
+    ask_ai, ask_ai_async, ask_ai_batch, ask_ai_many, ask_ai_stream, load_api_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "ai-cache")
+    monkeypatch.setattr(ai_client, "_CLIENTS", {})
+    cache.clear_memory()
+    yield
+    cache.clear_memory()
 
 
 class TestLoadApiKey:
@@ -19,6 +34,20 @@ class TestLoadApiKey:
             load_api_key()
 
 
+class TestGetClient:
+    def test_client_is_shared_per_key(self, monkeypatch):
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            MockGroq.side_effect = lambda api_key: MagicMock(api_key=api_key)
+            monkeypatch.setenv("GROQ_API_KEY", "k1")
+            first = ai_client.get_client()
+            assert ai_client.get_client() is first
+            monkeypatch.setenv("GROQ_API_KEY", "k2")
+            assert ai_client.get_client().api_key == "k2"
+            ai_client.close_clients()
+            first.close.assert_called_once()
+            assert ai_client._CLIENTS == {}
+
+
 class TestAskAi:
     def test_calls_groq_api(self, monkeypatch):
         monkeypatch.setenv("GROQ_API_KEY", "test-key")
@@ -66,6 +95,26 @@ class TestAskAi:
             call_kwargs = mock_client.chat.completions.create.call_args[1]
             assert call_kwargs["model"] == "mixtral-8x7b-32768"
 
+    def test_system_instructions(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+
+        mock_message = MagicMock()
+        mock_message.content = "response"
+        mock_choice = MagicMock()
+        mock_choice.message = mock_message
+        mock_response = MagicMock()
+        mock_response.choices = [mock_choice]
+
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            mock_client = MagicMock()
+            mock_client.chat.completions.create.return_value = mock_response
+            MockGroq.return_value = mock_client
+
+            ask_ai("code", system="Review this.")
+            messages = mock_client.chat.completions.create.call_args[1]["messages"]
+            assert messages[0]["content"].endswith("\n\nReview this.")
+            assert messages[1]["content"] == "code"
+
     def test_empty_response_raises(self, monkeypatch):
         monkeypatch.setenv("GROQ_API_KEY", "test-key")
 
@@ -97,3 +146,207 @@ class TestAskAi:
         monkeypatch.delenv("GROQ_API_KEY", raising=False)
         with pytest.raises(RuntimeError, match="GROQ_API_KEY"):
             ask_ai("test")
+
+
+class TestAskAiBatch:
+    def test_splits_reply_on_markers(self):
+        with patch("assistant.ai.client.ask_ai") as mock_ask:
+            mock_ask.return_value = "[1]\nfirst answer\n\n[2] second\nanswer"
+            assert ask_ai_batch(["a", "b"]) == ["first answer", "second\nanswer"]
+            mock_ask.assert_called_once()
+            assert "[1] a\n\n[2] b" in mock_ask.call_args[0][0]
+
+    def test_missing_answers_fall_back_to_single_calls(self):
+        with patch("assistant.ai.client.ask_ai") as mock_ask:
+            mock_ask.side_effect = ["[2] only two", "one alone"]
+            assert ask_ai_batch(["a", "b"]) == ["one alone", "only two"]
+            assert mock_ask.call_args[0][0] == "a"
+
+    def test_single_prompt_is_not_wrapped(self):
+        with patch("assistant.ai.client.ask_ai") as mock_ask:
+            mock_ask.return_value = "plain"
+            assert ask_ai_batch(["a"]) == ["plain"]
+            assert mock_ask.call_args[0][0] == "a"
+
+
+class TestAskAiStream:
+    @staticmethod
+    def _chunks(*pieces):
+        chunks = []
+        for piece in pieces:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = piece
+            chunks.append(chunk)
+        return chunks
+
+    def test_yields_pieces_then_caches_whole_reply(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            create = MockGroq.return_value.chat.completions.create
+            create.return_value = iter(self._chunks("Hel", None, "lo"))
+            assert list(ask_ai_stream("hi", temperature=0)) == ["Hel", "lo"]
+            assert create.call_args[1]["stream"] is True
+            assert list(ask_ai_stream("hi", temperature=0)) == ["Hello"]
+            assert ask_ai("hi", temperature=0) == "Hello"
+            create.assert_called_once()
+
+    def test_interrupted_stream_is_not_cached(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            create = MockGroq.return_value.chat.completions.create
+            create.return_value = iter(self._chunks("partial", "rest"))
+            stream = ask_ai_stream("hi", temperature=0)
+            assert next(stream) == "partial"
+            stream.close()
+            assert cache.get(cache.cache_key("llama3-70b-8192", "hi")) is None
+
+
+class TestAskAiMany:
+    def _mock_async_groq(self, MockAsyncGroq, reply):
+        in_flight = {"now": 0, "max": 0}
+
+        async def create(**kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = reply(kwargs["messages"][1]["content"])
+            return response
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_client.close = AsyncMock()
+        MockAsyncGroq.return_value = mock_client
+        return mock_client, in_flight
+
+    def test_runs_prompts_concurrently_in_order(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        with patch("assistant.ai.client.AsyncGroq") as MockAsyncGroq:
+            mock_client, in_flight = self._mock_async_groq(MockAsyncGroq, str.upper)
+            prompts = [f"p{i}" for i in range(6)]
+            assert ask_ai_many(prompts, concurrency=3) == [p.upper() for p in prompts]
+            assert in_flight["max"] == 3
+            MockAsyncGroq.assert_called_once_with(api_key="test-key")
+            mock_client.close.assert_awaited_once()
+
+    def test_cached_prompts_skip_the_api(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        cache.put(cache.cache_key("llama3-70b-8192", "known", None), "from cache")
+        with patch("assistant.ai.client.AsyncGroq") as MockAsyncGroq:
+            mock_client, _ = self._mock_async_groq(MockAsyncGroq, str.upper)
+            assert ask_ai_many(["known", "new"], temperature=0) == ["from cache", "NEW"]
+            assert mock_client.chat.completions.create.await_count == 1
+            assert asyncio.run(ask_ai_async("new", temperature=0)) == "NEW"  # now cached
+            assert mock_client.chat.completions.create.await_count == 1
+
+
+class TestResponseCache:
+    def _mock_groq(self, MockGroq, text):
+        mock_message = MagicMock()
+        mock_message.content = text
+        mock_choice = MagicMock()
+        mock_choice.message = mock_message
+        mock_response = MagicMock()
+        mock_response.choices = [mock_choice]
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_response
+        MockGroq.return_value = mock_client
+        return mock_client
+
+    def test_repeated_prompt_hits_cache(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            mock_client = self._mock_groq(MockGroq, "cached")
+            assert ask_ai("same", temperature=0) == "cached"
+            cache.clear_memory()  # force the disk tier
+            assert ask_ai("same", temperature=0) == "cached"
+            mock_client.chat.completions.create.assert_called_once()
+
+            assert ask_ai("same", temperature=0, cache=False) == "cached"
+            assert mock_client.chat.completions.create.call_count == 2
+
+    def test_sampled_requests_are_not_cached_by_default(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            mock_client = self._mock_groq(MockGroq, "sample")
+            ask_ai("same")
+            ask_ai("same")
+            assert mock_client.chat.completions.create.call_count == 2
+            ask_ai("same", temperature=0.5, cache=True)
+            ask_ai("same", temperature=0.5, cache=True)
+            ask_ai("same", temperature=0.9, cache=True)
+            assert mock_client.chat.completions.create.call_count == 4
+        assert cache.cache_key("m", "p", temperature=0.5) != cache.cache_key("m", "p")
+
+    def test_put_prunes_expired_files(self, monkeypatch):
+        monkeypatch.setattr(cache, "_LAST_PRUNE", None)
+        cache.put(cache.cache_key("m", "old"), "r")
+        old = cache._path(cache.cache_key("m", "old"))
+        os.utime(old, (0, 0))
+        cache.put(cache.cache_key("m", "new"), "s")  # within PRUNE_INTERVAL: no sweep
+        assert old.exists()
+        monkeypatch.setattr(cache, "_LAST_PRUNE", None)  # a new process...
+        cache.put(cache.cache_key("m", "newer"), "t")
+        assert old.exists()  # ...sees the recent stamp and skips the sweep
+        monkeypatch.setattr(cache, "_LAST_PRUNE", None)
+        os.utime(cache.CACHE_DIR / ".last-prune", (0, 0))
+        cache.put(cache.cache_key("m", "newest"), "u")
+        assert not old.exists()
+        assert cache._path(cache.cache_key("m", "new")).exists()
+
+    def test_expired_and_evicted_entries_miss(self):
+        key = cache.cache_key("m", "p")
+        cache.put(key, "r")
+        cache.clear_memory()
+        assert cache.get(key, ttl=-1) is None
+        assert cache.get(key) == "r"
+        cache.evict("p", model="m")
+        assert cache.get(key) is None
+
+    def test_attachment_changes_key(self):
+        assert cache.cache_key("m", "p", attachment=b"a") != cache.cache_key("m", "p", attachment=b"b")
+        assert cache.cache_key("m", "p") != cache.cache_key("m", "p", attachment=b"")
+
+    def test_disabled_cache_neither_reads_nor_writes(self, monkeypatch):
+        key = cache.cache_key("m", "p")
+        cache.put(key, "r")
+        monkeypatch.setattr(cache, "ENABLED", False)
+        assert cache.get(key) is None
+        cache.put(cache.cache_key("m", "q"), "s")
+        monkeypatch.setattr(cache, "ENABLED", True)
+        assert cache.get(cache.cache_key("m", "q")) is None
+
+
+class TestRateLimit:
+    def test_bucket_spreads_requests_at_the_configured_rate(self):
+        now = [0.0]
+        bucket = ratelimit.TokenBucket(rpm=60, tpm=600, clock=lambda: now[0])
+        assert [bucket.reserve(0) for _ in range(60)] == [0.0] * 60
+        assert bucket.reserve(0) == pytest.approx(1.0)
+        now[0] = 10.0
+        assert bucket.reserve(590) == 0.0
+        assert bucket.reserve(100) == pytest.approx(9.0)  # 90 tokens short at 10/s
+
+    def test_unconfigured_limits_do_not_throttle(self, monkeypatch):
+        monkeypatch.delenv("SIGNALTRUST_RPM", raising=False)
+        monkeypatch.delenv("SIGNALTRUST_TPM", raising=False)
+        assert ratelimit.get_limiter() is None
+        monkeypatch.setenv("SIGNALTRUST_RPM", "fast")
+        with pytest.raises(RuntimeError, match="SIGNALTRUST_RPM"):
+            ratelimit.get_limiter()
+
+    def test_ask_ai_waits_for_the_limiter(self, monkeypatch):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+        monkeypatch.setenv("SIGNALTRUST_RPM", "30")
+        monkeypatch.setattr(ratelimit, "_BUCKETS", {})
+        waits = []
+        monkeypatch.setattr(ratelimit.time, "sleep", waits.append)
+        with patch("assistant.ai.client.Groq") as MockGroq:
+            TestResponseCache()._mock_groq(MockGroq, "ok")
+            for i in range(31):
+                assert ask_ai(f"prompt {i}", temperature=0) == "ok"
+            ask_ai("prompt 0", temperature=0)  # cached: no reservation
+        assert len(waits) == 1 and waits[0] == pytest.approx(2.0, abs=0.1)
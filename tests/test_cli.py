@@ -0,0 +1,68 @@
+"""Tests for the OmniJARVIS command-line interface."""
+
+import argparse
+import json
+import sys
+
+from assistant.cli import _COMMANDS, _build_parser, _sniff_subcommand, main
+
+
+class TestParser:
+    def test_sniff_subcommand(self):
+        assert _sniff_subcommand(["--json", "tasks", "list"]) == "tasks"
+        assert _sniff_subcommand(["--help"]) is None
+        assert _sniff_subcommand(["bogus"]) is None
+
+    def test_parser_is_cached(self):
+        assert _build_parser("tasks") is _build_parser("tasks")
+        assert _build_parser("tasks") is not _build_parser(None)
+
+    def test_main_reuses_parser_across_calls(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "plans").mkdir()
+        (tmp_path / "plans" / "todo.md").write_text(
+            "- [x] done\n- [ ] next one\n", encoding="utf-8"
+        )
+        assert main(["--json", "tasks", "next", "--file", "todo.md"]) == 0
+        assert main(["--json", "tasks", "list", "--file", "todo.md"]) == 0
+        out = capsys.readouterr().out
+        first, second = out.split("\n}\n", 1)
+        assert json.loads(first + "}")["title"] == "next one"
+        assert len(json.loads(second)) == 2
+
+    def test_version_fast_path(self, capsys):
+        from assistant import __version__
+
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out.strip() == f"omnijarvis {__version__}"
+
+    def test_every_command_has_a_handler(self):
+        parser = _build_parser(None)
+        modules = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        commands = set()
+        for module, sub in modules.choices.items():
+            nested = [a for a in sub._actions if isinstance(a, argparse._SubParsersAction)]
+            names = nested[0].choices if nested else [None]
+            commands.update((module, name) for name in names)
+        assert commands == set(_COMMANDS)
+
+    def test_scripts_generate_dispatch(self, capsys):
+        assert main(["scripts", "generate", "--type", "git", "--description", "commit"]) == 0
+        assert capsys.readouterr().out.strip()
+
+    def test_permissions_commands_skip_the_orchestrator(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delitem(sys.modules, "assistant.orchestrator", raising=False)
+        assert main(["--json", "permissions", "list"]) == 0
+        assert json.loads(capsys.readouterr().out) == []
+        assert "assistant.orchestrator" not in sys.modules
+
+    def test_ai_ask_prints_streamed_answer(self, monkeypatch, capsys):
+        from assistant.ai import cache as ai_cache
+        from assistant.ai import client as ai_client
+
+        monkeypatch.setattr(ai_client, "ask_ai_stream", lambda prompt: iter(["4", "2"]))
+        monkeypatch.setattr(ai_cache, "ENABLED", True)
+        assert main(["ai", "--no-cache", "ask", "6 * 7?"]) == 0
+        assert capsys.readouterr().out == "42\n"
+        assert ai_cache.ENABLED is False
@@ -0,0 +1,50 @@
+"""Tests for the cached JSON state-file helpers."""
+
+import json
+import os
+
+import pytest
+
+from assistant.core import json_files
+from assistant.core.json_files import load_list, save_list
+
+
+class TestJsonFiles:
+    def test_missing_file_is_created_empty(self, tmp_path):
+        path = tmp_path / "cfg" / "devices.json"
+        assert load_list(path, "devices") == []
+        assert json.loads(path.read_text(encoding="utf-8")) == {"devices": []}
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        path = tmp_path / "alerts.json"
+        save_list(path, "alerts", [{"id": 1}])
+        calls = []
+        monkeypatch.setattr(json_files, "loads", lambda data: calls.append(data))
+        assert load_list(path, "alerts") == [{"id": 1}]
+        assert calls == []
+
+    def test_external_change_is_picked_up(self, tmp_path):
+        path = tmp_path / "alerts.json"
+        save_list(path, "alerts", [])
+        path.write_text('{"alerts": [{"id": 2}, {"id": 3}]}', encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert [a["id"] for a in load_list(path, "alerts")] == [2, 3]
+
+    def test_returned_list_is_a_copy(self, tmp_path):
+        path = tmp_path / "routines.json"
+        load_list(path, "routines").append({"name": "x"})
+        assert load_list(path, "routines") == []
+
+    def test_save_replaces_file_atomically(self, tmp_path, monkeypatch):
+        path = tmp_path / "devices.json"
+        save_list(path, "devices", [{"name": "a"}])
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(json_files.os, "replace", fail)
+        with pytest.raises(OSError):
+            save_list(path, "devices", [])
+        assert json.loads(path.read_text(encoding="utf-8")) == {"devices": [{"name": "a"}]}
+        assert [p.name for p in tmp_path.iterdir()] == ["devices.json"]
@@ -83,3 +83,17 @@ class TestLearningEngine:
         e2 = LearningEngine(profile_path=pf, history_path=hf)
         assert e2.get_preference("lang") == "fr"
         assert len(e2.get_interaction_history()) == 1
+
+    def test_history_is_append_only_jsonl(self, tmp_path):
+        hf = tmp_path / "history.jsonl"
+        legacy = tmp_path / "history.json"
+        legacy.write_text(json.dumps({"interactions": [
+            {"query": "old", "response_summary": "r", "agent_used": "system"},
+        ]}), encoding="utf-8")
+
+        engine = LearningEngine(profile_path=tmp_path / "profile.json", history_path=hf)
+        assert not legacy.exists()
+        engine.record_interaction("new", "r", "code")
+        lines = hf.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["query"] for line in lines] == ["old", "new"]
+        assert len(LearningEngine(history_path=hf).get_interaction_history()) == 2
@@ -1,7 +1,10 @@
 """Tests for the OmniJARVIS core memory store."""
 
+import random
+
 import pytest
 
+from assistant.core.memory_index import MemoryIndex
 from assistant.core.memory_store import MemoryStore
 
 
@@ -43,6 +46,38 @@ class TestMemoryStore:
         results = store.search("deploy")
         assert len(results) == 1
 
+    def test_search_matches_substrings_and_tracks_changes(self, store):
+        first = store.add_entry({"content": "Deploy on Friday"}, tags=["ops"])
+        assert store.search("frid") == [first]
+        assert store.search("on fri") == [first]
+        assert store.search("friday deploy") == []
+        assert len(store.search("")) == 1
+
+        second = store.add_entry({"content": "Friday retro"})
+        assert store.search("FRIDAY") == [first, second]
+        assert store.delete_entry(first["id"])
+        assert store.search("friday") == [second]
+        assert store.search("ops") == []
+
+    def test_index_matches_linear_scan_without_walking_vocabulary(self):
+        rng = random.Random(7)
+        words = ["deploy", "friday", "retro", "ops", "fry", "a", "daily", "ep"]
+        texts = [" ".join(rng.choices(words, k=rng.randint(1, 4))) for _ in range(60)]
+        index = MemoryIndex()
+        keys = [index.add(text, i) for i, text in enumerate(texts)]
+        for key in keys[::3]:
+            index.remove(key)
+        live = [i for i in range(len(texts)) if i % 3]
+
+        class NoScan(dict):
+            def items(self):
+                raise AssertionError("vocabulary scanned")
+
+        index._postings = NoScan(index._postings)
+        for query in ("fri", "i", "ep", "eploy", "y o", "daily r", "xyz", "RETRO", "!"):
+            expected = [i for i in live if query.lower() in texts[i].lower()]
+            assert index.search(query) == expected, query
+
     def test_get_entry(self, store):
         entry = store.add_entry({"content": "findme"})
         found = store.get_entry(entry["id"])
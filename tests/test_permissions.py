@@ -83,6 +83,14 @@ class TestPermissionManager:
         assert "granted" in decisions
         assert "revoked" in decisions
 
+    def test_epoch_changes_on_grant_and_revoke(self, pm):
+        start = pm.epoch
+        pm.grant_permission("file.read", scope="session")
+        granted = pm.epoch
+        assert granted > start
+        pm.revoke_permission("file.read")
+        assert pm.epoch > granted
+
 
 class TestPermissionRequest:
     def test_to_dict(self):
@@ -0,0 +1,37 @@
+"""Tests for the OmniJARVIS JSON serialisation helpers."""
+
+import json
+
+import pytest
+
+from assistant.core import serialization
+from assistant.core.serialization import JSONDecodeError, dumps, dumps_bytes, loads
+
+
+class TestSerialization:
+    def test_roundtrip(self):
+        obj = {"name": "déploiement", "items": [1, 2.5, None, True]}
+        assert loads(dumps(obj)) == obj
+
+    def test_indent_matches_stdlib(self):
+        obj = {"a": [1, 2], "b": {"c": "é"}}
+        assert dumps(obj, indent=True) == json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def test_loads_accepts_bytes(self):
+        assert loads(dumps_bytes({"k": "v"})) == {"k": "v"}
+
+    def test_trailing_newline(self):
+        assert dumps_bytes([1], newline=True) == b"[1]\n"
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with pytest.raises(JSONDecodeError):
+            loads(b"{not json")
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        obj = {"a": "é", 1: "int key"}
+        assert loads(dumps_bytes(obj)) == {"a": "é", "1": "int key"}
+        assert dumps_bytes([1], newline=True) == b"[1]\n"
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        with pytest.raises(JSONDecodeError):
+            loads("[")